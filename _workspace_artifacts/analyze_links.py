@@ -1,56 +1,51 @@
 #!/usr/bin/env python3
-import re
+import sys
 from pathlib import Path
 from collections import defaultdict
 
-# Scan all markdown files for broken links
-broken_links = defaultdict(list)
-link_pattern = r'\[([^\]]+)\]\(([^)]+)\)'
+# Share the validator's link resolver (repository root copy)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from eatgf_dynamic_validator import LinkIndex
 
-for md_file in Path('.').rglob('*.md'):
-    if 'node_modules' in str(md_file) or '.git' in str(md_file):
+# Index the tree once: every file plus the heading anchors of every markdown file
+index = LinkIndex.build('.')
+documents = {}
+for rel_path in sorted(index.files):
+    if not rel_path.endswith('.md'):
         continue
-
     try:
-        content = md_file.read_text()
-        for match in re.finditer(link_pattern, content):
-            link_text = match.group(1)
-            link_path = match.group(2)
-
-            # Skip external URLs and anchors
-            if link_path.startswith(('http://', 'https://', '#', 'mailto:')):
-                continue
-
-            # Remove fragment
-            link_clean = link_path.split('#')[0]
-            if not link_clean:
-                continue
-
-            # Convert relative path to absolute
-            if link_clean.startswith('../'):
-                target = (md_file.parent / link_clean).resolve()
-            elif link_clean.startswith('/'):
-                target = Path(link_clean)
-            else:
-                target = (md_file.parent / link_clean).resolve()
+        content = (index.root / rel_path).read_text(encoding='utf-8')
+    except Exception:
+        continue
+    documents[rel_path] = content
+    index.add_document(index.root / rel_path, content)
 
-            # Check if target exists
-            if not target.exists():
-                broken_links[str(md_file)].append({
-                    'text': link_text,
-                    'path': link_path,
-                    'target': str(target)
-                })
-    except Exception as e:
-        pass
+# Scan all markdown files for broken links and anchors
+broken_links = defaultdict(list)
+broken_anchors = 0
+
+for rel_path, content in documents.items():
+    for _, link_text, link_path in LinkIndex.iter_links(content):
+        outcome, target = index.resolve(index.root / rel_path, link_path)
+        if outcome in (LinkIndex.OK, LinkIndex.EXTERNAL):
+            continue
+        if outcome == LinkIndex.MISSING_ANCHOR:
+            broken_anchors += 1
+        broken_links[rel_path].append({
+            'text': link_text,
+            'path': link_path,
+            'target': target,
+            'reason': outcome
+        })
 
 # Print summary
 total = sum(len(v) for v in broken_links.values())
 print(f"Total broken links found: {total}")
+print(f"  Missing files: {total - broken_anchors}")
+print(f"  Missing anchors: {broken_anchors}")
 print(f"Files with broken links: {len(broken_links)}\n")
 
 # Print first examples
-count = 0
 for file, links in sorted(broken_links.items())[:15]:
     print(f"{file}:")
     for link in links[:2]:
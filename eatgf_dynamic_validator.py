@@ -87,8 +87,18 @@ This validator checks EATGF documents based on the following criteria:
 import os
 import re
 import json
+import hashlib
+import inspect
+import posixpath
+import subprocess
+import time
+from abc import ABC, abstractmethod
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import defaultdict, deque
+from urllib.parse import unquote
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Callable, Dict, Hashable, List, Optional, Tuple
 from dataclasses import dataclass, asdict
 from datetime import datetime
 
@@ -104,6 +114,921 @@ class ValidationIssue:
     recommendation: str
 
 
+@dataclass
+class DuplicateCluster:
+    """A group of texts whose estimated similarity meets the index threshold."""
+    members: List[Hashable]
+    similarity: float  # Lowest pairwise similarity linking the cluster
+
+
+class NearDuplicateIndex:
+    """MinHash/LSH index for near-duplicate detection over text fragments.
+
+    Each text is reduced to word shingles and sketched with one-permutation
+    MinHash (a single hash per shingle, densified by rotation), so sketching
+    is linear in text length. Signatures are split into LSH bands and only
+    texts sharing a band bucket are compared, keeping clustering sub-quadratic
+    in the number of indexed texts.
+    """
+
+    _HASH_SPACE = 1 << 64
+
+    def __init__(self, num_perm: int = 128, bands: int = 32,
+                 shingle_size: int = 5, threshold: float = 0.8):
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+        self.threshold = threshold
+        self.keys: List[Hashable] = []
+        self.signatures: List[Tuple[int, ...]] = []
+        self._buckets: Dict[Tuple, List[int]] = defaultdict(list)
+
+    def _shingles(self, text: str) -> set:
+        words = re.findall(r'\w+', text.lower())
+        if len(words) <= self.shingle_size:
+            return {' '.join(words)} if words else set()
+        k = self.shingle_size
+        return {' '.join(words[i:i + k]) for i in range(len(words) - k + 1)}
+
+    def signature(self, text: str) -> Optional[Tuple[int, ...]]:
+        """Return the MinHash signature of text, or None if it has no words."""
+        shingles = self._shingles(text)
+        if not shingles:
+            return None
+        k = self.num_perm
+        bins: List[Optional[int]] = [None] * k
+        for shingle in shingles:
+            h = int.from_bytes(hashlib.blake2b(shingle.encode('utf-8'), digest_size=8).digest(), 'big')
+            b, value = h % k, h // k
+            if bins[b] is None or value < bins[b]:
+                bins[b] = value
+        # Rotation densification: empty bins borrow from the next filled bin,
+        # offset by distance so borrowed values never collide with native ones.
+        filled = [i for i, v in enumerate(bins) if v is not None]
+        if len(filled) < k:
+            dense = list(bins)
+            nxt = filled[0] + k
+            for i in range(k - 1, -1, -1):
+                if bins[i] is not None:
+                    nxt = i
+                else:
+                    dense[i] = bins[nxt % k] + (nxt - i) * self._HASH_SPACE
+            bins = dense
+        return tuple(bins)
+
+    def add(self, key: Hashable, text: str) -> bool:
+        """Index text under key. Returns False if the text has nothing to sketch."""
+        sig = self.signature(text)
+        if sig is None:
+            return False
+        self.add_signature(key, sig)
+        return True
+
+    def add_signature(self, key: Hashable, sig: Tuple[int, ...]) -> None:
+        """Index a signature computed earlier with signature()."""
+        idx = len(self.keys)
+        self.keys.append(key)
+        self.signatures.append(sig)
+        for band in range(self.bands):
+            start = band * self.rows
+            self._buckets[(band, tuple(sig[start:start + self.rows]))].append(idx)
+
+    def similarity(self, a: int, b: int) -> float:
+        """Estimated Jaccard similarity between two indexed entries."""
+        sa, sb = self.signatures[a], self.signatures[b]
+        return sum(1 for x, y in zip(sa, sb) if x == y) / self.num_perm
+
+    def clusters(self) -> List[DuplicateCluster]:
+        """Group indexed texts into near-duplicate clusters, in insertion order."""
+        parent = list(range(len(self.keys)))
+        linked = {}
+
+        def find(i):
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        checked = set()
+        for members in self._buckets.values():
+            for pos, a in enumerate(members):
+                for b in members[pos + 1:]:
+                    if (a, b) in checked:
+                        continue
+                    checked.add((a, b))
+                    score = self.similarity(a, b)
+                    if score < self.threshold:
+                        continue
+                    ra, rb = find(a), find(b)
+                    if ra == rb:
+                        continue
+                    root = min(ra, rb)
+                    lowest = min(score, linked.get(ra, 1.0), linked.get(rb, 1.0))
+                    parent[max(ra, rb)] = root
+                    linked[root] = lowest
+
+        groups: Dict[int, List[int]] = defaultdict(list)
+        for i in range(len(self.keys)):
+            groups[find(i)].append(i)
+        return [
+            DuplicateCluster(members=[self.keys[i] for i in idxs], similarity=round(linked[root], 2))
+            for root, idxs in sorted(groups.items())
+            if len(idxs) > 1
+        ]
+
+
+@dataclass
+class Heading:
+    """A markdown heading and the extent of the section it opens."""
+    level: int
+    text: str
+    key: str  # Normalized lowercase heading used for lookups
+    anchor: str  # GitHub-style anchor, with duplicate suffix
+    line: int
+    start: int  # Offset of the heading line
+    body_start: int  # Offset just past the heading line
+    end: int  # Offset of the next heading at the same or a higher level
+    parent: Optional[int] = None  # Index of the enclosing heading
+
+
+class MarkdownOutline:
+    """Heading/section tree of a markdown document, parsed in one pass.
+
+    Headings inside fenced code blocks are ignored. Sections are looked up
+    by normalized heading key, so callers can find "Problem Statement" or
+    "2. Control Mapping (ISO 27001)" without scanning the document text.
+    """
+
+    # Closing hashes and trailing whitespace are stripped from the text
+    # afterwards; a lazy '(.*?)\s*#*\s*$' backtracks quadratically on long lines.
+    _HEADING = re.compile(r'^(#{1,6})\s+(.*)$')
+    _HTML_ANCHOR = re.compile(r'<a\s+(?:[^>]*?\s)?(?:name|id)=["\']([^"\']+)["\']', re.IGNORECASE)
+    _HTML_TAG = re.compile(r'<a\s', re.IGNORECASE)
+
+    def __init__(self, text: str):
+        self.headings: List[Heading] = []
+        self.sections: Dict[str, int] = {}  # key -> index of first heading with that key
+        self.anchors: set = self._html_anchors(text) if '<a' in text else set()
+
+        slug_counts: Dict[str, int] = {}
+        open_headings: List[int] = []
+        in_fence = False
+        offset = 0
+        for line_num, line in enumerate(text.split('\n'), 1):
+            line_start, offset = offset, offset + len(line) + 1
+            stripped = line.lstrip()
+            if stripped.startswith('```') or stripped.startswith('~~~'):
+                in_fence = not in_fence
+                continue
+            if in_fence or not line.startswith('#'):
+                continue
+            match = self._HEADING.match(line)
+            if not match:
+                continue
+            level = len(match.group(1))
+            title = match.group(2).rstrip().rstrip('#').rstrip()
+            while open_headings and self.headings[open_headings[-1]].level >= level:
+                self.headings[open_headings.pop()].end = line_start
+            slug = self.slugify(title)
+            count = slug_counts.get(slug, 0)
+            slug_counts[slug] = count + 1
+            heading = Heading(
+                level=level,
+                text=title,
+                key=self.normalize(title),
+                anchor=slug if count == 0 else f"{slug}-{count}",
+                line=line_num,
+                start=line_start,
+                body_start=min(offset, len(text)),
+                end=len(text),
+                parent=open_headings[-1] if open_headings else None,
+            )
+            index = len(self.headings)
+            self.headings.append(heading)
+            open_headings.append(index)
+            self.anchors.add(heading.anchor)
+            for key in self._lookup_keys(heading.key):
+                self.sections.setdefault(key, index)
+
+    @classmethod
+    def _html_anchors(cls, text: str) -> set:
+        """Same result as _HTML_ANCHOR.findall(), in linear time.
+
+        A failed match at a tag start has tried every attribute up to the
+        next '>', which covers every later tag start before that '>' too,
+        so the scan resumes after it instead of retrying each one.
+        """
+        anchors = set()
+        pos = 0
+        while True:
+            tag = cls._HTML_TAG.search(text, pos)
+            if tag is None:
+                return anchors
+            match = cls._HTML_ANCHOR.match(text, tag.start())
+            if match:
+                anchors.add(match.group(1))
+                pos = match.end()
+                continue
+            close = text.find('>', tag.start())
+            if close < 0:
+                return anchors
+            pos = close + 1
+
+    @staticmethod
+    def slugify(heading: str) -> str:
+        """GitHub-style anchor slug for a heading."""
+        text = re.sub(r'\[([^\]]*)\]\([^)]*\)', r'\1', heading)  # Keep link text only
+        text = re.sub(r'[^\w\- ]', '', text.strip().lower())
+        return text.replace(' ', '-')
+
+    @staticmethod
+    def normalize(heading: str) -> str:
+        """Lowercase heading text without emphasis, numbering or trailing colon."""
+        text = re.sub(r'\[([^\]]*)\]\([^)]*\)', r'\1', heading)
+        text = re.sub(r'[*_`]', '', text).strip().lower()
+        text = re.sub(r'^(?:\d+(?:\.\d+)*|[a-z])[.)]\s+', '', text)
+        return ' '.join(text.split()).rstrip(':')
+
+    @staticmethod
+    def _lookup_keys(key: str):
+        """The full key plus its title part before a qualifier like "(...)" or ":"."""
+        yield key
+        for sep in (' (', ':', ' - ', ' – '):
+            if sep in key:
+                yield key.split(sep, 1)[0].strip()
+
+    def section(self, title: str, level: Optional[int] = None) -> Optional[Heading]:
+        """First heading matching title (and level, if given)."""
+        index = self.sections.get(self.normalize(title))
+        if index is None:
+            return None
+        heading = self.headings[index]
+        if level is not None and heading.level != level:
+            key = heading.key
+            return next((h for h in self.headings if h.key == key and h.level == level), None)
+        return heading
+
+    def has_section(self, title: str) -> bool:
+        return self.normalize(title) in self.sections
+
+
+class LinkIndex:
+    """In-memory index of files and heading anchors for link resolution.
+
+    The file tree is walked once; heading anchors are registered from
+    document text as it is scanned. Links are then resolved against the
+    index without touching the filesystem: relative targets against the
+    linking file's directory, absolute targets against the root, and
+    ``#fragment`` targets against the anchors of the target document.
+    """
+
+    LINK_PATTERN = re.compile(r'\[([^\]]*)\]\(([^)]+)\)')
+    SKIP_DIRS = {'.git', 'node_modules'}
+
+    # Resolution outcomes
+    OK = 'ok'
+    EXTERNAL = 'external'
+    MISSING_FILE = 'missing_file'
+    MISSING_ANCHOR = 'missing_anchor'
+
+    _SCHEME = re.compile(r'^(?:[a-zA-Z][a-zA-Z0-9+.-]*:|//)')
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        self.files: set = set()
+        self.dirs: set = {'.'}
+        self.anchors: Dict[str, set] = {}
+
+    @classmethod
+    def build(cls, root) -> 'LinkIndex':
+        """Walk the tree under root once and index every file and directory."""
+        index = cls(root)
+        for dirpath, dirnames, filenames in os.walk(index.root):
+            dirnames[:] = [d for d in dirnames if d not in cls.SKIP_DIRS]
+            rel_dir = Path(dirpath).relative_to(index.root).as_posix()
+            for d in dirnames:
+                index.dirs.add(posixpath.normpath(posixpath.join(rel_dir, d)))
+            for f in filenames:
+                index.files.add(posixpath.normpath(posixpath.join(rel_dir, f)))
+        return index
+
+    def relative(self, path) -> str:
+        """Return path relative to the index root in posix form."""
+        return Path(os.path.relpath(path, self.root)).as_posix()
+
+    def add_document(self, path, content: str) -> None:
+        """Register the heading anchors of a scanned document."""
+        self.anchors[self.relative(path)] = MarkdownOutline(content).anchors
+
+    @classmethod
+    def iter_links(cls, content: str):
+        """Yield (line_number, link_text, target) for each inline markdown link."""
+        for line_num, line in enumerate(content.split('\n'), 1):
+            if '](' not in line:
+                continue
+            for match in cls._iter_link_matches(line):
+                yield line_num, match.group(1), match.group(2)
+
+    @classmethod
+    def _iter_link_matches(cls, line: str):
+        """Same matches as LINK_PATTERN.finditer(line), in linear time.
+
+        Whether a match starts at a '[' depends only on the first ']' after
+        it, so a failure there rules out every '[' before that ']' as well.
+        """
+        last_paren = line.rfind(')')
+        pos = 0
+        while True:
+            start = line.find('[', pos)
+            if start < 0:
+                return
+            close = line.find(']', start)
+            if close < 0 or last_paren < close + 3:  # No room left for "](target)"
+                return
+            match = cls.LINK_PATTERN.match(line, start)
+            if match:
+                yield match
+                pos = match.end()
+            else:
+                pos = close + 1
+
+    def resolve(self, source_path, target: str) -> Tuple[str, str]:
+        """Resolve a link target found in source_path.
+
+        Returns (outcome, resolved) where resolved is the root-relative path
+        (with ``#fragment`` when present) or the raw target for external links.
+        """
+        target = target.strip()
+        if target.startswith('<') and '>' in target:
+            target = target[1:target.index('>')]
+        else:
+            target = target.split()[0] if target else target
+        if not target or self._SCHEME.match(target):
+            return self.EXTERNAL, target
+
+        path, _, fragment = target.partition('#')
+        source = self.relative(source_path)
+        path = unquote(path)
+        if not path:
+            resolved = source
+        elif path.startswith('/'):
+            resolved = posixpath.normpath(path.lstrip('/'))
+        else:
+            resolved = posixpath.normpath(posixpath.join(posixpath.dirname(source), path))
+        display = f"{resolved}#{fragment}" if fragment else resolved
+
+        if resolved.startswith('..') or (resolved not in self.files and resolved not in self.dirs):
+            return self.MISSING_FILE, display
+        if fragment:
+            anchors = self.anchors.get(resolved)
+            # Anchors are only known for scanned documents; others can't be checked
+            if anchors is not None and unquote(fragment).lower() not in anchors:
+                return self.MISSING_ANCHOR, display
+        return self.OK, display
+
+
+TERM_TOKEN = re.compile(r'\w+(?:[.\-/]\w+)*')
+TERM_WORD = re.compile(r'\w+')
+
+
+def query_terms(query: str) -> List[Tuple[str, int]]:
+    """(term, width in words) for each token of a term query, lowercased.
+
+    Tokens are words, or words joined by '.', '-' or '/' (so ``A.8.28``,
+    ``EATGF-GOV-POL-01`` and ``Go/No-Go`` are single terms).
+    """
+    return [(m.group().lower(), len(TERM_WORD.findall(m.group()))) for m in TERM_TOKEN.finditer(query)]
+
+
+def phrase_positions(terms: List[Tuple[str, int]], positions: Callable[[str], List[int]]) -> List[int]:
+    """Word positions where the terms occur consecutively (the first term's positions, filtered)."""
+    if not terms:
+        return []
+    starts = positions(terms[0][0])
+    offset = terms[0][1]
+    for term, width in terms[1:]:
+        if not starts:
+            break
+        following = set(positions(term))
+        starts = [p for p in starts if p + offset in following]
+        offset += width
+    return starts
+
+
+class DocumentTerms:
+    """Inverted index of one document: term -> word positions.
+
+    Every word is indexed, and so is every compound token (words joined by
+    '.', '-' or '/') at the position of its first word. Terms are
+    lowercased; word_lines maps a word position to its 1-based line.
+    """
+
+    def __init__(self, text: str):
+        postings: Dict[str, array] = {}
+        word_lines = array('I')
+        for line_num, line in enumerate(text.split('\n'), 1):
+            for token in TERM_TOKEN.finditer(line):
+                words = TERM_WORD.findall(token.group())
+                pos = len(word_lines)
+                if len(words) > 1:
+                    postings.setdefault(token.group().lower(), array('I')).append(pos)
+                for i, word in enumerate(words):
+                    postings.setdefault(word.lower(), array('I')).append(pos + i)
+                word_lines.extend([line_num] * len(words))
+        self.postings = postings
+        self.word_lines = word_lines
+        self._sorted_terms: Optional[List[str]] = None
+
+    def positions(self, term: str) -> List[int]:
+        return list(self.postings.get(term, ()))
+
+    def find(self, query: str) -> List[int]:
+        """Word positions where the query term or phrase starts."""
+        return phrase_positions(query_terms(query), self.positions)
+
+    def count(self, query: str) -> int:
+        return len(self.find(query))
+
+    def lines(self, query: str) -> List[int]:
+        return sorted({self.word_lines[p] for p in self.find(query)})
+
+    def has_prefix(self, prefix: str) -> bool:
+        """Whether any term starts with prefix (lowercased)."""
+        if self._sorted_terms is None:
+            self._sorted_terms = sorted(self.postings)
+        prefix = prefix.lower()
+        i = bisect_left(self._sorted_terms, prefix)
+        return i < len(self._sorted_terms) and self._sorted_terms[i].startswith(prefix)
+
+    def with_prefix(self, prefix: str) -> List[str]:
+        """Terms starting with prefix (lowercased), in sorted order."""
+        if self._sorted_terms is None:
+            self._sorted_terms = sorted(self.postings)
+        prefix = prefix.lower()
+        terms = self._sorted_terms
+        i = bisect_left(terms, prefix)
+        found = []
+        while i < len(terms) and terms[i].startswith(prefix):
+            found.append(terms[i])
+            i += 1
+        return found
+
+
+class TermIndex:
+    """Inverted index of a corpus: term -> {document path: word positions}.
+
+    Built from the DocumentTerms of each document, so rules and the
+    index share one tokenization per load. Can be saved and reloaded; a
+    loaded index is fresh while the set of documents and their sizes and
+    modification times are unchanged.
+    """
+
+    FORMAT = 2
+
+    def __init__(self):
+        self.postings: Dict[str, Dict[str, array]] = {}
+        self.word_lines: Dict[str, array] = {}
+        self.file_stats: Dict[str, Tuple[int, int]] = {}  # path -> (size, mtime_ns)
+
+    def add(self, path: str, terms: DocumentTerms) -> None:
+        self.word_lines[path] = terms.word_lines
+        for term, positions in terms.postings.items():
+            self.postings.setdefault(term, {})[path] = positions
+        try:
+            st = os.stat(path)
+            self.file_stats[path] = (st.st_size, st.st_mtime_ns)
+        except OSError:
+            pass
+
+    def find(self, query: str) -> Dict[str, List[int]]:
+        """{document path: sorted line numbers} where the term or phrase occurs."""
+        terms = query_terms(query)
+        if not terms:
+            return {}
+        # Only documents containing every term can contain the phrase
+        docs = None
+        for term, _ in terms:
+            in_term = set(self.postings.get(term, ()))
+            docs = in_term if docs is None else docs & in_term
+        found = {}
+        for path in sorted(docs):
+            starts = phrase_positions(terms, lambda term: list(self.postings[term][path]))
+            if starts:
+                lines = self.word_lines[path]
+                found[path] = sorted({lines[p] for p in starts})
+        return found
+
+    def is_fresh(self, paths: List[str]) -> bool:
+        if set(paths) != set(self.file_stats):
+            return False
+        for path in paths:
+            try:
+                st = os.stat(path)
+            except OSError:
+                return False
+            if self.file_stats[path] != (st.st_size, st.st_mtime_ns):
+                return False
+        return True
+
+    def save(self, path) -> None:
+        tmp = Path(str(path) + '.tmp')
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump({
+                'format': self.FORMAT,
+                'postings': {term: {doc: positions.tolist() for doc, positions in docs.items()}
+                             for term, docs in self.postings.items()},
+                'word_lines': {doc: lines.tolist() for doc, lines in self.word_lines.items()},
+                'file_stats': {doc: list(stat) for doc, stat in self.file_stats.items()},
+            }, f, separators=(',', ':'))
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path) -> Optional['TermIndex']:
+        """A saved index, or None if missing, unreadable or of another format."""
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                stored = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(stored, dict) or stored.get('format') != cls.FORMAT:
+            return None
+        index = cls()
+        try:
+            index.postings = {term: {doc: array('I', positions) for doc, positions in docs.items()}
+                              for term, docs in stored['postings'].items()}
+            index.word_lines = {doc: array('I', lines) for doc, lines in stored['word_lines'].items()}
+            index.file_stats = {doc: (int(size), int(mtime)) for doc, (size, mtime) in stored['file_stats'].items()}
+        except (KeyError, TypeError, ValueError, AttributeError, OverflowError):
+            return None
+        return index
+
+
+class AhoCorasick:
+    """Multi-pattern string matcher (Aho-Corasick automaton).
+
+    One pass over a text finds every occurrence of every pattern, so the
+    cost is linear in the text plus the number of matches, however many
+    patterns there are.
+    """
+
+    def __init__(self, patterns: List[str]):
+        self.patterns = list(patterns)
+        goto: List[Dict[str, int]] = [{}]
+        out: List[List[int]] = [[]]
+        for index, pattern in enumerate(self.patterns):
+            node = 0
+            for ch in pattern:
+                nxt = goto[node].get(ch)
+                if nxt is None:
+                    nxt = goto[node][ch] = len(goto)
+                    goto.append({})
+                    out.append([])
+                node = nxt
+            out[node].append(index)
+
+        # Breadth-first failure links; each node also emits its failure node's patterns
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, child in goto[node].items():
+                queue.append(child)
+                f = fail[node]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                target = goto[f].get(ch, 0)
+                fail[child] = target if target != child else 0
+                out[child] = out[child] + out[fail[child]]
+        self._goto = goto
+        self._fail = fail
+        self._out = out
+        # From the root, skip straight to the next character that can start a pattern
+        first = sorted({p[0] for p in self.patterns if p})
+        self._start = re.compile('[' + ''.join(re.escape(ch) for ch in first) + ']') if first else None
+
+    def iter_matches(self, text: str):
+        """Yield (start, end, pattern index) for every occurrence, ordered by end."""
+        if self._start is None:
+            return
+        goto, fail, out, patterns = self._goto, self._fail, self._out, self.patterns
+        node = 0
+        i, n = 0, len(text)
+        while i < n:
+            if node == 0:
+                m = self._start.search(text, i)
+                if m is None:
+                    return
+                i = m.start()
+            ch = text[i]
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            i += 1
+            for index in out[node]:
+                yield i - len(patterns[index]), i, index
+
+
+class Document:
+    """A document handed to rules during the shared scan."""
+
+    def __init__(self, path: str, text: Optional[str], audit: bool = False,
+                 loader: Optional[Callable[[], Optional[str]]] = None):
+        self.path = path
+        self._text = text
+        self._loader = loader  # Reads the text on first use when text is None
+        self.audit = audit  # Historical audit file: scanned for context only
+        self._line_starts: Optional[List[int]] = None
+        self._outline: Optional[MarkdownOutline] = None
+        self._lower: Optional[str] = None
+        self._terms: Optional[DocumentTerms] = None
+
+    @property
+    def text(self) -> str:
+        if self._text is None:
+            self._text = (self._loader() if self._loader else None) or ''
+        return self._text
+
+    @property
+    def name(self) -> str:
+        return Path(self.path).name
+
+    @property
+    def line_starts(self) -> List[int]:
+        """Offsets just past each newline, computed once."""
+        if self._line_starts is None:
+            self._line_starts = [m.end() for m in re.finditer('\n', self.text)]
+        return self._line_starts
+
+    def line_of(self, offset: int) -> int:
+        """1-based line number of a character offset."""
+        return bisect_right(self.line_starts, offset) + 1
+
+    def line_end(self, offset: int) -> int:
+        """Offset of the newline ending the line that contains offset (or len(text))."""
+        starts = self.line_starts
+        i = bisect_right(starts, offset)
+        return starts[i] - 1 if i < len(starts) else len(self.text)
+
+    @property
+    def outline(self) -> MarkdownOutline:
+        """Heading/section tree, parsed on first use and shared by all rules."""
+        if self._outline is None:
+            self._outline = MarkdownOutline(self.text)
+        return self._outline
+
+    @property
+    def terms(self) -> DocumentTerms:
+        """Term index of this document, built on first use and shared by all rules."""
+        if self._terms is None:
+            self._terms = DocumentTerms(self.text)
+        return self._terms
+
+    @property
+    def lower(self) -> str:
+        """Lowercased text, computed once for case-insensitive fallbacks."""
+        if self._lower is None:
+            self._lower = self.text.lower()
+        return self._lower
+
+    def section_text(self, heading: Heading) -> str:
+        return self.text[heading.body_start:heading.end]
+
+
+def line_scoped_pairs(doc: Document, starts, ends):
+    """Pair start and end matches the way ``START.*?END`` would, in linear time.
+
+    Equivalent to finditer() of the lazy pattern without re.DOTALL: each
+    start pairs with the first end beginning at or after it on the same
+    line, and pairs do not overlap. Both iterables are finditer() results
+    of patterns whose own matches cannot overlap. Unlike the lazy pattern,
+    which rescans the rest of the line from every start (quadratic on long
+    lines with many starts and no end), each match is visited once plus a
+    binary search. Yields (start_match, end_match).
+    """
+    ends = list(ends)
+    end_offsets = [m.start() for m in ends]
+    resume = 0
+    for start in starts:
+        if start.start() < resume:
+            continue
+        i = bisect_left(end_offsets, start.end())
+        if i == len(ends):
+            break
+        end = ends[i]
+        if end.start() > doc.line_end(start.end()):
+            continue
+        yield start, end
+        resume = end.end()
+
+
+def contains_in_order(text: str, *needles: str) -> bool:
+    """Whether the needles occur in text in order, without overlapping.
+
+    Same answer as searching ``A.*?B.*?C`` with re.DOTALL, but one
+    str.find() per needle: the earliest occurrence of each needle is always
+    the best choice, so no backtracking is needed.
+    """
+    pos = 0
+    for needle in needles:
+        pos = text.find(needle, pos)
+        if pos < 0:
+            return False
+        pos += len(needle)
+    return True
+
+
+@dataclass
+class RuleStats:
+    """Execution statistics for one rule in a validation run."""
+    rule: str
+    scope: str
+    severity: str
+    documents: int
+    matches: int
+    issues: int
+    wall_time_ms: float
+    cached_documents: int = 0  # Changed-since mode: facts reused instead of scanning
+
+
+class ValidationRule(ABC):
+    """Base class for validator rules.
+
+    A rule declares its name, scope, severity and regex patterns, and is
+    scheduled by EATGFValidator over a single shared pass of the corpus.
+    scan() is called once per applicable document and returns compact
+    facts (or None); finalize() turns the facts of all documents into
+    issues. Document-scope rules only look at one document's facts at a
+    time; corpus-scope rules compare facts across documents.
+    """
+
+    DOCUMENT = 'document'
+    CORPUS = 'corpus'
+
+    name = ''
+    label = ''  # Progress message
+    scope = DOCUMENT
+    severity = 'MEDIUM'
+    patterns: Dict[str, str] = {}
+    flags = 0
+    include_audit = False  # Also scan historical audit files (context only)
+
+    def __init__(self):
+        self.compiled = {key: re.compile(p, self.flags) for key, p in self.patterns.items()}
+
+    @property
+    def fact_key(self) -> str:
+        """Key of this rule's facts in the changed-since fact cache.
+
+        Rules whose facts depend on more than the document text (e.g. on
+        the control registry) include that dependency in the key.
+        """
+        return self.name
+
+    def prepare(self, validator: 'EATGFValidator') -> None:
+        """Called once before the scan, with the validator running the rule."""
+
+    def applies_to(self, path: str) -> bool:
+        """Whether scan() should run for the document at path."""
+        return True
+
+    @abstractmethod
+    def scan(self, doc: Document):
+        """Return this rule's facts for one document, or None."""
+
+    def facts_to_json(self, facts):
+        """JSON-serializable form of one document's facts, for the fact cache."""
+        return facts
+
+    def facts_from_json(self, data):
+        """Facts back from facts_to_json(); tuples may come back as lists."""
+        return data
+
+    def count_matches(self, facts) -> int:
+        """Number of matches represented by one document's facts."""
+        if isinstance(facts, bool):
+            return int(facts)
+        return len(facts) if hasattr(facts, '__len__') else 1
+
+    def finalize(self, facts: Dict[str, object], validator: 'EATGFValidator') -> List[ValidationIssue]:
+        """Turn per-document facts (keyed by path, in scan order) into issues."""
+        issues = []
+        for path, doc_facts in facts.items():
+            issues.extend(self.issues_for(path, doc_facts))
+        return issues
+
+    def issues_for(self, path: str, facts) -> List[ValidationIssue]:
+        """Issues for a single document (document-scope rules)."""
+        return []
+
+
+RULE_REGISTRY: List[type] = []
+
+
+def register_rule(cls):
+    """Class decorator adding a rule to the default rule set, in definition order."""
+    if inspect.isabstract(cls):
+        missing = ', '.join(sorted(cls.__abstractmethods__))
+        raise TypeError(f"Rule {cls.__name__} does not implement {missing}")
+    RULE_REGISTRY.append(cls)
+    return cls
+
+
+class GitError(RuntimeError):
+    """A git command needed for changed-files validation failed."""
+
+
+def git_blob_id(data: bytes) -> str:
+    """The id git gives a blob with this content (as in `git hash-object`)."""
+    return hashlib.sha1(b'blob %d\0' % len(data) + data).hexdigest()
+
+
+class GitWorkTree:
+    """The local git work tree containing a path (no remote access)."""
+
+    def __init__(self, path):
+        self.toplevel = Path(self._git(path, 'rev-parse', '--show-toplevel').strip())
+        self.git_dir = (self.toplevel / self._git(self.toplevel, 'rev-parse', '--git-dir').strip()).resolve()
+
+    @staticmethod
+    def _git(cwd, *args) -> str:
+        try:
+            result = subprocess.run(['git', '-C', str(cwd), *args], capture_output=True, check=True)
+        except FileNotFoundError:
+            raise GitError("git executable not found")
+        except subprocess.CalledProcessError as e:
+            raise GitError(f"git {' '.join(args)} failed: {e.stderr.decode('utf-8', 'replace').strip()}")
+        return result.stdout.decode('utf-8')
+
+    def changed_files(self, base: str) -> set:
+        """Absolute paths of files that differ between base and the work tree."""
+        out = self._git(self.toplevel, 'diff', '--name-only', '-z', base, '--')
+        return {(self.toplevel / name).resolve() for name in out.split('\0') if name}
+
+    def blob_ids(self, base: str) -> Dict[Path, str]:
+        """{absolute path: blob id} for every file in the base tree."""
+        out = self._git(self.toplevel, 'ls-tree', '-r', '-z', base)
+        blobs = {}
+        for entry in out.split('\0'):
+            if not entry:
+                continue
+            meta, name = entry.split('\t', 1)
+            _, kind, sha = meta.split()
+            if kind == 'blob':
+                blobs[(self.toplevel / name).resolve()] = sha
+        return blobs
+
+
+class FactCache:
+    """Rule facts of earlier runs, keyed by document content.
+
+    Keys are (git blob id, audit flag); values map a rule's fact key to
+    its facts in JSON form (ValidationRule.facts_to_json). The cache is
+    tied to this validator's source, so a change to any rule discards it,
+    and saving keeps only the entries used by the current run so it never
+    outgrows the corpus. A file that is unreadable, malformed or from
+    another namespace is ignored.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.namespace = hashlib.sha1(Path(__file__).read_bytes()).hexdigest()
+        self.entries: Dict[Tuple[str, bool], Dict[str, object]] = {}
+        self._used: set = set()
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                stored = json.load(f)
+        except (OSError, ValueError):
+            return
+        if not isinstance(stored, dict) or stored.get('namespace') != self.namespace:
+            return
+        if not isinstance(stored.get('entries'), list):
+            return
+        entries = {}
+        for entry in stored['entries']:
+            if not (isinstance(entry, list) and len(entry) == 3 and isinstance(entry[0], str)
+                    and isinstance(entry[1], bool) and isinstance(entry[2], dict)):
+                return
+            entries[(entry[0], entry[1])] = entry[2]
+        self.entries = entries
+
+    def get(self, key: Tuple[str, bool]) -> Dict[str, object]:
+        """Cached {rule name: facts} for a document; fill it in to cache new facts."""
+        self._used.add(key)
+        return self.entries.setdefault(key, {})
+
+    def save(self) -> None:
+        entries = [[blob, audit, self.entries[(blob, audit)]]
+                   for blob, audit in sorted(self._used) if (blob, audit) in self.entries]
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(self.path.name + '.tmp')
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump({'namespace': self.namespace, 'entries': entries}, f, separators=(',', ':'))
+        os.replace(tmp, self.path)
+
+
 class EATGFValidator:
     """Main validation engine for EATGF documents."""
 
@@ -117,15 +1042,54 @@ class EATGFValidator:
         'LAYER_08_COMPLIANCE_AUDIT_REPORT.md'
     }
 
-    def __init__(self, framework_root: str):
-        """Initialize validator with framework root directory."""
+    # Minimum estimated Jaccard similarity for two texts to count as duplicates
+    NEAR_DUPLICATE_THRESHOLD = 0.8
+
+    def __init__(self, framework_root: str, rules: Optional[List[ValidationRule]] = None,
+                 streaming: bool = False, changed_since: Optional[str] = None,
+                 fact_cache: Optional[str] = None, registry_path: Optional[str] = None):
+        """Initialize validator with framework root directory and rule set.
+
+        In streaming mode documents are read one at a time during the rule
+        scan and released afterwards, so at most one document's text is in
+        memory; only the rules' compact facts are kept, and excluded audit
+        files are never read.
+
+        With changed_since (a git ref), document-scope rules only run on
+        documents that differ from that ref in the local work tree.
+        Corpus-scope rules still see every document, but take the facts of
+        unchanged documents from fact_cache (default: a file in the git
+        directory) and only read documents whose facts aren't cached yet.
+
+        registry_path is the control registry cross-linked with the corpus
+        (default: eatgf_engine/registry_v1.1.json under the framework root).
+        """
         self.framework_root = Path(framework_root)
+        self.streaming = streaming
+        self.changed_since = changed_since
+        self.registry_path = registry_path
+        self.fact_cache_path = fact_cache
+        self.fact_cache: Optional[FactCache] = None
+        self.scan_paths: List[Tuple[Path, bool]] = []  # Changed-since mode: (document, audit)
+        self._base_blobs: Dict[str, str] = {}  # Changed-since mode: blob id of each unchanged document
         self.issues: List[ValidationIssue] = []
         self.documents: Dict[str, str] = {}
         self.audit_documents: Dict[str, str] = {}  # Separate storage for audit files
+        self.document_paths: List[Path] = []  # Streaming mode: documents to scan
+        self.audit_paths: List[Path] = []  # Streaming mode: excluded, never read
+        self.rules: List[ValidationRule] = [cls() for cls in RULE_REGISTRY] if rules is None else list(rules)
+        self.rule_stats: Dict[str, RuleStats] = {}
+        self._parsed: Dict[str, Document] = {}
 
     def load_documents(self) -> None:
         """Load all markdown documents from framework, excluding historical audit files."""
+        if self.changed_since:
+            self._index_changed_documents()
+            return
+        if self.streaming:
+            self._index_documents()
+            return
+
         print("📂 Loading documents...")
         audit_count = 0
 
@@ -148,258 +1112,220 @@ class EATGFValidator:
 
         print(f"\n  Summary: {len(self.documents)} production docs + {audit_count} audit docs (excluded from validation)\n")
 
+    def _index_documents(self) -> None:
+        """Streaming mode: record document paths without reading any file."""
+        print("📂 Indexing documents (streaming)...")
+        for md_file in self.framework_root.rglob("*.md"):
+            if md_file.name in self.EXCLUDED_AUDIT_FILES:
+                self.audit_paths.append(md_file)
+                print(f"  ℹ️  Audit (excluded, not read): {md_file.name}")
+            else:
+                self.document_paths.append(md_file)
+
+        print(f"\n  Summary: {len(self.document_paths)} production docs + {len(self.audit_paths)} audit docs (excluded from validation)\n")
+
+    def _index_changed_documents(self) -> None:
+        """Changed-since mode: record document paths and which ones changed, without reading any file."""
+        print(f"📂 Indexing documents changed since {self.changed_since}...")
+        worktree = GitWorkTree(self.framework_root)
+        changed = worktree.changed_files(self.changed_since)
+        base_blobs = worktree.blob_ids(self.changed_since)
+        self.fact_cache = FactCache(self.fact_cache_path or worktree.git_dir / 'eatgf-validator-facts.json')
+
+        changed_count = 0
+        for md_file in self.framework_root.rglob("*.md"):
+            resolved = md_file.resolve()
+            self.scan_paths.append((md_file, md_file.name in self.EXCLUDED_AUDIT_FILES))
+            blob = base_blobs.get(resolved)
+            if blob is None or resolved in changed:  # New, untracked or modified
+                print(f"  ✓ Changed: {md_file.name}")
+                changed_count += 1
+            else:
+                self._base_blobs[str(md_file)] = blob
+
+        print(f"\n  Summary: {changed_count} changed docs of {len(self.scan_paths)} (unchanged docs reuse cached facts)\n")
+
+    def is_changed(self, path: str) -> bool:
+        """Whether document-scope rules should check the document at path."""
+        return not self.changed_since or path not in self._base_blobs
+
+    def _cached_facts(self, doc: Document) -> Dict[str, object]:
+        """Changed-since mode: the fact cache entry for a document's content."""
+        blob = self._base_blobs.get(doc.path)
+        if blob is None:
+            blob = git_blob_id(doc.text.encode('utf-8'))
+        return self.fact_cache.get((blob, doc.audit))
+
+    def _read_document(self, md_file: Path) -> Optional[str]:
+        """Read one document. Returns None on error."""
+        try:
+            with open(md_file, 'rb') as f:
+                return f.read().decode('utf-8')
+        except Exception as e:
+            print(f"  ✗ Error loading {md_file.name}: {e}")
+            return None
+
     def validate_all(self) -> None:
-        """Run all validation checks."""
+        """Run all registered rules over a single shared scan."""
         print("\n🔍 Running validation checks...\n")
-
-        # Run all checks
-        self.check_duplicate_go_no_go_dates()
-        self.check_sla_consistency()
-        self.check_duplicate_problem_statements()
-        self.check_timeline_duplication()
-        self.check_terminology_consistency()
-        self.check_cross_references()
-        self.check_control_mapping_consistency()
-        self.check_eatgf_template_compliance()
+        self.run_rules(self.rules)
+
+    def _iter_documents(self):
+        """Yield every loaded document once, production documents first.
+
+        Document objects (and their parsed outlines) are cached so separate
+        run_rules() calls reuse the same parse. In streaming mode each file is
+        read when reached and nothing is cached. In changed-since mode each
+        file is read only if a rule needs its text.
+        """
+        if self.changed_since:
+            for md_file, audit in self.scan_paths:
+                yield Document(str(md_file), None, audit=audit, loader=lambda f=md_file: self._read_document(f))
+            return
+        if self.streaming:
+            for md_file in self.document_paths:
+                content = self._read_document(md_file)
+                if content is not None:
+                    yield Document(str(md_file), content)
+            return
+        for filepath, content in self.documents.items():
+            yield self._document(filepath, content, audit=False)
+        for filepath, content in self.audit_documents.items():
+            yield self._document(filepath, content, audit=True)
+
+    def _document(self, filepath: str, content: str, audit: bool) -> Document:
+        doc = self._parsed.get(filepath)
+        if doc is None or doc.text is not content:
+            doc = self._parsed[filepath] = Document(filepath, content, audit=audit)
+        return doc
+
+    def build_term_index(self) -> TermIndex:
+        """Corpus term index.
+
+        Loaded documents contribute the DocumentTerms the rules already
+        built; when nothing has been loaded, every markdown file under the
+        framework root (audit files included) is read once.
+        """
+        index = TermIndex()
+        if self.documents or self.audit_documents or self.document_paths or self.scan_paths:
+            for doc in self._iter_documents():
+                index.add(doc.path, doc.terms)
+            return index
+        for md_file in self.framework_root.rglob("*.md"):
+            content = self._read_document(md_file)
+            if content is not None:
+                index.add(str(md_file), DocumentTerms(content))
+        return index
+
+    def run_rules(self, rules: List[ValidationRule]) -> None:
+        """Scan the corpus once for all rules, then finalize each rule in order."""
+        for rule in rules:
+            print(f"  🔍 {rule.label}...")
+            rule.prepare(self)
+
+        facts: Dict[str, Dict[str, object]] = {rule.name: {} for rule in rules}
+        elapsed = {rule.name: 0.0 for rule in rules}
+        matches = {rule.name: 0 for rule in rules}
+        scanned = {rule.name: 0 for rule in rules}
+        reused = {rule.name: 0 for rule in rules}
+
+        for doc in self._iter_documents():
+            changed = self.is_changed(doc.path)
+            cached = None
+            for rule in rules:
+                if (doc.audit and not rule.include_audit) or not rule.applies_to(doc.path):
+                    continue
+                if rule.scope == ValidationRule.DOCUMENT and not changed:
+                    continue
+                if self.fact_cache is not None:
+                    if cached is None:
+                        cached = self._cached_facts(doc)
+                    if rule.fact_key in cached:
+                        try:
+                            stored = cached[rule.fact_key]
+                            result = None if stored is None else rule.facts_from_json(stored)
+                        except (TypeError, ValueError, KeyError, IndexError):
+                            pass  # Malformed entry; scan the document again
+                        else:
+                            reused[rule.name] += 1
+                            if result is not None:
+                                facts[rule.name][doc.path] = result
+                                matches[rule.name] += rule.count_matches(result)
+                            continue
+                start = time.perf_counter()
+                result = rule.scan(doc)
+                elapsed[rule.name] += time.perf_counter() - start
+                scanned[rule.name] += 1
+                if cached is not None:
+                    cached[rule.fact_key] = None if result is None else rule.facts_to_json(result)
+                if result is not None:
+                    facts[rule.name][doc.path] = result
+                    matches[rule.name] += rule.count_matches(result)
+
+        for rule in rules:
+            start = time.perf_counter()
+            issues = rule.finalize(facts[rule.name], self)
+            elapsed[rule.name] += time.perf_counter() - start
+            self.issues.extend(issues)
+            self.rule_stats[rule.name] = RuleStats(
+                rule=rule.name,
+                scope=rule.scope,
+                severity=rule.severity,
+                documents=scanned[rule.name],
+                matches=matches[rule.name],
+                issues=len(issues),
+                wall_time_ms=round(elapsed[rule.name] * 1000, 3),
+                cached_documents=reused[rule.name],
+            )
+        if self.fact_cache is not None:
+            self.fact_cache.save()
 
     def check_duplicate_go_no_go_dates(self) -> None:
         """Check for conflicting Go/No-Go decision dates."""
-        print("  🔍 Checking for duplicate Go/No-Go dates...")
-
-        pattern = r'\*\*(?:Go/No-Go|Final Go/No-Go|GO DECISION|Decision Required).*?(\d{4}-\d{2}-\d{2})\*\*'
-
-        for filepath, content in self.documents.items():
-            matches = list(re.finditer(pattern, content))
-            if len(matches) > 1:
-                dates = [m.group(1) for m in matches]
-                if len(set(dates)) > 1:  # Different dates found
-                    line_nums = [content[:m.start()].count('\n') + 1 for m in matches]
-
-                    self.issues.append(ValidationIssue(
-                        severity="CRITICAL",
-                        category="CONFLICT",
-                        title="Multiple Go/No-Go dates in single document",
-                        description=f"Document contains {len(set(dates))} different Go/No-Go dates: {', '.join(set(dates))}",
-                        locations=[(filepath, line) for line in line_nums],
-                        recommendation="Clarify: Is first date leadership approval gate? Is second date pilot completion checkpoint?"
-                    ))
+        self.run_rules([GoNoGoDatesRule()])
 
     def check_sla_consistency(self) -> None:
         """Check for SLA timeline conflicts across documents."""
-        print("  🔍 Checking SLA consistency...")
-
-        # Pattern to find SLA matrices
-        sla_patterns = {
-            'CRITICAL': r'CRITICAL[:\s]+.*?(\d+)[_\s]?(hour|hrs|hours|day|days)',
-            'HIGH': r'HIGH[:\s]+.*?(\d+)[_\s]?(hour|hrs|hours|day|days)',
-            'MEDIUM': r'MEDIUM[:\s]+.*?(\d+)[_\s]?(hour|hrs|hours|day|days)',
-        }
-
-        sla_findings = {}
-
-        for filepath, content in self.documents.items():
-            for severity, pattern in sla_patterns.items():
-                matches = list(re.finditer(pattern, content))
-                for match in matches:
-                    key = f"{severity}_{filepath}"
-                    if key not in sla_findings:
-                        sla_findings[key] = []
-                    line_num = content[:match.start()].count('\n') + 1
-                    sla_findings[key].append((match.group(1), match.group(2), line_num))
-
-        # Compare SLA values across documents
-        for severity in ['CRITICAL', 'HIGH', 'MEDIUM']:
-            values = {}
-            for key in sla_findings:
-                if f"{severity}_" in key:
-                    filepath = key.replace(f"{severity}_", "")
-                    for value, unit, lineno in sla_findings[key]:
-                        normalized = f"{value} {unit}"
-                        if normalized not in values:
-                            values[normalized] = []
-                        values[normalized].append((filepath, lineno))
-
-            if len(values) > 1:
-                self.issues.append(ValidationIssue(
-                    severity="CRITICAL" if severity == "CRITICAL" else "HIGH",
-                    category="CONFLICT",
-                    title=f"SLA conflicts for {severity} vulnerabilities",
-                    description=f"Different documents define different SLAs: {list(values.keys())}",
-                    locations=[loc for locs in values.values() for loc in locs],
-                    recommendation="Standardize SLA definitions. VULNERABILITY_MANAGEMENT_PROFILE.md is authoritative. Update other documents to match."
-                ))
+        self.run_rules([SlaConsistencyRule()])
 
     def check_duplicate_problem_statements(self) -> None:
-        """Check for duplicate problem statement sections."""
-        print("  🔍 Checking for duplicate problem statements...")
-
-        problem_pattern = r'## Problem Statement\n(.*?)(?=\n## )'
-
-        problem_sections = {}
-        for filepath, content in self.documents.items():
-            match = re.search(problem_pattern, content, re.DOTALL)
-            if match:
-                section = match.group(1)[:200]  # First 200 chars for comparison
-                if section not in problem_sections:
-                    problem_sections[section] = []
-                problem_sections[section].append(filepath)
-
-        # Check for similar problems (likely duplicates)
-        for section, files in problem_sections.items():
-            if len(files) > 1:
-                self.issues.append(ValidationIssue(
-                    severity="HIGH",
-                    category="DUPLICATION",
-                    title="Problem statement repeated in multiple documents",
-                    description=f"Same or similar problem definition appears in {len(files)} documents",
-                    locations=[(f, content[f].find("## Problem Statement") + 1) for f in files],
-                    recommendation="Keep detailed version in EXECUTIVE_SUMMARY_PHASE_13.md only. Reference from other docs via link."
-                ))
+        """Check for duplicate or near-duplicate problem statement sections."""
+        self.run_rules([DuplicateProblemStatementRule()])
 
     def check_timeline_duplication(self) -> None:
         """Check for timeline information duplicated across documents."""
-        print("  🔍 Checking timeline duplication...")
-
-        timeline_pattern = r'Phase 13.*?Week 1.*?Week 4.*?\n'
-
-        timeline_docs = []
-        for filepath, content in self.documents.items():
-            if re.search(timeline_pattern, content, re.DOTALL):
-                timeline_docs.append(filepath)
-
-        if len(timeline_docs) > 2:
-            self.issues.append(ValidationIssue(
-                severity="HIGH",
-                category="DUPLICATION",
-                title="Phase 13-15 timeline duplicated across documents",
-                description=f"Timeline details appear in {len(timeline_docs)} documents: {', '.join([Path(f).name for f in timeline_docs])}",
-                locations=[(f, 1) for f in timeline_docs],
-                recommendation="Create PHASE_13-15_TIMELINE_MASTER.md as single source of truth. Reference from all other documents."
-            ))
+        self.run_rules([TimelineDuplicationRule()])
 
     def check_terminology_consistency(self) -> None:
         """Check for inconsistent terminology in vulnerability lifecycle."""
-        print("  🔍 Checking terminology consistency...")
-
-        vuln_terms = {
-            'patch_application': [],
-            'patch_deployment': [],
-            'patch_verification': []
-        }
-
-        for filepath, content in self.documents.items():
-            for term in vuln_terms:
-                # Replace underscores with optional whitespace for pattern matching
-                term_with_spaces = term.replace("_", r"\s+")
-                pattern = f'({term}|{term_with_spaces})'
-                matches = list(re.finditer(pattern, content))
-                for match in matches:
-                    line_num = content[:match.start()].count('\n') + 1
-                    vuln_terms[term].append((filepath, line_num))
-
-        # Check if inconsistent usage in same document
-        for filepath, content in self.documents.items():
-            if 'VULNERABILITY_MANAGEMENT' in filepath or 'vulnerability' in filepath.lower():
-                has_application = 'patch_application' in content
-                has_deployment = 'patch_deploy' in content
-
-                if has_application and has_deployment:
-                    # Check if they're used correctly
-                    if not self._validate_vuln_terminology(content):
-                        self.issues.append(ValidationIssue(
-                            severity="MEDIUM",
-                            category="INCONSISTENCY",
-                            title="Vulnerability remediation terms used inconsistently",
-                            description="Document uses different terms for same lifecycle stages",
-                            locations=[(filepath, 1)],
-                            recommendation="Create VULNERABILITY_REMEDIATION_TERMINOLOGY.md defining: detection → notification → patch → deployment → verification"
-                        ))
+        self.run_rules([TerminologyConsistencyRule()])
 
     def check_cross_references(self) -> None:
-        """Check if cross-document references are valid."""
-        print("  🔍 Checking cross-references...")
-
-        link_pattern = r'\[([^\]]+)\]\(([^\)]+\.md)\)'
-
-        broken_links = []
-        for filepath, content in self.documents.items():
-            matches = re.finditer(link_pattern, content)
-            for match in matches:
-                link_target = match.group(2)
-                # Check if target exists or is findable
-                target_path = self.framework_root / link_target
-                if not target_path.exists():
-                    line_num = content[:match.start()].count('\n') + 1
-                    broken_links.append((filepath, line_num, link_target))
-
-        if broken_links:
-            self.issues.append(ValidationIssue(
-                severity="MEDIUM",
-                category="MISSING",
-                title=f"Broken cross-references found ({len(broken_links)})",
-                description="Some markdown links reference non-existent files",
-                locations=[(f, l) for f, l, _ in broken_links],
-                recommendation="Verify link targets or create missing documents"
-            ))
+        """Check if cross-document references and heading anchors are valid."""
+        self.run_rules([CrossReferenceRule()])
 
     def check_control_mapping_consistency(self) -> None:
         """Check for consistent control mapping across profiles."""
-        print("  🔍 Checking control mapping consistency...")
-
-        # ISO 27001 A.8.28 should map consistently
-        iso_a828_pattern = r'ISO 27001[:\s]+A\.8\.28|A\.8\.28.*?[Ss]upply [Cc]hain'
-
-        a828_files = []
-        for filepath, content in self.documents.items():
-            if re.search(iso_a828_pattern, content):
-                a828_files.append(filepath)
-
-        # Check if supply chain profiles map to A.8.28
-        supply_chain_profiles = [f for f in self.documents.keys() if 'SUPPLY_CHAIN' in f or 'SBOM' in f]
-
-        missing_mapping = [f for f in supply_chain_profiles if f not in a828_files]
-        if missing_mapping:
-            self.issues.append(ValidationIssue(
-                severity="MEDIUM",
-                category="MISSING",
-                title="Missing ISO 27001 A.8.28 mapping in supply chain profiles",
-                description=f"{len(missing_mapping)} profiles don't map to A.8.28",
-                locations=[(f, 1) for f in missing_mapping],
-                recommendation="Add explicit mapping to ISO 27001 A.8.28 (Supply chain management)"
-            ))
+        self.run_rules([ControlMappingRule()])
 
     def check_eatgf_template_compliance(self) -> None:
         """Check if all profiles follow EATGF template."""
-        print("  🔍 Checking EATGF template compliance...")
-
-        required_sections = [
-            'Authority Notice',
-            'Architectural Position',
-            'Governance Principles',
-            'Developer Checklist',
-            'Control Mapping',
-            'Official References'
-        ]
-
-        profile_files = [f for f in self.documents.keys() if 'PROFILE.md' in f]
+        self.run_rules([TemplateComplianceRule()])
 
-        for filepath in profile_files:
-            content = self.documents[filepath]
-            missing = []
-
-            for section in required_sections:
-                if section not in content and section.lower() not in content.lower():
-                    missing.append(section)
-
-            if missing:
-                self.issues.append(ValidationIssue(
-                    severity="HIGH",
-                    category="MISSING",
-                    title=f"Missing required EATGF sections in {Path(filepath).name}",
-                    description=f"Missing: {', '.join(missing)}",
-                    locations=[(filepath, 1)],
-                    recommendation="Add missing sections per EATGF_DOCUMENT_SIGNATURE_TEMPLATE.md"
-                ))
+    @staticmethod
+    def _paragraphs(content: str):
+        """Yield (line_number, text) for each blank-line separated paragraph."""
+        start_line, buf = 1, []
+        for line_num, line in enumerate(content.split('\n'), 1):
+            if line.strip():
+                if not buf:
+                    start_line = line_num
+                buf.append(line)
+            elif buf:
+                yield start_line, '\n'.join(buf)
+                buf = []
+        if buf:
+            yield start_line, '\n'.join(buf)
 
     @staticmethod
     def _validate_vuln_terminology(content: str) -> bool:
@@ -448,6 +1374,13 @@ class EATGFValidator:
                         print(f"    ... and {len(issue.locations) - 3} more")
                     print(f"  Recommendation:\n    {issue.recommendation}")
 
+        if self.rule_stats:
+            print("\n⏱️  RULE TIMINGS:")
+            print("-" * 80)
+            for stats in sorted(self.rule_stats.values(), key=lambda s: s.wall_time_ms, reverse=True):
+                cached = f"  {stats.cached_documents} cached" if stats.cached_documents else ""
+                print(f"  {stats.rule:<32} {stats.scope:<9} {stats.wall_time_ms:>10.1f} ms  {stats.matches:>6} matches  {stats.issues:>3} issues{cached}")
+
         print("\n" + "="*80)
         print(f"Report Generated: {datetime.now().isoformat()}")
         print("Classification: Internal - Governance Only")
@@ -458,6 +1391,8 @@ class EATGFValidator:
             'critical': critical,
             'high': high,
             'issues': [asdict(issue) for issue in self.issues],
+            'rule_stats': [asdict(stats) for stats in self.rule_stats.values()],
+            'changed_since': self.changed_since,
             'timestamp': datetime.now().isoformat()
         }
 
@@ -469,18 +1404,633 @@ class EATGFValidator:
         print(f"\n✅ JSON report saved to: {output_file}")
 
 
+# ==============================================================================
+# Validation rules (scheduled by EATGFValidator.run_rules, in definition order)
+# ==============================================================================
+
+@register_rule
+class GoNoGoDatesRule(ValidationRule):
+    """Conflicting Go/No-Go decision dates within a single document."""
+    name = 'go_no_go_dates'
+    label = 'Checking for duplicate Go/No-Go dates'
+    scope = ValidationRule.DOCUMENT
+    severity = 'CRITICAL'
+    # A decision marker, then the first bold-closed date later on the same line
+    patterns = {
+        'decision': r'\*\*(?:Go/No-Go|Final Go/No-Go|GO DECISION|Decision Required)',
+        'date': r'(\d{4}-\d{2}-\d{2})\*\*',
+    }
+
+    def scan(self, doc: Document):
+        if '**' not in doc.text:
+            return None
+        pairs = line_scoped_pairs(doc, self.compiled['decision'].finditer(doc.text),
+                                  self.compiled['date'].finditer(doc.text))
+        return [(date.group(1), doc.line_of(decision.start())) for decision, date in pairs] or None
+
+    def issues_for(self, path: str, facts) -> List[ValidationIssue]:
+        dates = [date for date, _ in facts]
+        if len(facts) < 2 or len(set(dates)) < 2:  # Different dates found
+            return []
+        return [ValidationIssue(
+            severity=self.severity,
+            category="CONFLICT",
+            title="Multiple Go/No-Go dates in single document",
+            description=f"Document contains {len(set(dates))} different Go/No-Go dates: {', '.join(set(dates))}",
+            locations=[(path, line) for _, line in facts],
+            recommendation="Clarify: Is first date leadership approval gate? Is second date pilot completion checkpoint?"
+        )]
+
+
+@register_rule
+class SlaConsistencyRule(ValidationRule):
+    """SLA timeline values that differ across documents."""
+    name = 'sla_consistency'
+    label = 'Checking SLA consistency'
+    scope = ValidationRule.CORPUS
+    severity = 'CRITICAL'
+    # SLA matrices: a severity label, then the first duration later on the same
+    # line. Durations start at a whole digit run, so a long number is not
+    # re-tried from every one of its digits.
+    levels = ('CRITICAL', 'HIGH', 'MEDIUM')
+    patterns = dict(
+        {level: level + r'[:\s]+' for level in levels},
+        duration=r'(?<!\d)(\d+)[_\s]?(hour|hrs|hours|day|days)',
+    )
+
+    def scan(self, doc: Document):
+        durations = list(self.compiled['duration'].finditer(doc.text))
+        if not durations:
+            return None
+        findings = []
+        for severity in self.levels:
+            for label, match in line_scoped_pairs(doc, self.compiled[severity].finditer(doc.text), durations):
+                findings.append((severity, f"{match.group(1)} {match.group(2)}", doc.line_of(label.start())))
+        return findings or None
+
+    def finalize(self, facts, validator) -> List[ValidationIssue]:
+        issues = []
+        # Compare SLA values across documents
+        for severity in self.levels:
+            values: Dict[str, List[Tuple[str, int]]] = {}
+            for filepath, findings in facts.items():
+                for level, normalized, lineno in findings:
+                    if level == severity:
+                        values.setdefault(normalized, []).append((filepath, lineno))
+
+            if len(values) > 1:
+                issues.append(ValidationIssue(
+                    severity="CRITICAL" if severity == "CRITICAL" else "HIGH",
+                    category="CONFLICT",
+                    title=f"SLA conflicts for {severity} vulnerabilities",
+                    description=f"Different documents define different SLAs: {list(values.keys())}",
+                    locations=[loc for locs in values.values() for loc in locs],
+                    recommendation="Standardize SLA definitions. VULNERABILITY_MANAGEMENT_PROFILE.md is authoritative. Update other documents to match."
+                ))
+        return issues
+
+
+@register_rule
+class DuplicateProblemStatementRule(ValidationRule):
+    """Problem statement sections repeated (verbatim or edited) across documents."""
+    name = 'duplicate_problem_statements'
+    label = 'Checking for duplicate problem statements'
+    scope = ValidationRule.CORPUS
+    severity = 'HIGH'
+
+    def __init__(self):
+        super().__init__()
+        self._sketch = NearDuplicateIndex()
+
+    def scan(self, doc: Document):
+        heading = doc.outline.section('Problem Statement', level=2)
+        if heading is None:
+            return None
+        sig = self._sketch.signature(doc.section_text(heading))
+        if sig is None:
+            return None
+        return (heading.line, sig)
+
+    def facts_to_json(self, facts):
+        line, sig = facts
+        return [line, list(sig)]
+
+    def facts_from_json(self, data):
+        line, sig = data
+        return (line, tuple(sig))
+
+    def count_matches(self, facts) -> int:
+        return 1
+
+    def finalize(self, facts, validator) -> List[ValidationIssue]:
+        index = NearDuplicateIndex(threshold=validator.NEAR_DUPLICATE_THRESHOLD)
+        for filepath, (_, sig) in facts.items():
+            index.add_signature(filepath, sig)
+
+        return [
+            ValidationIssue(
+                severity=self.severity,
+                category="DUPLICATION",
+                title="Problem statement repeated in multiple documents",
+                description=f"Same or similar problem definition appears in {len(cluster.members)} documents (similarity {cluster.similarity:.2f})",
+                locations=[(f, facts[f][0]) for f in cluster.members],
+                recommendation="Keep detailed version in EXECUTIVE_SUMMARY_PHASE_13.md only. Reference from other docs via link."
+            )
+            for cluster in index.clusters()
+        ]
+
+
+@register_rule
+class TimelineDuplicationRule(ValidationRule):
+    """Phase 13-15 timeline content repeated across documents."""
+    name = 'timeline_duplication'
+    label = 'Checking timeline duplication'
+    scope = ValidationRule.CORPUS
+    severity = 'HIGH'
+    # A timeline is "Phase 13", "Week 1", "Week 4" and a newline, in that order
+    # (checked with contains_in_order rather than a nested lazy pattern)
+    timeline_markers = ('Phase 13', 'Week 1', 'Week 4', '\n')
+    patterns = {'week': r'\bWeek \d'}
+
+    def __init__(self):
+        super().__init__()
+        self._sketch = NearDuplicateIndex()
+
+    def scan(self, doc: Document):
+        if not contains_in_order(doc.text, *self.timeline_markers):
+            return None
+        # Sketch week-by-week paragraphs so edited copies of a block are caught
+        blocks = []
+        for line_num, paragraph in EATGFValidator._paragraphs(doc.text):
+            if self.compiled['week'].search(paragraph) and len(paragraph.split()) >= self._sketch.shingle_size:
+                blocks.append((line_num, self._sketch.signature(paragraph)))
+        return blocks
+
+    def facts_to_json(self, facts):
+        return [[line_num, list(sig)] for line_num, sig in facts]
+
+    def facts_from_json(self, data):
+        return [(line_num, tuple(sig)) for line_num, sig in data]
+
+    def count_matches(self, facts) -> int:
+        return 1
+
+    def finalize(self, facts, validator) -> List[ValidationIssue]:
+        issues = []
+        timeline_docs = list(facts)
+        if len(timeline_docs) > 2:
+            issues.append(ValidationIssue(
+                severity=self.severity,
+                category="DUPLICATION",
+                title="Phase 13-15 timeline duplicated across documents",
+                description=f"Timeline details appear in {len(timeline_docs)} documents: {', '.join([Path(f).name for f in timeline_docs])}",
+                locations=[(f, 1) for f in timeline_docs],
+                recommendation="Create PHASE_13-15_TIMELINE_MASTER.md as single source of truth. Reference from all other documents."
+            ))
+
+        # Near-copies of the same timeline block (e.g. a week-by-week plan
+        # pasted with edits) across the documents that carry a timeline.
+        index = NearDuplicateIndex(threshold=validator.NEAR_DUPLICATE_THRESHOLD)
+        for filepath, blocks in facts.items():
+            for line_num, sig in blocks:
+                index.add_signature((filepath, line_num), sig)
+
+        for cluster in index.clusters():
+            files = {f for f, _ in cluster.members}
+            if len(files) < 2:
+                continue
+            issues.append(ValidationIssue(
+                severity=self.severity,
+                category="DUPLICATION",
+                title="Timeline block near-duplicated across documents",
+                description=f"Same or similar timeline block appears {len(cluster.members)} times in {len(files)} documents (similarity {cluster.similarity:.2f})",
+                locations=list(cluster.members),
+                recommendation="Keep the timeline in PHASE_13-15_TIMELINE_MASTER.md only. Reference it from other documents."
+            ))
+        return issues
+
+
+@register_rule
+class TerminologyConsistencyRule(ValidationRule):
+    """Vulnerability lifecycle terms used out of order in vulnerability documents."""
+    name = 'terminology_consistency'
+    label = 'Checking terminology consistency'
+    scope = ValidationRule.DOCUMENT
+    severity = 'MEDIUM'
+    terms = ('patch_application', 'patch_deployment', 'patch_verification')
+
+    def applies_to(self, path: str) -> bool:
+        return 'VULNERABILITY_MANAGEMENT' in path or 'vulnerability' in path.lower()
+
+    def scan(self, doc: Document):
+        terms = doc.terms
+        # Underscored term or the same words as a phrase
+        term_matches = sum(terms.count(term) + terms.count(term.replace('_', ' ')) for term in self.terms)
+        has_application = terms.has_prefix('patch_application')
+        has_deployment = terms.has_prefix('patch_deploy')
+        # Check if they're used correctly
+        inconsistent = has_application and has_deployment and not EATGFValidator._validate_vuln_terminology(doc.text)
+        return (term_matches, inconsistent)
+
+    def count_matches(self, facts) -> int:
+        return facts[0]
+
+    def issues_for(self, path: str, facts) -> List[ValidationIssue]:
+        if not facts[1]:
+            return []
+        return [ValidationIssue(
+            severity=self.severity,
+            category="INCONSISTENCY",
+            title="Vulnerability remediation terms used inconsistently",
+            description="Document uses different terms for same lifecycle stages",
+            locations=[(path, 1)],
+            recommendation="Create VULNERABILITY_REMEDIATION_TERMINOLOGY.md defining: detection → notification → patch → deployment → verification"
+        )]
+
+
+@register_rule
+class CrossReferenceRule(ValidationRule):
+    """Markdown links to missing files or missing heading anchors."""
+    name = 'cross_references'
+    label = 'Checking cross-references'
+    scope = ValidationRule.CORPUS
+    severity = 'MEDIUM'
+    include_audit = True  # Audit files are link targets even though they aren't validated
+
+    def scan(self, doc: Document):
+        links = [] if doc.audit else [(line, target) for line, _, target in LinkIndex.iter_links(doc.text)]
+        return (doc.outline.anchors, links)
+
+    def facts_to_json(self, facts):
+        anchors, links = facts
+        return [sorted(anchors), links]
+
+    def facts_from_json(self, data):
+        anchors, links = data
+        return (set(anchors), [(line_num, target) for line_num, target in links])
+
+    def count_matches(self, facts) -> int:
+        return len(facts[1])
+
+    def finalize(self, facts, validator) -> List[ValidationIssue]:
+        index = LinkIndex.build(validator.framework_root)
+        for filepath, (anchors, _) in facts.items():
+            index.anchors[index.relative(filepath)] = anchors
+
+        broken_links = []
+        broken_anchors = []
+        for filepath, (_, links) in facts.items():
+            for line_num, link_target in links:
+                outcome, _ = index.resolve(filepath, link_target)
+                if outcome == LinkIndex.MISSING_FILE:
+                    broken_links.append((filepath, line_num))
+                elif outcome == LinkIndex.MISSING_ANCHOR:
+                    broken_anchors.append((filepath, line_num))
+
+        issues = []
+        if broken_links:
+            issues.append(ValidationIssue(
+                severity=self.severity,
+                category="MISSING",
+                title=f"Broken cross-references found ({len(broken_links)})",
+                description="Some markdown links reference non-existent files",
+                locations=broken_links,
+                recommendation="Verify link targets or create missing documents"
+            ))
+        if broken_anchors:
+            issues.append(ValidationIssue(
+                severity=self.severity,
+                category="MISSING",
+                title=f"Broken anchor references found ({len(broken_anchors)})",
+                description="Some markdown links reference headings that do not exist in the target document",
+                locations=broken_anchors,
+                recommendation="Update link fragments to match the target heading or restore the heading"
+            ))
+        return issues
+
+
+@register_rule
+class ControlMappingRule(ValidationRule):
+    """Supply chain profiles missing their ISO 27001 A.8.28 mapping."""
+    name = 'control_mapping_consistency'
+    label = 'Checking control mapping consistency'
+    scope = ValidationRule.CORPUS
+    severity = 'MEDIUM'
+    # ISO 27001 A.8.28 (or a sub-clause such as A.8.28.1) should map
+    # consistently: "ISO 27001: A.8.28", or A.8.28 followed by "supply chain",
+    # each on a single line
+    clause = 'a.8.28'
+    patterns = {'supply_chain': r'supply chain'}
+    flags = re.IGNORECASE
+    profile_markers = ('SUPPLY_CHAIN', 'SBOM')
+
+    def applies_to(self, path: str) -> bool:
+        return any(marker in path for marker in self.profile_markers)
+
+    def is_clause(self, term: str) -> bool:
+        return term == self.clause or term.startswith(self.clause + '.')
+
+    def scan(self, doc: Document):
+        # The term index finds the lines mentioning the clause; only those are re-read
+        terms = doc.terms
+        lines = set()
+        for term in terms.with_prefix(self.clause):
+            if self.is_clause(term):
+                lines.update(terms.word_lines[p] for p in terms.positions(term))
+        starts = doc.line_starts
+        for line_num in sorted(lines):
+            start = starts[line_num - 2] if line_num > 1 else 0
+            if self.maps_line(doc.text[start:doc.line_end(start)]):
+                return True
+        return False
+
+    def maps_line(self, line: str) -> bool:
+        tokens = list(TERM_TOKEN.finditer(line))
+        first = None
+        for i, tok in enumerate(tokens):
+            if not self.is_clause(tok.group().lower()):
+                continue
+            if first is None:
+                first = tok
+            if i >= 2:
+                iso, number = tokens[i - 2], tokens[i - 1]
+                if (iso.group().lower() == 'iso' and number.group() == '27001'
+                        and line[iso.end():number.start()].isspace()
+                        and not line[number.end():tok.start()].strip(': \t')):
+                    return True
+        # Only the first mention on a line matters: it leaves the longest tail
+        return first is not None and self.compiled['supply_chain'].search(line, first.end()) is not None
+
+    def finalize(self, facts, validator) -> List[ValidationIssue]:
+        missing_mapping = [f for f, mapped in facts.items() if not mapped]
+        if not missing_mapping:
+            return []
+        return [ValidationIssue(
+            severity=self.severity,
+            category="MISSING",
+            title="Missing ISO 27001 A.8.28 mapping in supply chain profiles",
+            description=f"{len(missing_mapping)} profiles don't map to A.8.28",
+            locations=[(f, 1) for f in missing_mapping],
+            recommendation="Add explicit mapping to ISO 27001 A.8.28 (Supply chain management)"
+        )]
+
+
+@register_rule
+class TemplateComplianceRule(ValidationRule):
+    """Profiles missing sections required by the EATGF template."""
+    name = 'eatgf_template_compliance'
+    label = 'Checking EATGF template compliance'
+    scope = ValidationRule.DOCUMENT
+    severity = 'HIGH'
+
+    required_sections = [
+        'Authority Notice',
+        'Architectural Position',
+        'Governance Principles',
+        'Developer Checklist',
+        'Control Mapping',
+        'Official References'
+    ]
+
+    def applies_to(self, path: str) -> bool:
+        return 'PROFILE.md' in path
+
+    def scan(self, doc: Document):
+        # Headings are a dictionary lookup; the text fallback keeps sections
+        # declared outside headings (e.g. a bold "Authority Notice" line).
+        outline = doc.outline
+        return [
+            s for s in self.required_sections
+            if not outline.has_section(s) and s not in doc.text and s.lower() not in doc.lower
+        ]
+
+    def count_matches(self, facts) -> int:
+        return len(self.required_sections) - len(facts)
+
+    def issues_for(self, path: str, facts) -> List[ValidationIssue]:
+        if not facts:
+            return []
+        return [ValidationIssue(
+            severity=self.severity,
+            category="MISSING",
+            title=f"Missing required EATGF sections in {Path(path).name}",
+            description=f"Missing: {', '.join(facts)}",
+            locations=[(path, 1)],
+            recommendation="Add missing sections per EATGF_DOCUMENT_SIGNATURE_TEMPLATE.md"
+        )]
+
+
+@register_rule
+class RegistryCrossLinkRule(ValidationRule):
+    """Control IDs and authorities in the documents checked against the control registry."""
+    name = 'registry_cross_links'
+    label = 'Cross-linking documents with the control registry'
+    scope = ValidationRule.CORPUS
+    severity = 'MEDIUM'
+    default_registry = Path('eatgf_engine') / 'registry_v1.1.json'
+    retired_state = 'Retired'  # LifecycleState.RETIRED (a str enum)
+    # Anything shaped like a control ID, known or not
+    patterns = {'control_id': r'\bEATGF-[A-Z]+-[A-Z]+-\d+\b'}
+
+    def __init__(self):
+        super().__init__()
+        self.registry = None
+        self.registry_file: Optional[Path] = None
+        self.load_error: Optional[str] = None
+        self.matcher: Optional[AhoCorasick] = None
+        self._digest = ''
+
+    @property
+    def fact_key(self) -> str:
+        return f"{self.name}:{self._digest}"
+
+    def prepare(self, validator: 'EATGFValidator') -> None:
+        self.registry = self.matcher = self.load_error = None
+        self._digest = ''
+        explicit = validator.registry_path is not None
+        self.registry_file = Path(validator.registry_path) if explicit else validator.framework_root / self.default_registry
+        if not explicit and not self.registry_file.exists():
+            print(f"    ℹ️  No control registry at {self.registry_file}; skipped")
+            return
+        try:
+            from eatgf_engine.registry.loader import load_registry
+            from eatgf_engine.registry.validators import RegistryValidationError
+        except ImportError as e:
+            self.load_error = f"eatgf_engine is not importable: {e}"
+            return
+        try:
+            self._digest = hashlib.sha1(self.registry_file.read_bytes()).hexdigest()
+            self.registry = load_registry(str(self.registry_file))
+        except (OSError, ValueError, KeyError, TypeError, RegistryValidationError) as e:
+            self.load_error = f"{type(e).__name__}: {e}"
+            return
+        authorities = {ctrl.primary_authority for ctrl in self.registry.controls.values()}
+        self.matcher = AhoCorasick(sorted(set(self.registry.controls) | authorities))
+
+    @staticmethod
+    def _bounded(text: str, start: int, end: int) -> bool:
+        """Whether text[start:end] is a whole token (not part of A.5.31, GOV-010, ...)."""
+        if start > 0 and (text[start - 1].isalnum() or text[start - 1] in '_-'):
+            return False
+        if end < len(text):
+            nxt = text[end]
+            if nxt.isalnum() or nxt == '_':
+                return False
+            if nxt in '.-' and end + 1 < len(text) and text[end + 1].isalnum():
+                return False
+        return True
+
+    def scan(self, doc: Document):
+        if self.matcher is None:
+            return None
+        text = doc.text
+        patterns = self.matcher.patterns
+        mentions = [
+            (patterns[index], doc.line_of(start))
+            for start, end, index in self.matcher.iter_matches(text)
+            if self._bounded(text, start, end)
+        ]
+        unknown = [
+            (m.group(), doc.line_of(m.start()))
+            for m in self.compiled['control_id'].finditer(text)
+            if m.group() not in self.registry.controls
+        ]
+        return (mentions, unknown) if mentions or unknown else None
+
+    def count_matches(self, facts) -> int:
+        return len(facts[0]) + len(facts[1])
+
+    def finalize(self, facts, validator) -> List[ValidationIssue]:
+        if self.load_error:
+            return [ValidationIssue(
+                severity=self.severity,
+                category="INCONSISTENCY",
+                title="Control registry could not be loaded",
+                description=f"{self.registry_file}: {self.load_error}",
+                locations=[(str(self.registry_file), 1)],
+                recommendation="Fix the registry so load_registry() accepts it; documents cannot be cross-checked until then"
+            )]
+        if self.registry is None:
+            return []
+
+        controls = self.registry.controls
+        mentioned: set = set()  # Control IDs and authorities
+        unknown: Dict[str, List[Tuple[str, int]]] = {}
+        retired: Dict[str, List[Tuple[str, int]]] = {}
+        for filepath, (mentions, unknown_ids) in facts.items():
+            for pattern, line in mentions:
+                mentioned.add(pattern)
+                ctrl = controls.get(pattern)
+                if ctrl is not None and ctrl.lifecycle_state == self.retired_state:
+                    retired.setdefault(pattern, []).append((filepath, line))
+            for control_id, line in unknown_ids:
+                unknown.setdefault(control_id, []).append((filepath, line))
+
+        undocumented = sorted(
+            cid for cid, ctrl in controls.items()
+            if ctrl.lifecycle_state != self.retired_state
+            and cid not in mentioned and ctrl.primary_authority not in mentioned
+        )
+
+        issues = []
+        if unknown:
+            issues.append(ValidationIssue(
+                severity=self.severity,
+                category="INCONSISTENCY",
+                title=f"Unknown control IDs referenced ({len(unknown)})",
+                description=f"Not in registry {self.registry.version}: {', '.join(sorted(unknown))}",
+                locations=[loc for cid in sorted(unknown) for loc in unknown[cid]],
+                recommendation="Correct the control ID or add the control to the registry"
+            ))
+        if retired:
+            issues.append(ValidationIssue(
+                severity=self.severity,
+                category="INCONSISTENCY",
+                title=f"Retired controls still referenced ({len(retired)})",
+                description=f"Retired in the registry: {', '.join(sorted(retired))}",
+                locations=[loc for cid in sorted(retired) for loc in retired[cid]],
+                recommendation="Replace references to retired controls with their successors"
+            ))
+        if undocumented:
+            issues.append(ValidationIssue(
+                severity='LOW',
+                category="MISSING",
+                title=f"Registry controls with no documentation ({len(undocumented)})",
+                description=f"Neither the control ID nor its primary authority is mentioned: {', '.join(undocumented)}",
+                locations=[(str(self.registry_file), 1)],
+                recommendation="Reference each control (by ID or primary authority) from the document that implements it"
+            ))
+        return issues
+
+
+def find_terms(framework_root: str, queries: List[str], index_path: Optional[str] = None) -> bool:
+    """Print the documents and lines mentioning each query. Returns whether anything was found.
+
+    A saved index at index_path is reused while the corpus is unchanged
+    (no file is read); otherwise the index is rebuilt and saved there.
+    """
+    root = Path(framework_root)
+    start = time.perf_counter()
+    index = TermIndex.load(index_path) if index_path else None
+    if index is not None and index.is_fresh([str(p) for p in root.rglob("*.md")]):
+        source = 'loaded'
+    else:
+        index = EATGFValidator(framework_root).build_term_index()
+        if index_path:
+            index.save(index_path)
+        source = 'built'
+    print(f"📇 Term index {source} in {(time.perf_counter() - start) * 1000:.1f} ms "
+          f"({len(index.postings)} terms, {len(index.word_lines)} documents)")
+
+    found_any = False
+    for query in queries:
+        start = time.perf_counter()
+        found = index.find(query)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        found_any = found_any or bool(found)
+        total = sum(len(lines) for lines in found.values())
+        print(f"\n🔎 {query!r}: {total} lines in {len(found)} documents ({elapsed_ms:.2f} ms)")
+        for path, lines in found.items():
+            print(f"  {os.path.relpath(path, root)}: {', '.join(map(str, lines))}")
+    return found_any
+
+
 def main():
     """CLI entry point."""
     import sys
+    import argparse
 
+    parser = argparse.ArgumentParser(description="EATGF Dynamic Compliance Validation System")
     # Find framework root
-    framework_root = "/Users/sunmarke/Downloads/Knowledge Centre"
-    if len(sys.argv) > 1:
-        framework_root = sys.argv[1]
-
-    validator = EATGFValidator(framework_root)
-    validator.load_documents()
+    parser.add_argument('framework_root', nargs='?', default="/Users/sunmarke/Downloads/Knowledge Centre")
+    parser.add_argument('--streaming', action='store_true',
+                        help='Read one document at a time and keep only compact facts (bounded memory)')
+    parser.add_argument('--changed-since', metavar='BASE',
+                        help='Check only documents changed since this git ref; cross-document checks reuse cached facts')
+    parser.add_argument('--fact-cache', metavar='PATH',
+                        help='Fact cache file for --changed-since (default: inside the git directory)')
+    parser.add_argument('--registry', metavar='PATH',
+                        help='Control registry to cross-link with the documents (default: eatgf_engine/registry_v1.1.json)')
+    parser.add_argument('--find-term', action='append', metavar='TERM',
+                        help='List documents and lines mentioning a term, control ID or phrase (case-insensitive); repeatable')
+    parser.add_argument('--term-index', metavar='PATH',
+                        help='Term index file: reused by --find-term while documents are unchanged, saved after validation')
+    args = parser.parse_args()
+
+    if args.find_term:
+        sys.exit(0 if find_terms(args.framework_root, args.find_term, args.term_index) else 1)
+
+    validator = EATGFValidator(args.framework_root, streaming=args.streaming,
+                               changed_since=args.changed_since, fact_cache=args.fact_cache,
+                               registry_path=args.registry)
+    try:
+        validator.load_documents()
+    except GitError as e:
+        print(f"❌ {e}")
+        sys.exit(2)
     validator.validate_all()
+    if args.term_index:
+        validator.build_term_index().save(args.term_index)
     report = validator.generate_report()
     validator.export_json("validation_report.json")
 
@@ -1,37 +1,354 @@
 import sys
+from pathlib import Path
 from eatgf_engine.registry.loader import load_registry
+from eatgf_engine.registry.models import LifecycleState
 from eatgf_engine.registry.validators import RegistryValidationError
 
 import json
 from eatgf_engine.engine.evaluator import evaluate_compliance
 from eatgf_engine.engine.report import print_compliance_report
+from eatgf_engine.compliance.report_builder import parse_timestamp
+
+
+def store_results(args):
+    from eatgf_engine.compliance.report_serializer import load_report
+    from eatgf_engine.compliance.results_store import ResultsStore
+    if args.entity and len(args.reports) > 1:
+        print("--entity applies to a single report; entities default to report file names")
+        exit(1)
+
+    def items():
+        for path in args.reports:
+            report = load_report(path)
+            yield (
+                args.entity or Path(path).stem,
+                args.run_id or report.evaluation_timestamp,
+                report,
+            )
+
+    with ResultsStore(args.db) as store:
+        count = store.add_reports(items())
+    print(f"Stored {count} report(s) in {args.db}")
+
+
+def query_results(args):
+    import time
+    from eatgf_engine.compliance.results_store import ResultsStore
+    if not (args.control or args.domain):
+        print("Usage: python -m eatgf_engine.cli.main query-results results.db (--control CONTROL_ID [--status STATUS] | --domain DOMAIN) [--since DATE] [--until DATE] [--latest]")
+        exit(1)
+    with ResultsStore(args.db) as store:
+        start = time.perf_counter()
+        window = dict(since=args.since, until=args.until, latest=args.latest)
+        if args.control and args.status:
+            rows = store.entities_with_status(args.control, args.status, **window)
+            header = ("entity", "run_id", "evaluated_at")
+        elif args.control:
+            rows = sorted(store.status_counts(args.control, **window).items())
+            header = ("status", "count")
+        else:
+            rows = store.domain_scores(args.domain, **window)
+            header = ("entity", "run_id", "evaluated_at", "applicable", "score_percent")
+        elapsed_ms = (time.perf_counter() - start) * 1000
+    print("\t".join(header))
+    for row in rows:
+        print("\t".join(str(v) for v in row))
+    print(f"{len(rows)} row(s) in {elapsed_ms:.1f} ms")
+
+
+def write_report_outputs(args, report, context):
+    if args.output_json:
+        from eatgf_engine.compliance.report_serializer import serialize_report
+        serialize_report(report, args.output_json)
+        print(f"Compliance report written to {args.output_json}")
+    if args.results_db:
+        from eatgf_engine.compliance.results_store import ResultsStore
+        entity = args.entity or Path(args.org_profile).stem
+        with ResultsStore(args.results_db) as store:
+            store.add_report(report, entity, context.run_id or report.evaluation_timestamp)
+        print(f"Compliance report stored in {args.results_db} for {entity}")
+    if args.archive:
+        from eatgf_engine.compliance.report_serializer import archive_report
+        entity = args.entity or Path(args.org_profile).stem
+        digest, is_new = archive_report(report, args.archive, entity, context.run_id)
+        print(f"Compliance report archived in {args.archive} as {digest[:12]} ({'new' if is_new else 'deduplicated'})")
+
+
+def evaluate_cached(args):
+    from eatgf_engine.compliance.report_builder import ReportContext
+    from eatgf_engine.engine.eval_cache import EvaluationCache, evaluate_files
+    from eatgf_engine.engine.evidence_loader import EvidenceValidationError
+    context = ReportContext.for_run(args.timestamp, run_id=args.run_id)
+    cache = EvaluationCache(directory=args.cache_dir)
+    try:
+        entry, hit = evaluate_files(args.registry, args.org_profile, args.evidence, cache, context)
+    except RegistryValidationError as e:
+        print("Registry validation FAILED:")
+        print(str(e))
+        exit(2)
+    except EvidenceValidationError as e:
+        print("Evidence validation FAILED:")
+        print(str(e))
+        exit(2)
+    print_compliance_report(entry.summary)
+    stats = cache.stats()
+    print(f"Evaluation cache: {'hit' if hit else 'miss'} "
+          f"(memory hits {stats['memory_hits']}, disk hits {stats['disk_hits']}, misses {stats['misses']})")
+    write_report_outputs(args, entry.report, context)
+
+
+def evaluate_portfolio(args):
+    from eatgf_engine.engine.bulk_evidence import load_bulk_evidence
+    registry = load_registry(args.registry)
+    with open(args.profiles, "r", encoding="utf-8") as f:
+        profiles = json.load(f)
+    metrics = sink = None
+    if args.output_metrics:
+        from eatgf_engine.engine.metrics import MetricsTable
+        metrics = MetricsTable()
+
+        def sink(entity, control_id, values):
+            environment = profiles.get(entity, {}).get("environment")
+            metrics.append(entity, environment, registry.controls[control_id].domain, control_id, values)
+    portfolio = load_bulk_evidence(args.evidence, registry.controls, fmt=args.format, metrics_sink=sink)
+    from eatgf_engine.compliance.report_builder import ReportContext
+    context = ReportContext.for_run(args.timestamp, run_id=args.run_id)
+    unknown = sorted(set(portfolio) - set(profiles))
+    if unknown:
+        from eatgf_engine.engine.evidence_loader import EvidenceValidationError
+        raise EvidenceValidationError(f"No organization profile for entities: {', '.join(unknown[:10])}")
+
+    from eatgf_engine.engine.applicability import ApplicabilityCache
+    from eatgf_engine.engine.evaluator import evaluate_batch
+    cache = ApplicabilityCache(registry.controls)
+    results = evaluate_batch(
+        registry.controls,
+        ((entity, profile, portfolio.get(entity, {})) for entity, profile in sorted(profiles.items())),
+        cache=cache,
+    )
+    stats = cache.stats()
+    print(f"Entities: {len(results)}")
+    print(f"Evidence records: {sum(len(ev) for ev in portfolio.values())}")
+    print(f"Applicability signatures: {stats['signatures']} (hit ratio {stats['hit_ratio']:.1%})")
+    if results:
+        mean = sum(r["compliance_percent"] for r in results.values()) / len(results)
+        print(f"Mean Compliance Score: {mean:.1f}%\n")
+    for entity, r in results.items():
+        print(f"  {entity}: {r['compliance_percent']:.1f}%")
+    if args.remediation:
+        from eatgf_engine.engine.remediation import RemediationIndex, statuses_from_result
+        index = RemediationIndex(registry)
+        print()
+        print_remediation_plan(index.rank((statuses_from_result(r) for r in results.values()), top=args.remediation))
+    if metrics is not None:
+        from eatgf_engine.engine.metrics import write_rollups
+        write_rollups(metrics, args.output_metrics)
+        print(f"\nEvidence metrics rollups written to {args.output_metrics}")
+    if args.output_dir:
+        from eatgf_engine.compliance.report_pipeline import write_reports
+        try:
+            entries = write_reports(
+                results.items(), args.output_dir, registry.version, context=context, workers=args.workers
+            )
+        except ValueError as e:
+            print("Report output FAILED:")
+            print(str(e))
+            exit(2)
+        print(f"Wrote {len(entries)} report(s) to {args.output_dir}")
+    if args.results_db or args.archive:
+        from eatgf_engine.compliance.report_builder import build_report
+        reports = [
+            (entity, build_report(registry_version=registry.version, engine_version=context.engine_version,
+                                  evaluation_result=r, context=context))
+            for entity, r in results.items()
+        ]
+        if args.results_db:
+            from eatgf_engine.compliance.results_store import ResultsStore
+            with ResultsStore(args.results_db) as store:
+                count = store.add_reports(
+                    (entity, context.run_id or report.evaluation_timestamp, report) for entity, report in reports
+                )
+            print(f"Stored {count} report(s) in {args.results_db}")
+        if args.archive:
+            from eatgf_engine.compliance.report_archive import ReportArchive
+            archive = ReportArchive(args.archive)
+            new = sum(archive.put(report, entity, context.run_id)[1] for entity, report in reports)
+            print(f"Archived {len(reports)} report(s) in {args.archive} ({new} new bodies)")
+
+
+def print_remediation_plan(items):
+    print("Remediation priorities (control, domain, failing entities, blocked dependents):")
+    for rank, item in enumerate(items, 1):
+        print(f"  {rank}. {item.control_id} [{item.domain}] failing={item.failing_entities} blocked={item.blocked_dependents}")
+
+
+def remediation_plan(args):
+    from eatgf_engine.compliance.report_serializer import load_report
+    from eatgf_engine.engine.remediation import RemediationIndex, statuses_from_report
+    registry = load_registry(args.registry)
+    index = RemediationIndex(registry)
+    items = index.rank((statuses_from_report(load_report(path), index) for path in args.reports), top=args.top)
+    print_remediation_plan(items)
+
+
+def _load_snapshot(path, index):
+    from eatgf_engine.compliance.report_serializer import load_report
+    from eatgf_engine.compliance.snapshot import SnapshotError, snapshot_report, read_snapshots
+    if path.endswith(".json"):
+        return snapshot_report(load_report(path), index)
+    snapshots = read_snapshots(path)
+    if not snapshots:
+        raise SnapshotError(f"No snapshots in {path}")
+    return snapshots[-1]
+
+
+def snapshot_reports(args):
+    from eatgf_engine.compliance.report_serializer import load_report
+    from eatgf_engine.compliance.snapshot import ControlIndex, snapshot_report, append_snapshot
+    registry = load_registry(args.registry)
+    index = ControlIndex.from_registry(registry)
+    for path in args.reports:
+        append_snapshot(args.history, snapshot_report(load_report(path), index))
+    print(f"Appended {len(args.reports)} snapshot(s) to {args.history}")
+
+
+def diff_reports(args):
+    from dataclasses import asdict
+    from eatgf_engine.compliance.snapshot import ControlIndex, diff_snapshots
+    registry = load_registry(args.registry)
+    index = ControlIndex.from_registry(registry)
+    delta = diff_snapshots(_load_snapshot(args.before, index), _load_snapshot(args.after, index), index)
+    print(f"Compared: {delta.evaluated_before} -> {delta.evaluated_after}")
+    print(f"Compliance Score: {delta.score_before:.1f}% -> {delta.score_after:.1f}% ({delta.score_delta:+.1f})\n")
+    print("Domain deltas:")
+    for d, v in delta.domain_deltas.items():
+        print(f"  {d}: {v.score_before:.1f}% -> {v.score_after:.1f}% ({v.score_delta:+.1f})")
+    print(f"\nStatus transitions: {len(delta.transitions)}")
+    for cid, old, new in delta.transitions:
+        print(f"  {cid}: {old} -> {new}")
+    if args.output_json:
+        with open(args.output_json, "w", encoding="utf-8") as f:
+            json.dump(asdict(delta), f, indent=2, sort_keys=True)
+        print(f"\nDelta report written to {args.output_json}")
 
 
 def main():
     import argparse
     parser = argparse.ArgumentParser()
-    parser.add_argument('command', choices=['validate-registry', 'evaluate-compliance'])
-    parser.add_argument('registry', help='Registry JSON file')
-    parser.add_argument('org_profile', nargs='?', help='Organization profile JSON file')
-    parser.add_argument('evidence', nargs='?', help='Evidence JSON file')
-    parser.add_argument('--output-json', dest='output_json', help='Output compliance report as JSON')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    p = commands.add_parser('validate-registry')
+    p.add_argument('registry', help='Registry JSON file')
+    p.add_argument('--domain', dest='domains', action='append', help='Only load and validate controls in this domain (repeatable)')
+    p.add_argument('--lifecycle-state', dest='lifecycle_states', action='append',
+                   choices=[s.value for s in LifecycleState], help='Only load and validate controls in this lifecycle state (repeatable)')
+
+    p = commands.add_parser('compile-registry', help='Write a flat, mmap-able compiled registry')
+    p.add_argument('registry', help='Registry JSON file')
+    p.add_argument('output', help='Compiled registry file')
+
+    p = commands.add_parser('evaluate-compliance')
+    p.add_argument('registry', help='Registry JSON file')
+    p.add_argument('org_profile', nargs='?', help='Organization profile JSON file')
+    p.add_argument('evidence', nargs='?', help='Evidence JSON file')
+    p.add_argument('--output-json', dest='output_json', help='Output compliance report as JSON')
+    p.add_argument('--output-metrics', dest='output_metrics', help='Output evidence_metrics rollups (p50/p95 by domain and environment) as JSON')
+    p.add_argument('--results-db', dest='results_db', help='Also store the report in this SQLite results store')
+    p.add_argument('--archive', help='Also store the report in this deduplicating report archive directory')
+    p.add_argument('--entity', help='Entity name for the results store and archive (default: org profile file name)')
+    p.add_argument('--run-id', dest='run_id', help='Run ID for the results store and archive (default: evaluation timestamp; required with --timestamp)')
+    p.add_argument('--timestamp', type=parse_timestamp, help='Frozen ISO-8601 evaluation timestamp (default: now)')
+    p.add_argument('--cache-dir', dest='cache_dir', help='Reuse results for unchanged registry/profile/evidence content from this cache directory')
+
+    p = commands.add_parser('evaluate-portfolio', help='Evaluate many entities from a bulk CSV/JSON Lines evidence export')
+    p.add_argument('registry', help='Registry JSON file')
+    p.add_argument('profiles', help='JSON object mapping entity name to its organization profile')
+    p.add_argument('evidence', help='Bulk evidence file (.csv or .jsonl) with entity, control_id, status columns')
+    p.add_argument('--format', choices=['csv', 'jsonl'], help='Evidence format (default: from file extension)')
+    p.add_argument('--output-metrics', dest='output_metrics', help='Output evidence_metrics rollups as JSON')
+    p.add_argument('--results-db', dest='results_db', help='Store per-entity reports in this SQLite results store')
+    p.add_argument('--archive', help='Store per-entity reports in this deduplicating report archive directory')
+    p.add_argument('--output-dir', dest='output_dir', help='Write one compliance report JSON per entity plus index.json here')
+    p.add_argument('--workers', type=int, default=1, help='Worker processes for --output-dir (output is identical for any count)')
+    p.add_argument('--remediation', type=int, metavar='N', help='Print the top N remediation priorities across the portfolio')
+    p.add_argument('--run-id', dest='run_id', help='Run ID for the results store and archive (default: evaluation timestamp; required with --timestamp)')
+    p.add_argument('--timestamp', type=parse_timestamp, help='Frozen ISO-8601 evaluation timestamp for every report (default: now, taken once)')
+
+    p = commands.add_parser('archive-export', help='Write an archived run back out as report JSON')
+    p.add_argument('archive', help='Report archive directory')
+    p.add_argument('entity', help='Entity name')
+    p.add_argument('output_json', help='Output compliance report JSON')
+    p.add_argument('--run-id', dest='run_id', help='Run ID (default: latest run for the entity)')
+
+    p = commands.add_parser('remediation-plan', help='Rank failing controls by dependents blocked across reports')
+    p.add_argument('registry', help='Registry JSON file')
+    p.add_argument('reports', nargs='+', help='Compliance report JSON files, one per entity')
+    p.add_argument('--top', type=int, help='Only the top N controls')
+
+    p = commands.add_parser('store-results', help='Bulk-load compliance report JSON files into a results store')
+    p.add_argument('db', help='SQLite results store')
+    p.add_argument('reports', nargs='+', help='Compliance report JSON files')
+    p.add_argument('--entity', help='Entity name (single report only; default: report file name)')
+    p.add_argument('--run-id', dest='run_id', help='Run ID (default: evaluation timestamp)')
+
+    p = commands.add_parser('query-results', help='Query a results store')
+    p.add_argument('db', help='SQLite results store')
+    p.add_argument('--control', help='Control ID')
+    p.add_argument('--status', help='List entities with this status for --control')
+    p.add_argument('--domain', help='List per-entity scores for this domain')
+    p.add_argument('--since', help='Earliest evaluation timestamp (inclusive, ISO-8601)')
+    p.add_argument('--until', help='Latest evaluation timestamp (exclusive, ISO-8601)')
+    p.add_argument('--latest', action='store_true', help="Only each entity's latest run in the window")
+
+    p = commands.add_parser('snapshot-reports', help='Append compact status snapshots of reports to a history file')
+    p.add_argument('registry', help='Registry JSON file (defines the canonical control order)')
+    p.add_argument('history', help='Snapshot history file')
+    p.add_argument('reports', nargs='+', help='Compliance report JSON files, oldest first')
+
+    p = commands.add_parser('diff-reports', help='Status transitions and score deltas between two runs')
+    p.add_argument('registry', help='Registry JSON file (defines the canonical control order)')
+    p.add_argument('before', help='Earlier compliance report JSON or snapshot history (latest entry)')
+    p.add_argument('after', help='Later compliance report JSON or snapshot history (latest entry)')
+    p.add_argument('--output-json', dest='output_json', help='Output the delta as JSON')
     args = parser.parse_args()
+    if getattr(args, 'timestamp', None) and (args.results_db or args.archive) and not args.run_id:
+        # The run ID would default to the frozen timestamp, so a rerun would silently replace the stored run
+        parser.error('--run-id is required when --timestamp is used with --results-db or --archive')
 
     if args.command == 'validate-registry':
         try:
-            registry = load_registry(args.registry)
+            registry = load_registry(args.registry, domains=args.domains, lifecycle_states=args.lifecycle_states)
             print("Registry Loaded Successfully")
             print(f"Version: {registry.version}")
-            print(f"Controls: {len(registry.controls)}")
+            if args.domains or args.lifecycle_states:
+                print(f"Controls: {len(registry.controls)} of {len(registry.controls) + len(registry.external_ids)}")
+            else:
+                print(f"Controls: {len(registry.controls)}")
             print("Validation: PASSED")
         except RegistryValidationError as e:
             print("Validation FAILED:")
             print(str(e))
             exit(2)
+    elif args.command == 'compile-registry':
+        from eatgf_engine.registry.compiled import write_compiled
+        try:
+            registry = load_registry(args.registry)
+        except RegistryValidationError as e:
+            print("Registry validation FAILED:")
+            print(str(e))
+            exit(2)
+        write_compiled(registry, args.output)
+        print(f"Compiled {len(registry.controls)} controls to {args.output}")
     elif args.command == 'evaluate-compliance':
         if not (args.org_profile and args.evidence):
             print("Usage: python -m eatgf_engine.cli.main evaluate-compliance registry_v1.1.json org_profile.json evidence.json [--output-json report.json]")
             exit(1)
+        if args.cache_dir:
+            if args.output_metrics:
+                print("--cache-dir cannot be combined with --output-metrics")
+                exit(1)
+            evaluate_cached(args)
+            return
         try:
             registry = load_registry(args.registry)
         except RegistryValidationError as e:
@@ -41,24 +358,87 @@ def main():
         with open(args.org_profile, "r", encoding="utf-8") as f:
             org_profile = json.load(f)
         from eatgf_engine.engine.evidence_loader import load_evidence, EvidenceValidationError
+        metrics = sink = None
+        if args.output_metrics:
+            from eatgf_engine.engine.metrics import MetricsTable
+            metrics = MetricsTable()
+            sink = metrics.collector(args.entity or Path(args.org_profile).stem, org_profile, registry.controls)
         try:
-            evidence = load_evidence(args.evidence, registry.controls)
+            evidence = load_evidence(args.evidence, registry.controls, metrics_sink=sink)
         except EvidenceValidationError as e:
             print("Evidence validation FAILED:")
             print(str(e))
             exit(2)
         summary = evaluate_compliance(registry.controls, org_profile, evidence)
         print_compliance_report(summary)
-        if args.output_json:
-            from eatgf_engine.compliance.report_builder import build_report
-            from eatgf_engine.compliance.report_serializer import serialize_report
+        if metrics is not None:
+            from eatgf_engine.engine.metrics import write_rollups
+            write_rollups(metrics, args.output_metrics)
+            print(f"Evidence metrics rollups written to {args.output_metrics}")
+        if args.output_json or args.results_db or args.archive:
+            from eatgf_engine.compliance.report_builder import ReportContext, build_report
+            context = ReportContext.for_run(args.timestamp, run_id=args.run_id)
             report = build_report(
                 registry_version=registry.version,
-                engine_version="1.1",
-                evaluation_result=summary
+                engine_version=context.engine_version,
+                evaluation_result=summary,
+                context=context
             )
-            serialize_report(report, args.output_json)
-            print(f"Compliance report written to {args.output_json}")
+            write_report_outputs(args, report, context)
+    elif args.command == 'evaluate-portfolio':
+        from eatgf_engine.engine.evidence_loader import EvidenceValidationError
+        try:
+            evaluate_portfolio(args)
+        except RegistryValidationError as e:
+            print("Registry validation FAILED:")
+            print(str(e))
+            exit(2)
+        except EvidenceValidationError as e:
+            print("Evidence validation FAILED:")
+            print(str(e))
+            exit(2)
+    elif args.command == 'archive-export':
+        from eatgf_engine.compliance.report_archive import ArchiveError, ReportArchive
+        from eatgf_engine.compliance.report_serializer import serialize_report
+        try:
+            report = ReportArchive(args.archive).get(args.entity, args.run_id)
+        except ArchiveError as e:
+            print("Archive FAILED:")
+            print(str(e))
+            exit(2)
+        serialize_report(report, args.output_json)
+        print(f"Compliance report written to {args.output_json}")
+    elif args.command == 'remediation-plan':
+        from eatgf_engine.engine.remediation import RemediationError
+        try:
+            remediation_plan(args)
+        except RegistryValidationError as e:
+            print("Registry validation FAILED:")
+            print(str(e))
+            exit(2)
+        except RemediationError as e:
+            print("Remediation plan FAILED:")
+            print(str(e))
+            exit(2)
+    elif args.command == 'store-results':
+        store_results(args)
+    elif args.command == 'query-results':
+        query_results(args)
+    elif args.command in ('snapshot-reports', 'diff-reports'):
+        from eatgf_engine.compliance.snapshot import SnapshotError
+        try:
+            if args.command == 'snapshot-reports':
+                snapshot_reports(args)
+            else:
+                diff_reports(args)
+        except RegistryValidationError as e:
+            print("Registry validation FAILED:")
+            print(str(e))
+            exit(2)
+        except SnapshotError as e:
+            print("Snapshot FAILED:")
+            print(str(e))
+            exit(2)
 
 if __name__ == "__main__":
     main()
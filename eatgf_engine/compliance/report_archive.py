@@ -0,0 +1,137 @@
+import gzip
+import hashlib
+import json
+import os
+import struct
+from dataclasses import asdict
+from typing import Any, Dict, List, Optional, Tuple
+
+from .report_models import ComplianceReport
+
+try:
+    import zstandard
+except ImportError:  # gzip is used instead
+    zstandard = None
+
+PACK_FILE = "bodies.pack"
+INDEX_FILE = "bodies.idx"
+RUNS_FILE = "runs.jsonl"
+
+CODEC_GZIP = 1
+CODEC_ZSTD = 2
+
+# sha256 digest, codec, pack offset, compressed length
+_INDEX_ENTRY = struct.Struct("<32sBQI")
+
+
+class ArchiveError(ValueError):
+    pass
+
+
+def report_body(report: ComplianceReport) -> Dict[str, Any]:
+    """The report without evaluation_timestamp: identical for repeated runs over unchanged inputs."""
+    body = asdict(report)
+    del body["evaluation_timestamp"]
+    return body
+
+
+def body_digest(body: Dict[str, Any]) -> Tuple[bytes, bytes]:
+    """(sha256 digest, canonical JSON encoding) of a report body."""
+    data = json.dumps(body, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    return hashlib.sha256(data).digest(), data
+
+
+class ReportArchive:
+    """
+    Directory of deduplicated reports. Distinct bodies are compressed once
+    into an append-only packfile; a fixed-width index maps each body's
+    sha256 to its offset for random access, and runs.jsonl records
+    (entity, run_id, evaluation_timestamp, body hash) per stored run.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        os.makedirs(path, exist_ok=True)
+        self.index: Dict[bytes, Tuple[int, int, int]] = {}
+        index_path = os.path.join(path, INDEX_FILE)
+        if os.path.exists(index_path):
+            with open(index_path, "rb") as f:
+                data = f.read()
+            usable = len(data) - len(data) % _INDEX_ENTRY.size  # ignore a torn trailing entry
+            for digest, codec, offset, length in _INDEX_ENTRY.iter_unpack(data[:usable]):
+                self.index[digest] = (codec, offset, length)
+        self._runs: Optional[List[Dict[str, str]]] = None
+
+    def _compress(self, data: bytes) -> Tuple[int, bytes]:
+        if zstandard is not None:
+            return CODEC_ZSTD, zstandard.ZstdCompressor(level=10).compress(data)
+        return CODEC_GZIP, gzip.compress(data, compresslevel=9, mtime=0)
+
+    def put(self, report: ComplianceReport, entity: str, run_id: Optional[str] = None) -> Tuple[str, bool]:
+        """Archive a run; returns (body hash, whether the body was new)."""
+        digest, data = body_digest(report_body(report))
+        is_new = digest not in self.index
+        if is_new:
+            codec, blob = self._compress(data)
+            with open(os.path.join(self.path, PACK_FILE), "ab") as f:
+                offset = f.tell()
+                f.write(blob)
+            # The pack is written before the index, so an index entry never points at missing bytes
+            with open(os.path.join(self.path, INDEX_FILE), "ab") as f:
+                f.write(_INDEX_ENTRY.pack(digest, codec, offset, len(blob)))
+            self.index[digest] = (codec, offset, len(blob))
+        run = {
+            "entity": entity,
+            "run_id": run_id or report.evaluation_timestamp,
+            "evaluation_timestamp": report.evaluation_timestamp,
+            "body": digest.hex(),
+        }
+        with open(os.path.join(self.path, RUNS_FILE), "a", encoding="utf-8") as f:
+            f.write(json.dumps(run, sort_keys=True) + "\n")
+        if self._runs is not None:
+            self._runs.append(run)
+        return digest.hex(), is_new
+
+    def body(self, digest_hex: str) -> Dict[str, Any]:
+        entry = self.index.get(bytes.fromhex(digest_hex))
+        if entry is None:
+            raise ArchiveError(f"No report body {digest_hex} in {self.path}")
+        codec, offset, length = entry
+        with open(os.path.join(self.path, PACK_FILE), "rb") as f:
+            f.seek(offset)
+            blob = f.read(length)
+        if codec == CODEC_ZSTD:
+            if zstandard is None:
+                raise ArchiveError("Report body is zstd-compressed but zstandard is not installed")
+            data = zstandard.ZstdDecompressor().decompress(blob)
+        else:
+            data = gzip.decompress(blob)
+        return json.loads(data)
+
+    def runs(self, entity: Optional[str] = None) -> List[Dict[str, str]]:
+        if self._runs is None:
+            self._runs = []
+            runs_path = os.path.join(self.path, RUNS_FILE)
+            if os.path.exists(runs_path):
+                with open(runs_path, "r", encoding="utf-8") as f:
+                    self._runs = [json.loads(line) for line in f if line.strip()]
+        return [r for r in self._runs if entity is None or r["entity"] == entity]
+
+    def get(self, entity: str, run_id: Optional[str] = None) -> ComplianceReport:
+        """Rebuild a stored run (the latest one for the entity when run_id is omitted)."""
+        from .report_serializer import report_from_dict
+        runs = [r for r in self.runs(entity) if run_id is None or r["run_id"] == run_id]
+        if not runs:
+            raise ArchiveError(f"No archived run for {entity}" + (f" / {run_id}" if run_id else ""))
+        run = runs[-1]
+        raw = self.body(run["body"])
+        raw["evaluation_timestamp"] = run["evaluation_timestamp"]
+        return report_from_dict(raw)
+
+    def stats(self) -> Dict[str, int]:
+        pack_path = os.path.join(self.path, PACK_FILE)
+        return {
+            "runs": len(self.runs()),
+            "unique_bodies": len(self.index),
+            "pack_bytes": os.path.getsize(pack_path) if os.path.exists(pack_path) else 0,
+        }
@@ -1,8 +1,69 @@
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from typing import Callable, Optional, Union
 from .report_models import Summary, DomainSummary, ControlResult, ComplianceReport
 
-def build_report(registry_version: str, engine_version: str, evaluation_result) -> ComplianceReport:
-    timestamp = datetime.now(timezone.utc).isoformat()
+ENGINE_VERSION = "1.1"
+
+def utc_now() -> datetime:
+    return datetime.now(timezone.utc)
+
+def parse_timestamp(value: str) -> datetime:
+    """ISO-8601 timestamp; a trailing Z and naive values are taken as UTC."""
+    if value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+class FixedClock:
+    """A clock that always returns the same instant (picklable, unlike a lambda)."""
+
+    def __init__(self, instant: datetime):
+        self.instant = instant
+
+    def __call__(self) -> datetime:
+        return self.instant
+
+@dataclass(frozen=True)
+class ReportContext:
+    """
+    Per-run inputs to report building that are not part of the evaluation:
+    where timestamps come from, the engine version and the run ID.
+    """
+    engine_version: str = ENGINE_VERSION
+    run_id: Optional[str] = None
+    clock: Callable[[], datetime] = field(default=utc_now, compare=False)
+
+    @classmethod
+    def frozen(cls, timestamp: Union[str, datetime], **kwargs) -> "ReportContext":
+        if isinstance(timestamp, str):
+            timestamp = parse_timestamp(timestamp)
+        return cls(clock=FixedClock(timestamp), **kwargs)
+
+    @classmethod
+    def for_run(cls, timestamp: Optional[Union[str, datetime]] = None, **kwargs) -> "ReportContext":
+        """Every report in the run gets the same timestamp: the given one, or now."""
+        return cls.frozen(timestamp if timestamp is not None else utc_now(), **kwargs)
+
+    def timestamp(self) -> str:
+        return self.clock().isoformat()
+
+def build_report(registry_version: str, engine_version: Optional[str], evaluation_result,
+                 context: Optional[ReportContext] = None) -> ComplianceReport:
+    """
+    The context is the one source of the engine version. engine_version is
+    kept for compatibility: None defers to the context, any other value
+    must agree with it (and sets it when no context is given).
+    """
+    if context is None:
+        context = ReportContext() if engine_version is None else ReportContext(engine_version=engine_version)
+    elif engine_version is not None and engine_version != context.engine_version:
+        raise ValueError(
+            f"engine_version {engine_version!r} does not match the report context's {context.engine_version!r}"
+        )
+    timestamp = context.timestamp()
     summary = Summary(
         applicable_controls=evaluation_result['total_applicable'],
         compliant=evaluation_result['total_compliant'],
@@ -31,7 +92,7 @@ def build_report(registry_version: str, engine_version: str, evaluation_result)
         key=lambda x: x.control_id
     )
     return ComplianceReport(
-        engine_version=engine_version,
+        engine_version=context.engine_version,
         registry_version=registry_version,
         evaluation_timestamp=timestamp,
         summary=summary,
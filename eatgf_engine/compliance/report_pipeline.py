@@ -0,0 +1,76 @@
+import hashlib
+import json
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .report_builder import ReportContext, build_report
+from .report_serializer import report_json
+
+INDEX_FILE = "index.json"
+_UNSAFE = re.compile(r"[^A-Za-z0-9._-]")
+
+
+def report_filename(entity: str) -> str:
+    return _UNSAFE.sub("_", entity) + ".json"
+
+
+def _write_one(job: Tuple[str, str, Dict[str, Any], str, ReportContext]) -> Dict[str, Any]:
+    entity, output_dir, evaluation_result, registry_version, context = job
+    report = build_report(registry_version, context.engine_version, evaluation_result, context=context)
+    data = report_json(report).encode("utf-8")
+    name = report_filename(entity)
+    path = os.path.join(output_dir, name)
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+    return {
+        "entity": entity,
+        "file": name,
+        "sha256": hashlib.sha256(data).hexdigest(),
+        "compliance_score_percent": report.summary.compliance_score_percent,
+    }
+
+
+def write_reports(results: Iterable[Tuple[str, Dict[str, Any]]], output_dir: str, registry_version: str,
+                  context: Optional[ReportContext] = None, workers: int = 1,
+                  chunksize: int = 64) -> List[Dict[str, Any]]:
+    """
+    Build and serialize one report per (entity, evaluate_compliance result)
+    on a process pool. File names, file contents and the combined index
+    (sorted by entity) are the same for any worker count or completion order.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    # One timestamp for the whole run, so output never depends on when a worker got to it
+    context = context or ReportContext()
+    context = ReportContext.frozen(context.clock(), engine_version=context.engine_version, run_id=context.run_id)
+    timestamp = context.timestamp()
+    jobs = []
+    names: Dict[str, str] = {INDEX_FILE: "the run index"}
+    for entity, result in results:
+        name = report_filename(entity)
+        if name in names:
+            raise ValueError(f"Entity {entity!r} maps to report file {name}, already used by {names[name]}")
+        names[name] = entity
+        jobs.append((entity, output_dir, result, registry_version, context))
+
+    if workers <= 1:
+        entries = [_write_one(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            # map yields in submission order, whatever order the workers finish in
+            entries = list(pool.map(_write_one, jobs, chunksize=chunksize))
+
+    entries.sort(key=lambda e: e["entity"])
+    index = {
+        "registry_version": registry_version,
+        "engine_version": context.engine_version,
+        "evaluation_timestamp": timestamp,
+        "run_id": context.run_id,
+        "reports": entries,
+    }
+    with open(os.path.join(output_dir, INDEX_FILE), "w", encoding="utf-8") as f:
+        json.dump(index, f, indent=2, sort_keys=True)
+    return entries
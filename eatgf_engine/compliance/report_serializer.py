@@ -1,11 +1,37 @@
 import json
 from dataclasses import asdict
 
+from .report_models import Summary, DomainSummary, ControlResult, ComplianceReport
+
+def report_json(report) -> str:
+    return json.dumps(
+        asdict(report),
+        indent=2,
+        sort_keys=True
+    )
+
 def serialize_report(report, output_path: str):
     with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(
-            asdict(report),
-            f,
-            indent=2,
-            sort_keys=True
-        )
+        f.write(report_json(report))
+
+def archive_report(report, archive_path: str, entity: str, run_id: str = None):
+    """Archive mode: store the report body once per content hash instead of a full JSON file per run."""
+    from .report_archive import ReportArchive
+    return ReportArchive(archive_path).put(report, entity, run_id)
+
+def report_from_dict(raw: dict) -> ComplianceReport:
+    return ComplianceReport(
+        engine_version=raw["engine_version"],
+        registry_version=raw["registry_version"],
+        evaluation_timestamp=raw["evaluation_timestamp"],
+        summary=Summary(**raw["summary"]),
+        domain_breakdown={
+            domain: DomainSummary(**data)
+            for domain, data in raw["domain_breakdown"].items()
+        },
+        controls=[ControlResult(**c) for c in raw["controls"]],
+    )
+
+def load_report(input_path: str) -> ComplianceReport:
+    with open(input_path, "r", encoding="utf-8") as f:
+        return report_from_dict(json.load(f))
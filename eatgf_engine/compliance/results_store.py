@@ -0,0 +1,196 @@
+import sqlite3
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .report_models import ComplianceReport
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    entity TEXT NOT NULL,
+    run_id TEXT NOT NULL,
+    evaluated_at TEXT NOT NULL,
+    engine_version TEXT NOT NULL,
+    registry_version TEXT NOT NULL,
+    applicable_controls INTEGER NOT NULL,
+    compliant INTEGER NOT NULL,
+    non_compliant INTEGER NOT NULL,
+    partial INTEGER NOT NULL,
+    not_tested INTEGER NOT NULL,
+    compliance_score_percent REAL NOT NULL,
+    UNIQUE (entity, run_id)  -- also serves as the (entity, run) index
+);
+CREATE TABLE IF NOT EXISTS domain_summaries (
+    run INTEGER NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+    domain TEXT NOT NULL,
+    applicable INTEGER NOT NULL,
+    score_percent REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS control_results (
+    run INTEGER NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+    control_id TEXT NOT NULL,
+    domain TEXT NOT NULL,
+    status TEXT NOT NULL,
+    applicable INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_runs_evaluated_at ON runs (evaluated_at);
+CREATE INDEX IF NOT EXISTS idx_runs_entity_evaluated_at ON runs (entity, evaluated_at);
+CREATE INDEX IF NOT EXISTS idx_control_results_control_status ON control_results (control_id, status);
+CREATE INDEX IF NOT EXISTS idx_control_results_run ON control_results (run);
+CREATE INDEX IF NOT EXISTS idx_control_results_domain ON control_results (domain);
+CREATE INDEX IF NOT EXISTS idx_domain_summaries_domain ON domain_summaries (domain);
+CREATE INDEX IF NOT EXISTS idx_domain_summaries_run ON domain_summaries (run);
+"""
+
+class ResultsStore:
+    """
+    Local SQLite store of compliance reports across entities and runs.
+    The run-level Summary is stored on the runs row; DomainSummary and
+    ControlResult rows reference it.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA foreign_keys = ON")
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        self.conn.execute("PRAGMA synchronous = NORMAL")
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def add_report(self, report: ComplianceReport, entity: str, run_id: str):
+        self.add_reports([(entity, run_id, report)])
+
+    def add_reports(self, items: Iterable[Tuple[str, str, ComplianceReport]], batch_size: int = 500) -> int:
+        """
+        Insert (entity, run_id, report) items, one transaction per batch.
+        Re-adding an existing (entity, run_id) replaces its rows.
+        """
+        count = 0
+        batch = []
+        for item in items:
+            batch.append(item)
+            if len(batch) >= batch_size:
+                count += self._insert_batch(batch)
+                batch = []
+        if batch:
+            count += self._insert_batch(batch)
+        return count
+
+    def _insert_batch(self, batch: List[Tuple[str, str, ComplianceReport]]) -> int:
+        with self.conn:
+            cur = self.conn.cursor()
+            domain_rows = []
+            control_rows = []
+            for entity, run_id, report in batch:
+                cur.execute("DELETE FROM runs WHERE entity = ? AND run_id = ?", (entity, run_id))
+                s = report.summary
+                cur.execute(
+                    "INSERT INTO runs (entity, run_id, evaluated_at, engine_version, registry_version, "
+                    "applicable_controls, compliant, non_compliant, partial, not_tested, compliance_score_percent) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        entity, run_id, report.evaluation_timestamp, report.engine_version, report.registry_version,
+                        s.applicable_controls, s.compliant, s.non_compliant, s.partial, s.not_tested,
+                        s.compliance_score_percent,
+                    ),
+                )
+                run = cur.lastrowid
+                domain_rows.extend(
+                    (run, domain, d.applicable, d.score_percent)
+                    for domain, d in report.domain_breakdown.items()
+                )
+                control_rows.extend(
+                    (run, c.control_id, c.domain, c.status, int(c.applicable))
+                    for c in report.controls
+                )
+            cur.executemany(
+                "INSERT INTO domain_summaries (run, domain, applicable, score_percent) VALUES (?, ?, ?, ?)",
+                domain_rows,
+            )
+            cur.executemany(
+                "INSERT INTO control_results (run, control_id, domain, status, applicable) VALUES (?, ?, ?, ?, ?)",
+                control_rows,
+            )
+        return len(batch)
+
+    @staticmethod
+    def _window(since: Optional[str], until: Optional[str], params: list, alias: str = "r") -> str:
+        # ISO-8601 timestamps compare correctly as strings; since is inclusive, until exclusive
+        clause = ""
+        if since:
+            clause += f" AND {alias}.evaluated_at >= ?"
+            params.append(since)
+        if until:
+            clause += f" AND {alias}.evaluated_at < ?"
+            params.append(until)
+        return clause
+
+    def _latest_filter(self, latest: bool, since: Optional[str], until: Optional[str], params: list) -> str:
+        # Restrict to each entity's most recent run inside the window. Runs with
+        # the same timestamp (e.g. frozen with --timestamp) go by insertion order.
+        if not latest:
+            return ""
+        return (
+            " AND r.id = (SELECT r2.id FROM runs r2"
+            " WHERE r2.entity = r.entity" + self._window(since, until, params, alias="r2") +
+            " ORDER BY r2.evaluated_at DESC, r2.id DESC LIMIT 1)"
+        )
+
+    def entities_with_status(self, control_id: str, status: str, since: Optional[str] = None,
+                             until: Optional[str] = None, latest: bool = False) -> List[Tuple[str, str, str]]:
+        """(entity, run_id, evaluated_at) rows where control_id had status."""
+        params: list = [control_id, status]
+        sql = (
+            "SELECT r.entity, r.run_id, r.evaluated_at FROM control_results c"
+            " JOIN runs r ON r.id = c.run"
+            " WHERE c.control_id = ? AND c.status = ?"
+        )
+        sql += self._window(since, until, params)
+        sql += self._latest_filter(latest, since, until, params)
+        sql += " ORDER BY r.entity, r.evaluated_at, r.run_id"
+        return self.conn.execute(sql, params).fetchall()
+
+    def status_counts(self, control_id: str, since: Optional[str] = None,
+                      until: Optional[str] = None, latest: bool = False) -> Dict[str, int]:
+        params: list = [control_id]
+        sql = (
+            "SELECT c.status, COUNT(*) FROM control_results c"
+            " JOIN runs r ON r.id = c.run"
+            " WHERE c.control_id = ?"
+        )
+        sql += self._window(since, until, params)
+        sql += self._latest_filter(latest, since, until, params)
+        sql += " GROUP BY c.status ORDER BY c.status"
+        return dict(self.conn.execute(sql, params).fetchall())
+
+    def domain_scores(self, domain: str, since: Optional[str] = None, until: Optional[str] = None,
+                      latest: bool = False) -> List[Tuple[str, str, str, int, float]]:
+        """(entity, run_id, evaluated_at, applicable, score_percent) rows for a domain."""
+        params: list = [domain]
+        sql = (
+            "SELECT r.entity, r.run_id, r.evaluated_at, d.applicable, d.score_percent FROM domain_summaries d"
+            " JOIN runs r ON r.id = d.run"
+            " WHERE d.domain = ?"
+        )
+        sql += self._window(since, until, params)
+        sql += self._latest_filter(latest, since, until, params)
+        sql += " ORDER BY r.entity, r.evaluated_at, r.run_id"
+        return self.conn.execute(sql, params).fetchall()
+
+    def runs(self, entity: Optional[str] = None) -> List[Tuple[str, str, str, float]]:
+        """(entity, run_id, evaluated_at, compliance_score_percent) rows."""
+        sql = "SELECT entity, run_id, evaluated_at, compliance_score_percent FROM runs"
+        params: list = []
+        if entity:
+            sql += " WHERE entity = ?"
+            params.append(entity)
+        sql += " ORDER BY entity, evaluated_at, run_id"
+        return self.conn.execute(sql, params).fetchall()
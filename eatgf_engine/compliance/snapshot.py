@@ -0,0 +1,194 @@
+import struct
+import zlib
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
+
+from .report_models import ComplianceReport
+
+# One byte per control; order is the registry's canonical (sorted control_id) order.
+STATUS_CODES = {
+    "NOT_APPLICABLE": 0,
+    "COMPLIANT": 1,
+    "NON_COMPLIANT": 2,
+    "PARTIAL": 3,
+    "NOT_TESTED": 4,
+}
+STATUS_NAMES = {code: name for name, code in STATUS_CODES.items()}
+
+_MAGIC = b"EATS"
+_FORMAT_VERSION = 1
+# magic, format version, order fingerprint, control count, len(registry_version), len(timestamp)
+_HEADER = struct.Struct("<4sBIIBB")
+_RECORD_LEN = struct.Struct("<I")
+
+
+class SnapshotError(ValueError):
+    pass
+
+
+class ControlIndex:
+    """
+    Canonical control order for a registry version. Snapshots store only
+    status codes in this order, plus a fingerprint of the order itself.
+    """
+
+    def __init__(self, registry_version: str, domains: Dict[str, str]):
+        self.registry_version = registry_version
+        self.control_ids: List[str] = sorted(domains)
+        self.domains: List[str] = [domains[cid] for cid in self.control_ids]
+        self.position: Dict[str, int] = {cid: i for i, cid in enumerate(self.control_ids)}
+        joined = "\n".join(f"{cid}\t{d}" for cid, d in zip(self.control_ids, self.domains))
+        self.fingerprint = zlib.crc32(joined.encode("utf-8"))
+
+    @classmethod
+    def from_registry(cls, registry) -> "ControlIndex":
+        return cls(registry.version, {cid: ctrl.domain for cid, ctrl in registry.controls.items()})
+
+    def __len__(self):
+        return len(self.control_ids)
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    registry_version: str
+    order_fingerprint: int
+    evaluated_at: str
+    statuses: bytes
+
+    def to_bytes(self) -> bytes:
+        version = self.registry_version.encode("utf-8")
+        timestamp = self.evaluated_at.encode("utf-8")
+        header = _HEADER.pack(
+            _MAGIC, _FORMAT_VERSION, self.order_fingerprint, len(self.statuses), len(version), len(timestamp)
+        )
+        return header + version + timestamp + self.statuses
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "Snapshot":
+        if len(data) < _HEADER.size:
+            raise SnapshotError("Truncated snapshot")
+        magic, fmt, fingerprint, count, version_len, ts_len = _HEADER.unpack_from(data)
+        if magic != _MAGIC or fmt != _FORMAT_VERSION:
+            raise SnapshotError("Not an EATGF snapshot (bad magic or format version)")
+        pos = _HEADER.size
+        version = data[pos:pos + version_len].decode("utf-8")
+        pos += version_len
+        timestamp = data[pos:pos + ts_len].decode("utf-8")
+        pos += ts_len
+        statuses = bytes(data[pos:pos + count])
+        if len(statuses) != count:
+            raise SnapshotError("Truncated snapshot")
+        return cls(version, fingerprint, timestamp, statuses)
+
+
+def snapshot_report(report: ComplianceReport, index: ControlIndex) -> Snapshot:
+    if report.registry_version != index.registry_version:
+        raise SnapshotError(
+            f"Report registry version {report.registry_version} does not match index version {index.registry_version}"
+        )
+    statuses = bytearray(len(index))
+    seen = 0
+    for ctrl in report.controls:
+        pos = index.position.get(ctrl.control_id)
+        if pos is None:
+            raise SnapshotError(f"Report control {ctrl.control_id} is not in registry {index.registry_version}")
+        if ctrl.status not in STATUS_CODES:
+            raise SnapshotError(f"Invalid status '{ctrl.status}' for control {ctrl.control_id}")
+        statuses[pos] = STATUS_CODES[ctrl.status]
+        seen += 1
+    if seen != len(index):
+        raise SnapshotError(f"Report covers {seen} of {len(index)} registry controls")
+    return Snapshot(index.registry_version, index.fingerprint, report.evaluation_timestamp, bytes(statuses))
+
+
+def append_snapshot(path: str, snapshot: Snapshot):
+    """Append a length-prefixed snapshot record to a history file."""
+    record = snapshot.to_bytes()
+    with open(path, "ab") as f:
+        f.write(_RECORD_LEN.pack(len(record)) + record)
+
+
+def read_snapshots(path: str) -> List[Snapshot]:
+    with open(path, "rb") as f:
+        data = f.read()
+    snapshots = []
+    pos = 0
+    while pos < len(data):
+        (length,) = _RECORD_LEN.unpack_from(data, pos)
+        pos += _RECORD_LEN.size
+        snapshots.append(Snapshot.from_bytes(data[pos:pos + length]))
+        pos += length
+    return snapshots
+
+
+@dataclass(frozen=True)
+class DomainDelta:
+    score_before: float
+    score_after: float
+    score_delta: float
+
+
+@dataclass(frozen=True)
+class ReportDelta:
+    evaluated_before: str
+    evaluated_after: str
+    score_before: float
+    score_after: float
+    score_delta: float
+    transitions: List[Tuple[str, str, str]]  # (control_id, from_status, to_status)
+    transition_counts: Dict[str, int]  # "FROM->TO" -> count
+    domain_deltas: Dict[str, DomainDelta]
+
+
+def _scores(statuses: bytes, index: ControlIndex):
+    # Same count-based scoring as the evaluator: compliant / applicable
+    applicable = compliant = 0
+    domain_counts: Dict[str, List[int]] = {}
+    na = STATUS_CODES["NOT_APPLICABLE"]
+    ok = STATUS_CODES["COMPLIANT"]
+    for code, domain in zip(statuses, index.domains):
+        if code == na:
+            continue
+        counts = domain_counts.setdefault(domain, [0, 0])
+        counts[0] += 1
+        applicable += 1
+        if code == ok:
+            counts[1] += 1
+            compliant += 1
+    total = round(compliant / applicable * 100, 1) if applicable else 0.0
+    domains = {d: round(c / a * 100, 1) if a else 0.0 for d, (a, c) in domain_counts.items()}
+    return total, domains
+
+
+def diff_snapshots(before: Snapshot, after: Snapshot, index: ControlIndex) -> ReportDelta:
+    for snap in (before, after):
+        if snap.order_fingerprint != index.fingerprint or len(snap.statuses) != len(index):
+            raise SnapshotError("Snapshot was taken against a different registry control order")
+    transitions = []
+    counts: Dict[str, int] = {}
+    for pos, (old, new) in enumerate(zip(before.statuses, after.statuses)):
+        if old != new:
+            change = (index.control_ids[pos], STATUS_NAMES[old], STATUS_NAMES[new])
+            transitions.append(change)
+            key = f"{change[1]}->{change[2]}"
+            counts[key] = counts.get(key, 0) + 1
+    score_before, domains_before = _scores(before.statuses, index)
+    score_after, domains_after = _scores(after.statuses, index)
+    domain_deltas = {
+        d: DomainDelta(
+            score_before=domains_before.get(d, 0.0),
+            score_after=domains_after.get(d, 0.0),
+            score_delta=round(domains_after.get(d, 0.0) - domains_before.get(d, 0.0), 1),
+        )
+        for d in sorted(set(domains_before) | set(domains_after))
+    }
+    return ReportDelta(
+        evaluated_before=before.evaluated_at,
+        evaluated_after=after.evaluated_at,
+        score_before=score_before,
+        score_after=score_after,
+        score_delta=round(score_after - score_before, 1),
+        transitions=transitions,
+        transition_counts=dict(sorted(counts.items())),
+        domain_deltas=domain_deltas,
+    )
@@ -1,6 +1,12 @@
-from typing import Dict, Any, Set
+from typing import Dict, Any, FrozenSet, Set, Tuple
 from eatgf_engine.registry.models import Control
 
+# Org profile fields read by is_control_applicable
+PROFILE_FIELDS = ("environment", "ai_usage", "apis_exposed")
+
+# For v1.1 the API trigger only applies to this control
+API_TRIGGER_CONTROL = "EATGF-API-SEC-01"
+
 def is_control_applicable(control: Control, org_profile: Dict[str, Any]) -> bool:
     # Environment check
     env = org_profile.get("environment")
@@ -12,11 +18,68 @@ def is_control_applicable(control: Control, org_profile: Dict[str, Any]) -> bool
         if not ai_flag:
             return False
     # API trigger (future)
-    # For v1.1, ignore unless control_id == "EATGF-API-SEC-01"
-    if control.control_id == "EATGF-API-SEC-01":
+    # For v1.1, ignore unless control_id == API_TRIGGER_CONTROL
+    if control.control_id == API_TRIGGER_CONTROL:
         if not org_profile.get("apis_exposed", False):
             return False
     return True
 
 def get_applicable_controls(controls: Dict[str, Control], org_profile: Dict[str, Any]) -> Set[str]:
     return {cid for cid, ctrl in controls.items() if is_control_applicable(ctrl, org_profile)}
+
+def field_dependents(controls: Dict[str, Control]) -> Dict[str, Set[str]]:
+    """
+    The controls whose applicability can change when each profile field
+    changes. Must mirror the checks in is_control_applicable.
+    """
+    return {
+        "environment": set(controls),
+        "ai_usage": {cid for cid, c in controls.items() if c.applicability.ai_usage == "Conditional"},
+        "apis_exposed": {cid for cid in controls if cid == API_TRIGGER_CONTROL},
+    }
+
+def applicability_fields(controls: Dict[str, Control]) -> Tuple[str, ...]:
+    """The org profile fields that can change applicability for this registry."""
+    dependents = field_dependents(controls)
+    return tuple(f for f in PROFILE_FIELDS if f == "environment" or dependents[f])
+
+def profile_value(org_profile: Dict[str, Any], field: str) -> Any:
+    # Flags are only tested for truthiness in is_control_applicable, so normalize them
+    value = org_profile.get(field)
+    return value if field == "environment" else bool(value)
+
+def applicability_signature(org_profile: Dict[str, Any], fields: Tuple[str, ...]) -> Tuple[Any, ...]:
+    return tuple(profile_value(org_profile, f) for f in fields)
+
+class ApplicabilityCache:
+    """
+    Applicable-control sets shared across org profiles with the same
+    applicability signature, for batch evaluation.
+    """
+
+    def __init__(self, controls: Dict[str, Control]):
+        self.controls = controls
+        self.fields = applicability_fields(controls)
+        self._sets: Dict[Tuple[Any, ...], FrozenSet[str]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, org_profile: Dict[str, Any]) -> FrozenSet[str]:
+        signature = applicability_signature(org_profile, self.fields)
+        applicable = self._sets.get(signature)
+        if applicable is None:
+            self.misses += 1
+            applicable = self._sets[signature] = frozenset(get_applicable_controls(self.controls, org_profile))
+        else:
+            self.hits += 1
+        return applicable
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "fields": list(self.fields),
+            "signatures": len(self._sets),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+        }
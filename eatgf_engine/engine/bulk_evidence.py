@@ -0,0 +1,122 @@
+import csv
+import json
+from itertools import islice
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from .evidence_loader import EvidenceValidationError, validate_evidence_record
+
+REQUIRED_COLUMNS = ("entity", "control_id", "status")
+DEFAULT_CHUNK_SIZE = 10000
+
+# (line number, entity, control_id, status, evidence_metrics)
+Row = Tuple[int, str, str, Any, Any]
+
+
+def _detect_format(path: str) -> str:
+    lower = path.lower()
+    if lower.endswith(".csv"):
+        return "csv"
+    if lower.endswith((".jsonl", ".ndjson")):
+        return "jsonl"
+    raise EvidenceValidationError(f"Cannot infer bulk evidence format from {path} (expected .csv or .jsonl)")
+
+
+def _metric_value(text: str):
+    try:
+        return int(text)
+    except ValueError:
+        pass
+    try:
+        return float(text)
+    except ValueError:
+        return text
+
+
+def _csv_rows(f, path: str) -> Iterator[Row]:
+    """
+    CSV columns: entity, control_id, status, then either an
+    evidence_metrics column holding a JSON object or one column per
+    metric (empty cells are omitted).
+    """
+    reader = csv.reader(f)
+    header = next(reader, None)
+    if header is None:
+        return
+    missing = [c for c in REQUIRED_COLUMNS if c not in header]
+    if missing:
+        raise EvidenceValidationError(f"{path}: missing column(s): {', '.join(missing)}")
+    ie, ic, is_ = (header.index(c) for c in REQUIRED_COLUMNS)
+    im = header.index("evidence_metrics") if "evidence_metrics" in header else None
+    metric_cols = [(i, name) for i, name in enumerate(header) if name not in REQUIRED_COLUMNS and i != im]
+    for row in reader:
+        line = reader.line_num
+        if not row:
+            continue
+        try:
+            entity, control_id, status = row[ie], row[ic], row[is_]
+        except IndexError:
+            raise EvidenceValidationError(f"{path}:{line}: expected {len(header)} columns, got {len(row)}")
+        if im is not None and row[im]:
+            try:
+                metrics = json.loads(row[im])
+            except json.JSONDecodeError as e:
+                raise EvidenceValidationError(f"{path}:{line}: entity {entity}: invalid evidence_metrics JSON: {e}")
+        elif metric_cols:
+            metrics = {name: _metric_value(row[i]) for i, name in metric_cols if i < len(row) and row[i] != ""}
+            metrics = metrics or None
+        else:
+            metrics = None
+        yield line, entity, control_id, status, metrics
+
+
+def _jsonl_rows(f, path: str) -> Iterator[Row]:
+    for line, text in enumerate(f, 1):
+        if not text.strip():
+            continue
+        try:
+            record = json.loads(text)
+        except json.JSONDecodeError as e:
+            raise EvidenceValidationError(f"{path}:{line}: invalid JSON: {e}")
+        if not isinstance(record, dict) or "entity" not in record or "control_id" not in record:
+            raise EvidenceValidationError(f"{path}:{line}: expected an object with entity and control_id")
+        yield line, record["entity"], record["control_id"], record.get("status"), record.get("evidence_metrics")
+
+
+def iter_evidence_chunks(path: str, fmt: Optional[str] = None,
+                         chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[List[Row]]:
+    """Stream raw rows from a multi-entity CSV or JSON Lines export in chunks."""
+    fmt = fmt or _detect_format(path)
+    if fmt not in ("csv", "jsonl"):
+        raise EvidenceValidationError(f"Unsupported bulk evidence format: {fmt}")
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        rows = _csv_rows(f, path) if fmt == "csv" else _jsonl_rows(f, path)
+        while True:
+            chunk = list(islice(rows, chunk_size))
+            if not chunk:
+                return
+            yield chunk
+
+
+def load_bulk_evidence(path: str, registry_controls: Dict[str, Any], fmt: Optional[str] = None,
+                       chunk_size: int = DEFAULT_CHUNK_SIZE,
+                       metrics_sink: Optional[Callable[[str, str, Optional[Dict[str, Any]]], None]] = None
+                       ) -> Dict[str, Dict[str, Any]]:
+    """
+    Validate and partition a bulk export into {entity: evidence}, where each
+    evidence dict has the same shape load_evidence returns. Errors are
+    EvidenceValidationError with the file, line and entity prepended.
+    """
+    control_ids = frozenset(registry_controls)
+    partitions: Dict[str, Dict[str, Any]] = {}
+    for chunk in iter_evidence_chunks(path, fmt, chunk_size):
+        for line, entity, control_id, status, metrics in chunk:
+            evidence = partitions.get(entity)
+            if evidence is None:
+                evidence = partitions[entity] = {}
+            try:
+                evidence[control_id] = validate_evidence_record(control_id, status, metrics, control_ids, evidence)
+            except EvidenceValidationError as e:
+                raise EvidenceValidationError(f"{path}:{line}: entity {entity}: {e}") from None
+            if metrics_sink is not None:
+                metrics_sink(entity, control_id, metrics)
+    return partitions
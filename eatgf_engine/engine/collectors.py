@@ -0,0 +1,120 @@
+import asyncio
+import json
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, Optional
+
+from .evidence_loader import EvidenceValidationError, validate_evidence_record
+
+DEFAULT_TIMEOUT = 30.0
+DEFAULT_CONCURRENCY = 8
+
+
+class EvidenceCollector(ABC):
+    """
+    A source of evidence. Subclasses implement collect() as an async
+    generator yielding {control_id: record} fragments; records have the
+    same shape as entries in an evidence JSON file.
+    """
+    name = "collector"
+    timeout: Optional[float] = None  # seconds; None uses the collect_evidence default
+
+    @abstractmethod
+    def collect(self) -> AsyncIterator[Dict[str, Dict[str, Any]]]:
+        ...
+
+
+class FileCollector(EvidenceCollector):
+    """Evidence JSON file in the load_evidence format, read off the event loop."""
+
+    def __init__(self, path: str, name: Optional[str] = None, timeout: Optional[float] = None):
+        self.path = path
+        self.name = name or path
+        self.timeout = timeout
+
+    def _read(self):
+        with open(self.path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    async def collect(self):
+        loop = asyncio.get_running_loop()
+        yield await loop.run_in_executor(None, self._read)
+
+
+@dataclass
+class CollectionResult:
+    evidence: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    sources: Dict[str, str] = field(default_factory=dict)  # control_id -> collector name
+    failures: Dict[str, str] = field(default_factory=dict)  # collector name -> reason
+    durations_ms: Dict[str, float] = field(default_factory=dict)
+
+
+async def collect_evidence(collectors: Iterable[EvidenceCollector], registry_controls: Dict[str, Any],
+                           concurrency: int = DEFAULT_CONCURRENCY, timeout: float = DEFAULT_TIMEOUT,
+                           metrics_sink: Optional[Callable[[str, Optional[Dict[str, Any]]], None]] = None
+                           ) -> CollectionResult:
+    """
+    Run collectors concurrently (at most `concurrency` at a time), validating
+    each fragment with the evidence-loader rules and merging it as it
+    arrives. A collector that times out or raises is recorded in
+    failures and the fragments it already delivered are kept; an
+    EvidenceValidationError (including a control reported by two sources)
+    cancels the remaining collectors and propagates.
+    """
+    collectors = list(collectors)
+    names = [c.name for c in collectors]
+    if len(set(names)) != len(names):
+        raise ValueError("Collector names must be unique")
+    result = CollectionResult()
+    semaphore = asyncio.Semaphore(concurrency)
+
+    def merge(name: str, fragment: Dict[str, Dict[str, Any]]):
+        for control_id, record in fragment.items():
+            try:
+                validated = validate_evidence_record(
+                    control_id, record.get("status"), record.get("evidence_metrics", None),
+                    registry_controls, result.evidence,
+                )
+            except EvidenceValidationError as e:
+                if control_id in result.sources:
+                    raise EvidenceValidationError(f"{name}: {e} (already provided by {result.sources[control_id]})") from None
+                raise EvidenceValidationError(f"{name}: {e}") from None
+            result.evidence[control_id] = validated
+            result.sources[control_id] = name
+            if metrics_sink is not None:
+                metrics_sink(control_id, validated["evidence_metrics"])
+
+    async def drain(collector: EvidenceCollector):
+        async for fragment in collector.collect():
+            merge(collector.name, fragment)
+
+    async def run(collector: EvidenceCollector):
+        limit = collector.timeout if collector.timeout is not None else timeout
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                await asyncio.wait_for(drain(collector), limit)
+            except asyncio.TimeoutError:
+                result.failures[collector.name] = f"timed out after {limit}s"
+            except EvidenceValidationError:
+                raise
+            except Exception as e:
+                result.failures[collector.name] = f"{type(e).__name__}: {e}"
+            finally:
+                result.durations_ms[collector.name] = (time.perf_counter() - start) * 1000
+
+    tasks = [asyncio.ensure_future(run(c)) for c in collectors]
+    try:
+        await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+    return result
+
+
+def collect_evidence_sync(collectors: Iterable[EvidenceCollector], registry_controls: Dict[str, Any],
+                          **kwargs) -> CollectionResult:
+    return asyncio.run(collect_evidence(collectors, registry_controls, **kwargs))
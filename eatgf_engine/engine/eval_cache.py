@@ -0,0 +1,140 @@
+import hashlib
+import json
+import os
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, replace
+from typing import Any, Dict, Optional, Tuple
+
+from eatgf_engine.compliance.report_builder import ReportContext, build_report
+from eatgf_engine.compliance.report_models import ComplianceReport
+from eatgf_engine.compliance.report_serializer import report_from_dict
+
+DEFAULT_MAX_ENTRIES = 1024
+
+
+def content_hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def file_hash(path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def profile_hash(org_profile: Dict[str, Any]) -> str:
+    # Canonical JSON, so key order and whitespace in the profile file don't matter
+    return content_hash(json.dumps(org_profile, sort_keys=True, separators=(",", ":")).encode("utf-8"))
+
+
+def evaluation_key(registry_hash: str, profile_hash: str, evidence_hash: str, engine_version: str) -> str:
+    return content_hash("\0".join((engine_version, registry_hash, profile_hash, evidence_hash)).encode("utf-8"))
+
+
+@dataclass(frozen=True)
+class CachedEvaluation:
+    summary: Dict[str, Any]  # evaluate_compliance result
+    report: ComplianceReport
+
+
+class EvaluationCache:
+    """
+    Evaluation results keyed by evaluation_key(): an in-memory LRU of
+    max_entries, backed by one JSON file per key in `directory` when given.
+    Disk hits are promoted into memory.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, directory: Optional[str] = None):
+        self.max_entries = max_entries
+        self.directory = directory
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._entries: "OrderedDict[str, CachedEvaluation]" = OrderedDict()
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], key + ".json")
+
+    def _remember(self, key: str, entry: CachedEvaluation):
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def get(self, key: str) -> Optional[CachedEvaluation]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.memory_hits += 1
+            return entry
+        if self.directory:
+            path = self._path(key)
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    raw = json.load(f)
+            except (OSError, ValueError):
+                raw = None
+            if raw is not None:
+                entry = CachedEvaluation(summary=raw["summary"], report=report_from_dict(raw["report"]))
+                self._remember(key, entry)
+                self.disk_hits += 1
+                return entry
+        self.misses += 1
+        return None
+
+    def put(self, key: str, summary: Dict[str, Any], report: ComplianceReport) -> CachedEvaluation:
+        entry = CachedEvaluation(summary=summary, report=report)
+        self._remember(key, entry)
+        if self.directory:
+            path = self._path(key)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp = path + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({"summary": summary, "report": asdict(report)}, f, sort_keys=True)
+            os.replace(tmp, path)
+        return entry
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.memory_hits + self.disk_hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_ratio": (self.memory_hits + self.disk_hits) / lookups if lookups else 0.0,
+        }
+
+
+def evaluate_files(registry_path: str, org_profile_path: str, evidence_path: str,
+                   cache: EvaluationCache, context: Optional[ReportContext] = None) -> Tuple[CachedEvaluation, bool]:
+    """
+    load_registry/load_evidence/evaluate_compliance/build_report for one
+    entity, skipped entirely when the input hashes match a cached run.
+    On a hit the stored report is re-stamped with this run's timestamp.
+    Returns (evaluation, hit).
+    """
+    context = context or ReportContext()
+    with open(org_profile_path, "r", encoding="utf-8") as f:
+        org_profile = json.load(f)
+    key = evaluation_key(file_hash(registry_path), profile_hash(org_profile), file_hash(evidence_path),
+                         context.engine_version)
+    entry = cache.get(key)
+    if entry is not None:
+        return CachedEvaluation(entry.summary, replace(entry.report, evaluation_timestamp=context.timestamp())), True
+
+    from eatgf_engine.registry.loader import load_registry
+    from .evaluator import evaluate_compliance
+    from .evidence_loader import load_evidence
+    registry = load_registry(registry_path)
+    evidence = load_evidence(evidence_path, registry.controls)
+    summary = evaluate_compliance(registry.controls, org_profile, evidence)
+    report = build_report(registry.version, context.engine_version, summary, context=context)
+    return cache.put(key, summary, report), False
@@ -1,11 +1,13 @@
-from typing import Dict, Any
+from typing import Any, Dict, Iterable, Optional, Set, Tuple
 from eatgf_engine.registry.models import Control
-from .applicability import get_applicable_controls
+from .applicability import ApplicabilityCache, get_applicable_controls
 
 ALLOWED_STATUSES = {"COMPLIANT", "NON_COMPLIANT", "PARTIAL", "NOT_TESTED"}
 
-def evaluate_compliance(controls: Dict[str, Control], org_profile: Dict[str, Any], evidence: Dict[str, Any]):
-    applicable = get_applicable_controls(controls, org_profile)
+def evaluate_compliance(controls: Dict[str, Control], org_profile: Dict[str, Any], evidence: Dict[str, Any],
+                        applicable: Optional[Set[str]] = None):
+    if applicable is None:
+        applicable = get_applicable_controls(controls, org_profile)
     results = {}
     domain_counts = {}
     for cid, ctrl in controls.items():
@@ -46,3 +48,16 @@ def evaluate_compliance(controls: Dict[str, Control], org_profile: Dict[str, Any
         "compliance_percent": compliance_percent,
         "domain_breakdown": domain_breakdown
     }
+
+def evaluate_batch(controls: Dict[str, Control], entities: Iterable[Tuple[str, Dict[str, Any], Dict[str, Any]]],
+                   cache: Optional[ApplicabilityCache] = None) -> Dict[str, Dict[str, Any]]:
+    """
+    Evaluate (entity, org_profile, evidence) items, computing each distinct
+    applicability signature's control set once. Pass a cache to read its
+    hit-ratio stats afterwards or to share it across batches.
+    """
+    cache = cache or ApplicabilityCache(controls)
+    return {
+        entity: evaluate_compliance(controls, org_profile, evidence, applicable=cache.get(org_profile))
+        for entity, org_profile, evidence in entities
+    }
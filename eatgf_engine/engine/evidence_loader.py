@@ -1,27 +1,32 @@
-from typing import Dict, Any
+from typing import Any, Callable, Container, Dict, Optional
 
 ALLOWED_STATUSES = {"COMPLIANT", "NON_COMPLIANT", "PARTIAL", "NOT_TESTED"}
 
 class EvidenceValidationError(Exception):
     pass
 
-def load_evidence(evidence_path: str, registry_controls: Dict[str, Any]) -> Dict[str, Any]:
+def validate_evidence_record(control_id: str, status: Any, metrics: Any,
+                             registry_controls: Container[str], seen: Container[str]) -> Dict[str, Any]:
+    if control_id not in registry_controls:
+        raise EvidenceValidationError(f"Unknown control_id in evidence: {control_id}")
+    if control_id in seen:
+        raise EvidenceValidationError(f"Duplicate evidence entry for control_id: {control_id}")
+    if status not in ALLOWED_STATUSES:
+        raise EvidenceValidationError(f"Invalid status '{status}' for control {control_id}")
+    if metrics is not None and not isinstance(metrics, dict):
+        raise EvidenceValidationError(f"evidence_metrics must be dict or null for control {control_id}")
+    return {"status": status, "evidence_metrics": metrics}
+
+def load_evidence(evidence_path: str, registry_controls: Dict[str, Any],
+                  metrics_sink: Optional[Callable[[str, Optional[Dict[str, Any]]], None]] = None) -> Dict[str, Any]:
     import json
     with open(evidence_path, "r", encoding="utf-8") as f:
         raw = json.load(f)
-    seen = set()
     result = {}
     for control_id, record in raw.items():
-        if control_id not in registry_controls:
-            raise EvidenceValidationError(f"Unknown control_id in evidence: {control_id}")
-        if control_id in seen:
-            raise EvidenceValidationError(f"Duplicate evidence entry for control_id: {control_id}")
-        seen.add(control_id)
-        status = record.get("status")
-        if status not in ALLOWED_STATUSES:
-            raise EvidenceValidationError(f"Invalid status '{status}' for control {control_id}")
-        metrics = record.get("evidence_metrics", None)
-        if metrics is not None and not isinstance(metrics, dict):
-            raise EvidenceValidationError(f"evidence_metrics must be dict or null for control {control_id}")
-        result[control_id] = {"status": status, "evidence_metrics": metrics}
+        result[control_id] = validate_evidence_record(
+            control_id, record.get("status"), record.get("evidence_metrics", None), registry_controls, result
+        )
+        if metrics_sink is not None:
+            metrics_sink(control_id, result[control_id]["evidence_metrics"])
     return result
@@ -0,0 +1,159 @@
+import json
+import math
+from array import array
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pure-Python reducers are used instead
+    np = None
+
+GROUP_KEYS = ("domain", "environment", "control_id", "entity")
+DEFAULT_QUANTILES = (0.5, 0.95)
+
+
+class MetricsTable:
+    """
+    Columnar store of numeric evidence_metrics values. Each row is one
+    (entity, environment, domain, control_id, metric, value); string
+    columns are dictionary-encoded so grouped reductions run over flat
+    integer and float arrays.
+    """
+
+    def __init__(self):
+        self._strings: Dict[str, Dict[str, int]] = {k: {} for k in GROUP_KEYS + ("metric",)}
+        self._codes: Dict[str, array] = {k: array("i") for k in GROUP_KEYS + ("metric",)}
+        self.values = array("d")
+        self.skipped = 0  # non-numeric (including boolean) metric values
+
+    def __len__(self):
+        return len(self.values)
+
+    def _code(self, column: str, value: str) -> int:
+        table = self._strings[column]
+        code = table.get(value)
+        if code is None:
+            code = table[value] = len(table)
+        return code
+
+    def append(self, entity: str, environment: str, domain: str, control_id: str, metrics: Optional[Dict[str, Any]]):
+        if not metrics:
+            return
+        row = None
+        for name, value in metrics.items():
+            # bool is an int subclass, but True/False are flags, not measurements
+            if isinstance(value, bool) or not isinstance(value, (int, float)) or (
+                isinstance(value, float) and math.isnan(value)
+            ):
+                self.skipped += 1
+                continue
+            if row is None:
+                row = (
+                    self._code("domain", domain),
+                    self._code("environment", str(environment)),
+                    self._code("control_id", control_id),
+                    self._code("entity", entity),
+                )
+            for column, code in zip(GROUP_KEYS, row):
+                self._codes[column].append(code)
+            self._codes["metric"].append(self._code("metric", name))
+            self.values.append(float(value))
+
+    def collector(self, entity: str, org_profile: Dict[str, Any], controls: Dict[str, Any]) -> Callable[[str, Optional[Dict[str, Any]]], None]:
+        """Callback for load_evidence(..., metrics_sink=...) that tags rows with the entity's context."""
+        environment = org_profile.get("environment")
+
+        def sink(control_id: str, metrics: Optional[Dict[str, Any]]):
+            self.append(entity, environment, controls[control_id].domain, control_id, metrics)
+        return sink
+
+    def rollup(self, by: Optional[str] = "domain", quantiles: Sequence[float] = DEFAULT_QUANTILES) -> Dict[str, Any]:
+        """
+        Per-metric, per-group count/mean/min/max and quantiles (linear
+        interpolation, as numpy.percentile). by=None rolls up the whole table.
+        """
+        if by is not None and by not in GROUP_KEYS:
+            raise ValueError(f"Unknown group key '{by}' (expected one of {', '.join(GROUP_KEYS)})")
+        if by is None:
+            groups = array("i", bytes(len(self.values) * array("i").itemsize))
+            group_names = ["all"]
+        else:
+            groups = self._codes[by]
+            group_names = _names(self._strings[by])
+        metric_names = _names(self._strings["metric"])
+        reduce = _reduce_numpy if np is not None else _reduce_python
+        rows = reduce(self._codes["metric"], groups, self.values, max(len(group_names), 1), quantiles)
+
+        out: Dict[str, Dict[str, Dict[str, float]]] = {}
+        for metric, group, count, mean, lo, hi, qs in rows:
+            stats = {"count": count, "mean": mean, "min": lo, "max": hi}
+            for q, v in zip(quantiles, qs):
+                stats[_quantile_label(q)] = v
+            out.setdefault(metric_names[metric], {})[group_names[group]] = stats
+        return {
+            "group_by": by or "all",
+            "rows": len(self.values),
+            "skipped_values": self.skipped,
+            "metrics": {m: dict(sorted(g.items())) for m, g in sorted(out.items())},
+        }
+
+
+def _names(table: Dict[str, int]) -> List[str]:
+    names = [""] * len(table)
+    for name, code in table.items():
+        names[code] = name
+    return names
+
+
+def _quantile_label(q: float) -> str:
+    return "p" + format(q * 100, "g")
+
+
+def _reduce_numpy(metrics, groups, values, n_groups, quantiles):
+    if not len(values):
+        return []
+    v = np.asarray(values, dtype=np.float64)
+    key = np.asarray(metrics, dtype=np.int64) * n_groups + np.asarray(groups, dtype=np.int64)
+    order = np.lexsort((v, key))
+    key = key[order]
+    v = v[order]
+    starts = np.flatnonzero(np.r_[True, key[1:] != key[:-1]])
+    ends = np.r_[starts[1:], len(key)]
+    counts = ends - starts
+    means = np.add.reduceat(v, starts) / counts
+    qcols = []
+    for q in quantiles:
+        pos = starts + q * (counts - 1)
+        lo = np.floor(pos).astype(np.int64)
+        hi = np.minimum(lo + 1, ends - 1)
+        qcols.append(v[lo] + (v[hi] - v[lo]) * (pos - lo))
+    keys = key[starts]
+    return [
+        (int(k // n_groups), int(k % n_groups), int(c), float(m), float(v[s]), float(v[e - 1]),
+         [float(col[i]) for col in qcols])
+        for i, (k, c, m, s, e) in enumerate(zip(keys, counts, means, starts, ends))
+    ]
+
+
+def _reduce_python(metrics, groups, values, n_groups, quantiles):
+    buckets: Dict[Tuple[int, int], List[float]] = {}
+    for m, g, v in zip(metrics, groups, values):
+        buckets.setdefault((m, g), []).append(v)
+    rows = []
+    for (m, g), vs in sorted(buckets.items()):
+        vs.sort()
+        n = len(vs)
+        qs = []
+        for q in quantiles:
+            pos = q * (n - 1)
+            lo = int(pos)
+            hi = min(lo + 1, n - 1)
+            qs.append(vs[lo] + (vs[hi] - vs[lo]) * (pos - lo))
+        rows.append((m, g, n, sum(vs) / n, vs[0], vs[-1], qs))
+    return rows
+
+
+def write_rollups(table: MetricsTable, output_path: str, group_by: Sequence[Optional[str]] = ("domain", "environment")):
+    data = {"rollups": [table.rollup(by) for by in group_by]}
+    with open(output_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, sort_keys=True)
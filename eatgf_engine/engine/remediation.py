@@ -0,0 +1,119 @@
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from eatgf_engine.registry.models import Registry
+
+GAP_STATUSES = {"NON_COMPLIANT", "PARTIAL", "NOT_TESTED"}
+
+
+class RemediationError(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class RemediationItem:
+    control_id: str
+    domain: str
+    failing_entities: int
+    blocked_dependents: int  # applicable dependents summed over the failing entities
+    direct_dependents: int
+    transitive_dependents: int
+
+
+def _popcount(mask: int) -> int:
+    return bin(mask).count("1")
+
+
+class RemediationIndex:
+    """
+    Reverse `requires` indexes for a registry, computed once: for every
+    control, the bitmask of controls that depend on it directly or
+    transitively. Ranking a portfolio then only needs per-entity failure
+    counts, grouped by applicable-control set, instead of graph walks.
+    """
+
+    def __init__(self, registry: Registry):
+        self.registry_version = registry.version
+        self.control_ids: List[str] = sorted(registry.controls)
+        self.position: Dict[str, int] = {cid: i for i, cid in enumerate(self.control_ids)}
+        self.domains: Dict[str, str] = {cid: ctrl.domain for cid, ctrl in registry.controls.items()}
+        self.required_by: Dict[str, Tuple[str, ...]] = {
+            cid: registry.ids_by("required_by", cid) for cid in self.control_ids
+        }
+
+        # The requires graph is acyclic (detect_requires_cycles), so memoized DFS terminates
+        self.dependents: Dict[str, int] = {}
+        for cid in self.control_ids:
+            self._dependents_mask(cid)
+
+    def _dependents_mask(self, cid: str) -> int:
+        mask = self.dependents.get(cid)
+        if mask is None:
+            mask = 0
+            for dep in self.required_by[cid]:
+                mask |= (1 << self.position[dep]) | self._dependents_mask(dep)
+            self.dependents[cid] = mask
+        return mask
+
+    def _mask(self, control_ids: Iterable[str]) -> int:
+        mask = 0
+        for cid in control_ids:
+            mask |= 1 << self.position[cid]
+        return mask
+
+    def rank(self, portfolio: Iterable[Dict[str, str]], top: Optional[int] = None) -> List[RemediationItem]:
+        """
+        Rank failing controls (applicable and not COMPLIANT) by how many
+        applicable dependents they block across the portfolio. Each
+        portfolio entry is one entity's {control_id: status} map, and may
+        only name controls in this registry.
+        """
+        groups: Dict[FrozenSet[str], Counter] = {}
+        for statuses in portfolio:
+            unknown = statuses.keys() - self.position.keys()
+            if unknown:
+                raise RemediationError(
+                    f"Control {min(unknown)} is not in registry {self.registry_version}"
+                )
+            applicable = frozenset(cid for cid, s in statuses.items() if s != "NOT_APPLICABLE")
+            counter = groups.get(applicable)
+            if counter is None:
+                counter = groups[applicable] = Counter()
+            counter.update(cid for cid, s in statuses.items() if s in GAP_STATUSES)
+
+        failing: Counter = Counter()
+        blocked: Counter = Counter()
+        for applicable, counter in groups.items():
+            app_mask = self._mask(applicable)
+            for cid, n in counter.items():
+                failing[cid] += n
+                blocked[cid] += n * _popcount(self.dependents[cid] & app_mask)
+
+        items = [
+            RemediationItem(
+                control_id=cid,
+                domain=self.domains[cid],
+                failing_entities=failing[cid],
+                blocked_dependents=blocked[cid],
+                direct_dependents=len(self.required_by[cid]),
+                transitive_dependents=_popcount(self.dependents[cid]),
+            )
+            for cid in failing
+        ]
+        items.sort(key=lambda i: (-i.blocked_dependents, -i.failing_entities, i.control_id))
+        return items[:top] if top is not None else items
+
+
+def statuses_from_result(evaluation_result) -> Dict[str, str]:
+    """{control_id: status} from an evaluate_compliance result."""
+    return {cid: r["status"] for cid, r in evaluation_result["results"].items()}
+
+
+def statuses_from_report(report, index: Optional[RemediationIndex] = None) -> Dict[str, str]:
+    """{control_id: status} from a ComplianceReport, checked against index's registry version if given."""
+    if index is not None and report.registry_version != index.registry_version:
+        raise RemediationError(
+            f"Report registry version {report.registry_version} does not match registry version {index.registry_version}"
+        )
+    return {c.control_id: c.status for c in report.controls}
@@ -0,0 +1,207 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from eatgf_engine.registry.models import Control
+from .applicability import (
+    PROFILE_FIELDS,
+    ApplicabilityCache,
+    field_dependents,
+    is_control_applicable,
+    profile_value,
+)
+from .evaluator import ALLOWED_STATUSES, evaluate_compliance
+
+
+@dataclass
+class Scenario:
+    """
+    A what-if change applied to part of the portfolio: evidence status
+    overrides and/or org profile field changes, for entities matching
+    `where` (profile field values) and/or the explicit `entities` set.
+    """
+    name: str
+    status_overrides: Dict[str, str] = field(default_factory=dict)
+    profile_changes: Dict[str, Any] = field(default_factory=dict)
+    where: Dict[str, Any] = field(default_factory=dict)
+    entities: Optional[Set[str]] = None
+
+
+@dataclass
+class ScenarioResult:
+    name: str
+    entities_targeted: int
+    entities_changed: int
+    mean_score_before: float
+    mean_score_after: float
+    mean_score_delta: float
+    status_totals_before: Dict[str, int]
+    status_totals_after: Dict[str, int]
+    domain_scores: Dict[str, Tuple[float, float]]  # domain -> (before, after), pooled across entities
+    entity_scores: Dict[str, Tuple[float, float]]  # changed entities only: (before, after)
+
+
+class _EntityState:
+    __slots__ = ("profile", "evidence", "status", "counts", "domains", "score")
+
+    def __init__(self, profile, evidence, status, counts, domains):
+        self.profile = profile
+        self.evidence = evidence  # control_id -> evidence status
+        self.status = status  # applicable control_id -> effective status
+        self.counts = counts  # status -> count over applicable controls
+        self.domains = domains  # domain -> [applicable, compliant]
+        self.score = _score(counts)
+
+
+def _score(counts: Dict[str, int]) -> float:
+    applicable = sum(counts.values())
+    return (counts.get("COMPLIANT", 0) / applicable * 100) if applicable else 0.0
+
+
+class Portfolio:
+    """
+    Baseline evaluation of many entities, kept in a form that lets
+    scenarios be applied as deltas. A scenario only revisits targeted
+    entities, and within them only controls whose applicability depends
+    on a changed profile field or whose status is overridden.
+    """
+
+    def __init__(self, controls: Dict[str, Control], entities: Dict[str, Tuple[Dict[str, Any], Dict[str, Any]]]):
+        self.controls = controls
+        self.states: Dict[str, _EntityState] = {}
+        self.applicable_entities: Dict[str, Set[str]] = {cid: set() for cid in controls}
+        self._profile_index: Dict[Tuple[str, Any], Set[str]] = {}
+
+        # Controls whose applicability can change when a profile field changes
+        self.field_dependents: Dict[str, Set[str]] = field_dependents(controls)
+
+        cache = ApplicabilityCache(controls)
+        for entity, (org_profile, evidence) in entities.items():
+            result = evaluate_compliance(controls, org_profile, evidence, applicable=cache.get(org_profile))
+            status = {}
+            counts: Dict[str, int] = {}
+            domains: Dict[str, List[int]] = {}
+            for cid, r in result["results"].items():
+                if r["status"] == "NOT_APPLICABLE":
+                    continue
+                status[cid] = r["status"]
+                counts[r["status"]] = counts.get(r["status"], 0) + 1
+                d = domains.setdefault(r["domain"], [0, 0])
+                d[0] += 1
+                d[1] += r["status"] == "COMPLIANT"
+                self.applicable_entities[cid].add(entity)
+            ev = {cid: rec["status"] for cid, rec in evidence.items() if rec and "status" in rec}
+            self.states[entity] = _EntityState(dict(org_profile), ev, status, counts, domains)
+            for f in PROFILE_FIELDS:
+                self._profile_index.setdefault((f, profile_value(org_profile, f)), set()).add(entity)
+
+        self.status_totals: Dict[str, int] = {}
+        self.domain_totals: Dict[str, List[int]] = {}
+        for state in self.states.values():
+            for s, n in state.counts.items():
+                self.status_totals[s] = self.status_totals.get(s, 0) + n
+            for d, (a, c) in state.domains.items():
+                t = self.domain_totals.setdefault(d, [0, 0])
+                t[0] += a
+                t[1] += c
+        self.score_sum = sum(state.score for state in self.states.values())
+
+    def _targets(self, scenario: Scenario) -> Set[str]:
+        targets = set(self.states) if scenario.entities is None else set(scenario.entities) & set(self.states)
+        for f, value in scenario.where.items():
+            if f in PROFILE_FIELDS:
+                # Indexed by normalized value, so {"ai_usage": False} also matches profiles without the flag
+                key = (f, profile_value({f: value}, f))
+                targets &= self._profile_index.get(key, set())
+            else:
+                targets = {e for e in targets if self.states[e].profile.get(f) == value}
+        if not scenario.profile_changes:
+            # Status overrides only touch entities where the control applies
+            touched: Set[str] = set()
+            for cid in scenario.status_overrides:
+                touched |= self.applicable_entities[cid]
+            targets &= touched
+        return targets
+
+    def _validate(self, scenario: Scenario):
+        for cid, status in scenario.status_overrides.items():
+            if cid not in self.controls:
+                raise ValueError(f"Unknown control_id in scenario {scenario.name}: {cid}")
+            if status not in ALLOWED_STATUSES:
+                raise ValueError(f"Invalid status '{status}' for control {cid} in scenario {scenario.name}")
+
+    def simulate(self, scenario: Scenario) -> ScenarioResult:
+        self._validate(scenario)
+        recheck: Set[str] = set()
+        for f in scenario.profile_changes:
+            recheck |= self.field_dependents.get(f, set())
+        overrides = scenario.status_overrides
+
+        status_totals = dict(self.status_totals)
+        domain_totals = {d: list(v) for d, v in self.domain_totals.items()}
+        score_sum = self.score_sum
+        entity_scores: Dict[str, Tuple[float, float]] = {}
+        targets = self._targets(scenario)
+
+        for entity in sorted(targets):
+            state = self.states[entity]
+            profile = {**state.profile, **scenario.profile_changes} if scenario.profile_changes else state.profile
+            counts = dict(state.counts)
+            changed = False
+            for cid in recheck | set(overrides):
+                ctrl = self.controls[cid]
+                old = state.status.get(cid)
+                if cid in recheck:
+                    applicable = is_control_applicable(ctrl, profile)
+                else:
+                    applicable = old is not None
+                new = (overrides.get(cid) or state.evidence.get(cid, "NOT_TESTED")) if applicable else None
+                if new == old:
+                    continue
+                changed = True
+                d = domain_totals.setdefault(ctrl.domain, [0, 0])
+                if old is not None:
+                    counts[old] -= 1
+                    status_totals[old] -= 1
+                    d[0] -= 1
+                    d[1] -= old == "COMPLIANT"
+                if new is not None:
+                    counts[new] = counts.get(new, 0) + 1
+                    status_totals[new] = status_totals.get(new, 0) + 1
+                    d[0] += 1
+                    d[1] += new == "COMPLIANT"
+            if changed:
+                after = _score(counts)
+                score_sum += after - state.score
+                entity_scores[entity] = (state.score, after)
+
+        n = len(self.states)
+        before = self.score_sum / n if n else 0.0
+        after = score_sum / n if n else 0.0
+        domains = sorted(set(self.domain_totals) | set(domain_totals))
+        return ScenarioResult(
+            name=scenario.name,
+            entities_targeted=len(targets),
+            entities_changed=len(entity_scores),
+            mean_score_before=before,
+            mean_score_after=after,
+            mean_score_delta=after - before,
+            status_totals_before={s: c for s, c in sorted(self.status_totals.items())},
+            status_totals_after={s: c for s, c in sorted(status_totals.items()) if c},
+            domain_scores={
+                d: (
+                    _pooled(self.domain_totals.get(d)),
+                    _pooled(domain_totals.get(d)),
+                )
+                for d in domains
+            },
+            entity_scores=entity_scores,
+        )
+
+    def simulate_many(self, scenarios: Iterable[Scenario]) -> List[ScenarioResult]:
+        return [self.simulate(s) for s in scenarios]
+
+
+def _pooled(totals: Optional[List[int]]) -> float:
+    if not totals or not totals[0]:
+        return 0.0
+    return totals[1] / totals[0] * 100
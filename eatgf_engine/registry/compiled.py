@@ -0,0 +1,365 @@
+import mmap
+import struct
+import sys
+from array import array
+from collections.abc import Mapping
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .models import (
+    Registry,
+    Control,
+    LifecycleState,
+    AuthorityClass,
+    Applicability,
+    RelationshipSet,
+    Decomposition,
+)
+
+_MAGIC = b"EATR"
+_FORMAT_VERSION = 2
+_NONE = 0xFFFFFFFF
+
+# magic, format version, byte order ('<' or '>'), control count, string count, environment count, registry version string
+_HEADER = struct.Struct("<4sBc2xIIII")
+_SECTIONS = (
+    "string_offsets", "string_blob", "environments", "records", "environment_list_ptr", "environment_list_idx",
+    "implements_ptr", "implements_idx", "enforces_ptr", "enforces_idx", "requires_ptr", "requires_idx",
+)
+_SECTION_TABLE = struct.Struct("<%dI" % len(_SECTIONS))
+
+# One row of uint32 per control (string fields are string-table indexes)
+_FIELDS = (
+    "control_id", "domain", "primary_authority", "authority_class", "atomic_objective",
+    "lifecycle_state", "ai_usage", "clause", "justification", "environment_mask", "mandatory",
+)
+_F = {name: i for i, name in enumerate(_FIELDS)}
+_RELATIONS = ("implements", "enforces", "requires")
+_BYTEORDER = b"<" if sys.byteorder == "little" else b">"
+
+
+class CompiledRegistryError(ValueError):
+    pass
+
+
+def compile_registry(registry: Registry) -> bytes:
+    """
+    Flatten a validated registry into one buffer: a string table, a uint32
+    record per control (sorted by control_id), an environment table for
+    the applicability bitmasks, each control's environment list in its
+    original order (CSR, as string codes) and CSR adjacency for each
+    relationship.
+    """
+    strings: Dict[str, int] = {}
+
+    def intern(value: Optional[str]) -> int:
+        if value is None:
+            return _NONE
+        code = strings.get(value)
+        if code is None:
+            code = strings[value] = len(strings)
+        return code
+
+    version_code = intern(registry.version)
+    ids = sorted(registry.controls)
+    position = {cid: i for i, cid in enumerate(ids)}
+    for cid in ids:
+        intern(cid)  # control IDs first, in sorted order, for binary search
+
+    environments: List[str] = []
+    env_bit: Dict[str, int] = {}
+    records = array("I")
+    env_ptr, env_idx = array("I", [0]), array("I")
+    csr = {rel: (array("I", [0]), array("I")) for rel in _RELATIONS}
+    for cid in ids:
+        ctrl = registry.controls[cid]
+        mask = 0
+        for env in ctrl.applicability.environments:
+            if env not in env_bit:
+                if len(environments) == 32:
+                    raise CompiledRegistryError("More than 32 distinct environments")
+                env_bit[env] = len(environments)
+                environments.append(env)
+                intern(env)
+            mask |= 1 << env_bit[env]
+            env_idx.append(intern(env))
+        env_ptr.append(len(env_idx))
+        row = {
+            "control_id": intern(cid),
+            "domain": intern(ctrl.domain),
+            "primary_authority": intern(ctrl.primary_authority),
+            "authority_class": intern(getattr(ctrl.authority_class, "value", ctrl.authority_class)),
+            "atomic_objective": intern(ctrl.atomic_objective),
+            "lifecycle_state": intern(getattr(ctrl.lifecycle_state, "value", ctrl.lifecycle_state)),
+            "ai_usage": intern(ctrl.applicability.ai_usage),
+            "clause": intern(ctrl.decomposition.clause if ctrl.decomposition else None),
+            "justification": intern(ctrl.decomposition.justification if ctrl.decomposition else None),
+            "environment_mask": mask,
+            "mandatory": int(bool(ctrl.applicability.mandatory)),
+        }
+        records.extend(row[f] for f in _FIELDS)
+        for rel in _RELATIONS:
+            ptr, idx = csr[rel]
+            for target in getattr(ctrl.relationships, rel):
+                if target not in position:
+                    raise CompiledRegistryError(f"{cid} references unknown control {target}")
+                idx.append(position[target])
+            ptr.append(len(idx))
+
+    blob = bytearray()
+    offsets = array("I", [0])
+    for value in strings:  # dicts keep insertion order, which is code order
+        blob += value.encode("utf-8")
+        offsets.append(len(blob))
+    blob += b"\0" * (-len(blob) % 4)
+    env_codes = array("I", (strings[e] for e in environments))
+
+    sections = {
+        "string_offsets": offsets.tobytes(),
+        "string_blob": bytes(blob),
+        "environments": env_codes.tobytes(),
+        "records": records.tobytes(),
+        "environment_list_ptr": env_ptr.tobytes(),
+        "environment_list_idx": env_idx.tobytes(),
+    }
+    for rel in _RELATIONS:
+        sections[rel + "_ptr"] = csr[rel][0].tobytes()
+        sections[rel + "_idx"] = csr[rel][1].tobytes()
+
+    pos = _HEADER.size + _SECTION_TABLE.size
+    table = []
+    body = bytearray()
+    for name in _SECTIONS:
+        table.append(pos + len(body))
+        body += sections[name]
+    header = _HEADER.pack(_MAGIC, _FORMAT_VERSION, _BYTEORDER, len(ids), len(strings), len(environments), version_code)
+    return header + _SECTION_TABLE.pack(*table) + bytes(body)
+
+
+class ControlView:
+    """Read-only, Control-shaped view of one compiled record."""
+    __slots__ = ("_registry", "_pos")
+
+    def __init__(self, registry: "CompiledRegistry", pos: int):
+        self._registry = registry
+        self._pos = pos
+
+    def _field(self, name: str) -> int:
+        return self._registry._records[self._pos * len(_FIELDS) + _F[name]]
+
+    def _str(self, name: str) -> Optional[str]:
+        return self._registry.string(self._field(name))
+
+    @property
+    def control_id(self) -> str:
+        return self._str("control_id")
+
+    @property
+    def domain(self) -> str:
+        return self._str("domain")
+
+    @property
+    def primary_authority(self) -> str:
+        return self._str("primary_authority")
+
+    @property
+    def authority_class(self) -> AuthorityClass:
+        return AuthorityClass(self._str("authority_class"))
+
+    @property
+    def atomic_objective(self) -> str:
+        return self._str("atomic_objective")
+
+    @property
+    def lifecycle_state(self) -> LifecycleState:
+        return LifecycleState(self._str("lifecycle_state"))
+
+    @property
+    def environment_mask(self) -> int:
+        return self._field("environment_mask")
+
+    @property
+    def applicability(self) -> Applicability:
+        return Applicability(
+            environments=self._registry.environment_list(self._pos),
+            ai_usage=self._str("ai_usage"),
+            mandatory=bool(self._field("mandatory")),
+        )
+
+    @property
+    def relationships(self) -> RelationshipSet:
+        return RelationshipSet(**{rel: self._registry.related_ids(self._pos, rel) for rel in _RELATIONS})
+
+    @property
+    def decomposition(self) -> Optional[Decomposition]:
+        clause = self._str("clause")
+        if clause is None:
+            return None
+        return Decomposition(clause=clause, justification=self._str("justification"))
+
+    def to_control(self) -> Control:
+        return Control(
+            control_id=self.control_id,
+            domain=self.domain,
+            primary_authority=self.primary_authority,
+            authority_class=self.authority_class,
+            atomic_objective=self.atomic_objective,
+            lifecycle_state=self.lifecycle_state,
+            applicability=self.applicability,
+            relationships=self.relationships,
+            decomposition=self.decomposition,
+        )
+
+    def __repr__(self):
+        return f"ControlView({self.control_id!r})"
+
+
+class CompiledRegistry(Mapping):
+    """
+    A compiled registry over any buffer (bytes, mmap, shared memory).
+    Attaching only validates the header and slices typed memoryviews; no
+    per-control objects are built until a control is looked up. Behaves
+    as a read-only {control_id: ControlView} mapping, so it can stand in
+    for Registry.controls.
+    """
+
+    def __init__(self, buffer, _owner=None):
+        self._owner = _owner  # keeps an mmap / SharedMemory alive while views exist
+        self._view = view = memoryview(buffer).cast("B")
+        if len(view) < _HEADER.size + _SECTION_TABLE.size:
+            raise CompiledRegistryError("Truncated compiled registry")
+        magic, fmt, order, self._count, n_strings, n_envs, version_code = _HEADER.unpack_from(view)
+        if magic != _MAGIC or fmt != _FORMAT_VERSION:
+            raise CompiledRegistryError("Not a compiled EATGF registry (bad magic or format version)")
+        if order != _BYTEORDER:
+            raise CompiledRegistryError("Compiled registry was written with a different byte order")
+        offsets = dict(zip(_SECTIONS, _SECTION_TABLE.unpack_from(view, _HEADER.size)))
+
+        def u32(name: str, count: int) -> memoryview:
+            start = offsets[name]
+            return view[start:start + 4 * count].cast("I")
+
+        self._string_offsets = u32("string_offsets", n_strings + 1)
+        blob_start = offsets["string_blob"]
+        self._blob = view[blob_start:blob_start + self._string_offsets[n_strings]]
+        self._env_codes = u32("environments", n_envs)
+        self._records = u32("records", self._count * len(_FIELDS))
+        env_ptr = u32("environment_list_ptr", self._count + 1)
+        self._env_list = (env_ptr, u32("environment_list_idx", env_ptr[self._count]))
+        self._csr = {}
+        for rel in _RELATIONS:
+            ptr = u32(rel + "_ptr", self._count + 1)
+            self._csr[rel] = (ptr, u32(rel + "_idx", ptr[self._count]))
+        self._strings: Dict[int, str] = {}
+        self.version = self.string(version_code)
+
+    @classmethod
+    def from_file(cls, path: str) -> "CompiledRegistry":
+        with open(path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls(mapped, _owner=mapped)
+
+    @classmethod
+    def attach(cls, name: str) -> "CompiledRegistry":
+        """Attach to a registry placed in shared memory by share_registry()."""
+        from multiprocessing import shared_memory
+        shm = shared_memory.SharedMemory(name=name)
+        return cls(shm.buf, _owner=shm)
+
+    def string(self, code: int) -> Optional[str]:
+        if code == _NONE:
+            return None
+        value = self._strings.get(code)
+        if value is None:
+            value = self._strings[code] = str(
+                self._blob[self._string_offsets[code]:self._string_offsets[code + 1]], "utf-8"
+            )
+        return value
+
+    def position(self, control_id: str) -> int:
+        # Control IDs are string codes 1..n in sorted order (code 0 is the registry version)
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.string(mid + 1) < control_id:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < self._count and self.string(lo + 1) == control_id:
+            return lo
+        raise KeyError(control_id)
+
+    def environment_list(self, pos: int) -> List[str]:
+        """Environments of the control at pos, in the source registry's order."""
+        ptr, idx = self._env_list
+        return [self.string(idx[i]) for i in range(ptr[pos], ptr[pos + 1])]
+
+    def environments_of(self, mask: int) -> List[str]:
+        """Environments in a bitmask, in bit (first-seen) order."""
+        return [self.string(code) for bit, code in enumerate(self._env_codes) if mask >> bit & 1]
+
+    def environment_mask(self, environment: str) -> int:
+        for bit, code in enumerate(self._env_codes):
+            if self.string(code) == environment:
+                return 1 << bit
+        return 0
+
+    def related_ids(self, pos: int, relation: str) -> List[str]:
+        ptr, idx = self._csr[relation]
+        return [self.string(idx[i] + 1) for i in range(ptr[pos], ptr[pos + 1])]
+
+    def related_positions(self, pos: int, relation: str) -> memoryview:
+        ptr, idx = self._csr[relation]
+        return idx[ptr[pos]:ptr[pos + 1]]
+
+    def __getitem__(self, control_id: str) -> ControlView:
+        return ControlView(self, self.position(control_id))
+
+    def __iter__(self) -> Iterator[str]:
+        return (self.string(i + 1) for i in range(self._count))
+
+    def __len__(self) -> int:
+        return self._count
+
+    def items(self) -> List[Tuple[str, ControlView]]:
+        # Positional, avoiding a binary search per key
+        return [(self.string(i + 1), ControlView(self, i)) for i in range(self._count)]
+
+    def values(self) -> List[ControlView]:
+        return [ControlView(self, i) for i in range(self._count)]
+
+    def __contains__(self, control_id) -> bool:
+        try:
+            self.position(control_id)
+        except (KeyError, TypeError):
+            return False
+        return True
+
+    def release(self):
+        """Drop the memoryviews so the underlying mmap / shared memory can be closed."""
+        for ptr, idx in list(self._csr.values()) + [self._env_list]:
+            ptr.release()
+            idx.release()
+        for mv in (self._records, self._env_codes, self._string_offsets, self._blob, self._view):
+            mv.release()
+        self._csr = {}
+        self._strings = {}
+
+    def to_registry(self) -> Registry:
+        return Registry(version=self.version, controls={cid: view.to_control() for cid, view in self.items()})
+
+
+def write_compiled(registry: Registry, path: str):
+    with open(path, "wb") as f:
+        f.write(compile_registry(registry))
+
+
+def share_registry(registry: Registry, name: Optional[str] = None) -> Tuple["object", str]:
+    """
+    Place a compiled registry in shared memory. Returns (SharedMemory, name);
+    the creator is responsible for close() and unlink() when workers are done.
+    """
+    from multiprocessing import shared_memory
+    data = compile_registry(registry)
+    shm = shared_memory.SharedMemory(name=name, create=True, size=len(data))
+    shm.buf[:len(data)] = data
+    return shm, shm.name
@@ -0,0 +1,203 @@
+from typing import Dict, List, Optional, Set, Tuple
+
+from .models import Registry, Control
+from .validators import RegistryValidationError, run_all_validations
+
+_RELATIONS = ("implements", "enforces", "requires")
+
+
+def _targets(control: Control) -> Set[str]:
+    return {target for rel in _RELATIONS for target in getattr(control.relationships, rel)}
+
+
+def _clause_key(control: Control) -> Optional[Tuple[str, str]]:
+    return (control.decomposition.clause, control.domain) if control.decomposition else None
+
+
+class IncrementalRegistryValidator:
+    """
+    Applies add / update / remove edits to a validated registry, re-checking
+    only the invariants an edit can break: the decomposition count of the
+    touched clause/domain, relationship targets of the edited control (and,
+    on removal, its referrers), and requires-cycles through newly added
+    edges. Each edit is checked before it is applied, so a rejected edit
+    leaves the registry unchanged. Errors match run_all_validations.
+
+    Cycle detection keeps a topological order of the requires graph
+    (Pearce-Kelly): an edge that already agrees with the order costs
+    nothing, otherwise only controls ordered between its two ends are
+    searched and reordered.
+
+    On a partial registry (load_registry with filters), external_ids are
+    valid relationship targets and leaves of the requires graph, as in
+    run_all_validations on that registry: cycles and decomposition limits
+    are only checked within the loaded subset.
+    """
+
+    def __init__(self, registry: Registry, validated: bool = False):
+        if not validated:
+            run_all_validations(registry)
+        self.registry = registry
+        self._clause_counts: Dict[Tuple[str, str], int] = {
+            (clause, domain): count
+            for clause, per_domain in registry.clause_domain_counts().items()
+            for domain, count in per_domain.items()
+        }
+        # target -> controls referencing it through any relationship / through requires
+        self._referrers: Dict[str, Set[str]] = {}
+        self._required_by: Dict[str, Set[str]] = {}
+        for cid, ctrl in registry.controls.items():
+            for target in _targets(ctrl):
+                self._referrers.setdefault(target, set()).add(cid)
+            for target in ctrl.relationships.requires:
+                self._required_by.setdefault(target, set()).add(cid)
+        self._order = self._topological_order()
+        self._next_first = -1  # Position for the next added control, before all others
+
+    def _topological_order(self) -> Dict[str, int]:
+        """Position of every control such that a control comes before everything it requires."""
+        controls = self.registry.controls
+        postorder: List[str] = []
+        visited: Set[str] = set()
+        for root in controls:
+            if root in visited:
+                continue
+            visited.add(root)
+            stack = [(root, iter(controls[root].relationships.requires))]
+            while stack:
+                node, children = stack[-1]
+                child = next(children, None)
+                if child is None:
+                    stack.pop()
+                    postorder.append(node)
+                elif child not in visited and child in controls:
+                    visited.add(child)
+                    stack.append((child, iter(controls[child].relationships.requires)))
+        return {cid: i for i, cid in enumerate(reversed(postorder))}
+
+    def add(self, control: Control):
+        if control.control_id in self.registry.controls or control.control_id in self.registry.external_ids:
+            raise RegistryValidationError("Duplicate control_id detected.")
+        self._apply(control, None, self._check(control, None))
+
+    def update(self, control: Control):
+        old = self.registry.controls.get(control.control_id)
+        if old is None:
+            raise RegistryValidationError(f"Unknown control {control.control_id}")
+        self._apply(control, old, self._check(control, old))
+
+    def remove(self, control_id: str):
+        old = self.registry.controls.get(control_id)
+        if old is None:
+            raise RegistryValidationError(f"Unknown control {control_id}")
+        referrers = sorted(self._referrers.get(control_id, set()) - {control_id})
+        if referrers:
+            raise RegistryValidationError(f"{referrers[0]} references unknown control {control_id}")
+        self._apply(None, old, {})
+
+    def _check(self, control: Control, old: Optional[Control]) -> Dict[str, int]:
+        """Raise if the edit is invalid; otherwise return the topological order changes it needs."""
+        cid = control.control_id
+        if not control.primary_authority:
+            raise RegistryValidationError(f"{cid} missing primary_authority.")
+
+        key = _clause_key(control)
+        if key is not None:
+            count = self._clause_counts.get(key, 0) + (0 if old is not None and _clause_key(old) == key else 1)
+            if count > 2:
+                clause, domain = key
+                raise RegistryValidationError(
+                    f"Clause {clause} decomposed into {count} controls in domain {domain} (limit=2)."
+                )
+
+        controls = self.registry.controls
+        external = self.registry.external_ids
+        for target in control.relationships.requires + control.relationships.implements + control.relationships.enforces:
+            if target != cid and target not in controls and target not in external:
+                raise RegistryValidationError(f"{cid} references unknown control {target}")
+
+        if cid in control.relationships.requires:
+            raise RegistryValidationError(f"{cid} cannot require itself.")
+
+        old_requires = set(old.relationships.requires) if old is not None else set()
+        return self._reorder(control, [t for t in control.relationships.requires if t not in old_requires])
+
+    def _reorder(self, control: Control, new_edges: List[str]) -> Dict[str, int]:
+        cid = control.control_id
+        controls = self.registry.controls
+        changes: Dict[str, int] = {}
+        if cid not in self._order:
+            # A new control has no referrers yet, so it can go before everything
+            changes[cid] = self._next_first
+
+        def position(node: str) -> int:
+            return changes[node] if node in changes else self._order[node]
+
+        def requires(node: str) -> List[str]:
+            return control.relationships.requires if node == cid else controls[node].relationships.requires
+
+        for target in new_edges:
+            if target not in controls:
+                continue  # External control: a leaf, so the edge cannot close a cycle
+            upper, lower = position(cid), position(target)
+            if upper < lower:
+                continue  # Already consistent with the order
+            # Everything the new target reaches, within the affected range
+            parent: Dict[str, Optional[str]] = {target: None}
+            stack = [target]
+            while stack:
+                node = stack.pop()
+                for nxt in requires(node):
+                    if nxt == cid:
+                        path = [cid, node]
+                        while parent[path[-1]] is not None:
+                            path.append(parent[path[-1]])
+                        raise RegistryValidationError(f"Cycle detected: {' → '.join([cid] + path[:0:-1] + [cid])}")
+                    if nxt not in parent and nxt in controls and position(nxt) < upper:
+                        parent[nxt] = node
+                        stack.append(nxt)
+            # Everything that reaches the edited control, within the affected range
+            ancestors = {cid}
+            stack = [cid]
+            while stack:
+                node = stack.pop()
+                for prev in self._required_by.get(node, ()):
+                    if prev not in ancestors and prev in controls and position(prev) > lower:
+                        ancestors.add(prev)
+                        stack.append(prev)
+            # Ancestors take the lowest of the freed positions, descendants the rest
+            moved = sorted(ancestors, key=position) + sorted(parent, key=position)
+            for node, slot in zip(moved, sorted(position(node) for node in moved)):
+                changes[node] = slot
+        return changes
+
+    def _apply(self, control: Optional[Control], old: Optional[Control], order_changes: Dict[str, int]):
+        if old is not None:
+            key = _clause_key(old)
+            if key is not None:
+                self._clause_counts[key] -= 1
+                if not self._clause_counts[key]:
+                    del self._clause_counts[key]
+            for target in _targets(old):
+                referrers = self._referrers[target]
+                referrers.discard(old.control_id)
+                if not referrers:
+                    del self._referrers[target]
+            for target in old.relationships.requires:
+                self._required_by[target].discard(old.control_id)
+            if control is None:
+                del self.registry.controls[old.control_id]
+                del self._order[old.control_id]
+        if control is not None:
+            key = _clause_key(control)
+            if key is not None:
+                self._clause_counts[key] = self._clause_counts.get(key, 0) + 1
+            for target in _targets(control):
+                self._referrers.setdefault(target, set()).add(control.control_id)
+            for target in control.relationships.requires:
+                self._required_by.setdefault(target, set()).add(control.control_id)
+            self.registry.controls[control.control_id] = control
+        if control is not None and old is None:
+            self._next_first -= 1
+        self._order.update(order_changes)
+        self.registry.invalidate_indexes()
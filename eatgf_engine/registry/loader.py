@@ -1,9 +1,10 @@
 import json
-from typing import Dict
+from typing import Any, Dict, Iterable, Optional, Union
 
 from .models import (
     Registry,
     Control,
+    ControlStub,
     LifecycleState,
     AuthorityClass,
     Applicability,
@@ -12,48 +13,91 @@ from .models import (
 )
 from .validators import run_all_validations
 
-def load_registry(path: str) -> Registry:
-    with open(path, "r", encoding="utf-8") as f:
-        raw = json.load(f)
+def _build_control(c: Dict[str, Any]) -> Control:
+    applicability = Applicability(
+        environments=c["applicability"]["environments"],
+        ai_usage=c["applicability"]["ai_usage"],
+        mandatory=c["applicability"]["mandatory"],
+    )
 
-    controls: Dict[str, Control] = {}
+    relationships = RelationshipSet(
+        implements=c["relationships"].get("implements", []),
+        enforces=c["relationships"].get("enforces", []),
+        requires=c["relationships"].get("requires", []),
+    )
 
-    for c in raw["controls"]:
-        applicability = Applicability(
-            environments=c["applicability"]["environments"],
-            ai_usage=c["applicability"]["ai_usage"],
-            mandatory=c["applicability"]["mandatory"],
+    decomposition = None
+    if c.get("decomposition"):
+        decomposition = Decomposition(
+            clause=c["decomposition"]["clause"],
+            justification=c["decomposition"]["justification"],
         )
 
-        relationships = RelationshipSet(
-            implements=c["relationships"].get("implements", []),
-            enforces=c["relationships"].get("enforces", []),
-            requires=c["relationships"].get("requires", []),
-        )
+    return Control(
+        control_id=c["control_id"],
+        domain=c["domain"],
+        primary_authority=c["primary_authority"],
+        authority_class=AuthorityClass(c["authority_class"]),
+        atomic_objective=c["atomic_objective"],
+        lifecycle_state=LifecycleState(c["lifecycle_state"]),
+        applicability=applicability,
+        relationships=relationships,
+        decomposition=decomposition,
+    )
+
+def load_registry(path: str, domains: Optional[Iterable[str]] = None,
+                  lifecycle_states: Optional[Iterable[Union[LifecycleState, str]]] = None) -> Registry:
+    """
+    Load and validate a registry. With domains and/or lifecycle_states,
+    only matching controls are built: every other control is reduced to a
+    ControlStub as soon as the parser finishes it, and the stubs are
+    dropped once the subset has been validated against them.
+    """
+    if domains is None and lifecycle_states is None:
+        with open(path, "r", encoding="utf-8") as f:
+            raw = json.load(f)
+        controls: Dict[str, Control] = {}
+        for c in raw["controls"]:
+            control = _build_control(c)
+            controls[control.control_id] = control
+        registry = Registry(version=raw["version"], controls=controls)
+        run_all_validations(registry)
+        return registry
 
-        decomposition = None
-        if c.get("decomposition"):
-            decomposition = Decomposition(
-                clause=c["decomposition"]["clause"],
-                justification=c["decomposition"]["justification"],
-            )
-
-        control = Control(
-            control_id=c["control_id"],
-            domain=c["domain"],
-            primary_authority=c["primary_authority"],
-            authority_class=AuthorityClass(c["authority_class"]),
-            atomic_objective=c["atomic_objective"],
-            lifecycle_state=LifecycleState(c["lifecycle_state"]),
-            applicability=applicability,
-            relationships=relationships,
-            decomposition=decomposition,
+    domain_set = set(domains) if domains is not None else None
+    state_set = {LifecycleState(s).value for s in lifecycle_states} if lifecycle_states is not None else None
+
+    def stub_unless_selected(obj: Dict[str, Any]):
+        # Called for every JSON object, innermost first; control records are the ones with a control_id
+        if "control_id" not in obj:
+            return obj
+        if (domain_set is None or obj.get("domain") in domain_set) and (
+            state_set is None or obj.get("lifecycle_state") in state_set
+        ):
+            return obj
+        decomposition = obj.get("decomposition")
+        return ControlStub(
+            control_id=obj["control_id"],
+            domain=obj.get("domain"),
+            requires=tuple((obj.get("relationships") or {}).get("requires", ())),
+            clause=decomposition["clause"] if decomposition else None,
         )
 
-        controls[control.control_id] = control
+    with open(path, "r", encoding="utf-8") as f:
+        raw = json.load(f, object_hook=stub_unless_selected)
 
-    registry = Registry(version=raw["version"], controls=controls)
+    controls = {}
+    excluded: Dict[str, ControlStub] = {}
+    for c in raw["controls"]:
+        if isinstance(c, ControlStub):
+            excluded[c.control_id] = c
+        else:
+            control = _build_control(c)
+            controls[control.control_id] = control
+    registry = Registry(
+        version=raw["version"], controls=controls, external_ids=frozenset(excluded).difference(controls)
+    )
 
-    run_all_validations(registry)
+    run_all_validations(registry, excluded)
 
     return registry
@@ -1,6 +1,6 @@
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import List, Optional, Dict
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple
 
 class LifecycleState(str, Enum):
     DRAFT = "Draft"
@@ -46,7 +46,132 @@ class Control:
     relationships: RelationshipSet
     decomposition: Optional[Decomposition] = None
 
+@dataclass(frozen=True)
+class ControlStub:
+    """
+    What a partial load keeps of a control outside the requested subset:
+    enough to check the subset's relationship targets, requires-cycles
+    and decomposition limits against the whole registry.
+    """
+    control_id: str
+    domain: str
+    requires: Tuple[str, ...] = ()
+    clause: Optional[str] = None
+
+def _key(value: Any) -> Any:
+    # Enum members and their string values look up the same index entry
+    return value.value if isinstance(value, Enum) else value
+
+def _group(controls: Dict[str, Control], key: Callable[[Control], Any]) -> Dict[Any, Tuple[str, ...]]:
+    index: Dict[Any, List[str]] = {}
+    for cid in sorted(controls):
+        k = key(controls[cid])
+        if k is not None:
+            index.setdefault(k, []).append(cid)
+    return {k: tuple(v) for k, v in index.items()}
+
+def _reverse(controls: Dict[str, Control], relation: str) -> Dict[str, Tuple[str, ...]]:
+    index: Dict[str, List[str]] = {}
+    for cid in sorted(controls):
+        for target in getattr(controls[cid].relationships, relation):
+            index.setdefault(target, []).append(cid)
+    return {k: tuple(v) for k, v in index.items()}
+
+_INDEX_BUILDERS: Dict[str, Callable[[Dict[str, Control]], Dict[Any, Tuple[str, ...]]]] = {
+    "domain": lambda controls: _group(controls, lambda c: c.domain),
+    "authority_class": lambda controls: _group(controls, lambda c: _key(c.authority_class)),
+    "lifecycle_state": lambda controls: _group(controls, lambda c: _key(c.lifecycle_state)),
+    "clause": lambda controls: _group(controls, lambda c: c.decomposition.clause if c.decomposition else None),
+    "implemented_by": lambda controls: _reverse(controls, "implements"),
+    "enforced_by": lambda controls: _reverse(controls, "enforces"),
+    "required_by": lambda controls: _reverse(controls, "requires"),
+}
+
 @dataclass
 class Registry:
+    """
+    Controls keyed by control_id, with secondary indexes (domain,
+    authority class, lifecycle state, decomposition clause and reverse
+    relationships) built on first use. Call invalidate_indexes() after
+    mutating controls in place.
+
+    A registry loaded with domain / lifecycle filters holds only the
+    matching controls; external_ids are the IDs of the rest, which
+    relationships may still reference.
+    """
     version: str
     controls: Dict[str, Control]
+    external_ids: FrozenSet[str] = frozenset()
+    _indexes: Dict[str, Dict[Any, Tuple[str, ...]]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def invalidate_indexes(self):
+        self._indexes.clear()
+
+    def index(self, name: str) -> Dict[Any, Tuple[str, ...]]:
+        """Index name -> {key: sorted control_ids}."""
+        built = self._indexes.get(name)
+        if built is None:
+            built = self._indexes[name] = _INDEX_BUILDERS[name](self.controls)
+        return built
+
+    def ids_by(self, name: str, key: Any) -> Tuple[str, ...]:
+        return self.index(name).get(_key(key), ())
+
+    def _controls(self, ids: Tuple[str, ...]) -> List[Control]:
+        return [self.controls[cid] for cid in ids]
+
+    def by_domain(self, domain: str) -> List[Control]:
+        return self._controls(self.ids_by("domain", domain))
+
+    def by_authority_class(self, authority_class: AuthorityClass) -> List[Control]:
+        return self._controls(self.ids_by("authority_class", authority_class))
+
+    def by_lifecycle_state(self, state: LifecycleState) -> List[Control]:
+        return self._controls(self.ids_by("lifecycle_state", state))
+
+    def by_clause(self, clause: str) -> List[Control]:
+        return self._controls(self.ids_by("clause", clause))
+
+    def implemented_by(self, control_id: str) -> List[Control]:
+        """Controls whose relationships.implements lists control_id."""
+        return self._controls(self.ids_by("implemented_by", control_id))
+
+    def enforced_by(self, control_id: str) -> List[Control]:
+        return self._controls(self.ids_by("enforced_by", control_id))
+
+    def required_by(self, control_id: str) -> List[Control]:
+        return self._controls(self.ids_by("required_by", control_id))
+
+    def query(self, domain: Optional[str] = None, authority_class: Optional[AuthorityClass] = None,
+              lifecycle_state: Optional[LifecycleState] = None, clause: Optional[str] = None) -> List[Control]:
+        """Controls matching every given filter, ordered by control_id."""
+        filters = [
+            (name, value)
+            for name, value in (
+                ("domain", domain),
+                ("authority_class", authority_class),
+                ("lifecycle_state", lifecycle_state),
+                ("clause", clause),
+            )
+            if value is not None
+        ]
+        if not filters:
+            return self._controls(tuple(sorted(self.controls)))
+        # Start from the smallest candidate set
+        candidates = sorted((self.ids_by(name, value) for name, value in filters), key=len)
+        matched = set(candidates[0])
+        for ids in candidates[1:]:
+            matched.intersection_update(ids)
+        return self._controls(tuple(sorted(matched)))
+
+    def clause_domain_counts(self) -> Dict[str, Dict[str, int]]:
+        """{clause: {domain: number of controls decomposed from it}}."""
+        counts: Dict[str, Dict[str, int]] = {}
+        for clause, ids in self.index("clause").items():
+            per_domain = counts[clause] = {}
+            for cid in ids:
+                domain = self.controls[cid].domain
+                per_domain[domain] = per_domain.get(domain, 0) + 1
+        return counts
@@ -1,5 +1,5 @@
-from typing import Dict, Set
-from .models import Registry, Control
+from typing import Dict, Optional, Set
+from .models import Registry, Control, ControlStub
 
 class RegistryValidationError(Exception):
     pass
@@ -16,17 +16,12 @@ def validate_single_primary_authority(registry: Registry):
                 f"{control.control_id} missing primary_authority."
             )
 
-def validate_decomposition_limits(registry: Registry):
-    clause_map: Dict[str, Dict[str, int]] = {}
-
-    for control in registry.controls.values():
-        if control.decomposition:
-            clause = control.decomposition.clause
-            domain = control.domain
-
-            clause_map.setdefault(clause, {})
-            clause_map[clause].setdefault(domain, 0)
-            clause_map[clause][domain] += 1
+def validate_decomposition_limits(registry: Registry, excluded: Optional[Dict[str, ControlStub]] = None):
+    clause_map: Dict[str, Dict[str, int]] = registry.clause_domain_counts()
+    for stub in (excluded or {}).values():
+        if stub.clause is not None:
+            per_domain = clause_map.setdefault(stub.clause, {})
+            per_domain[stub.domain] = per_domain.get(stub.domain, 0) + 1
 
     for clause, domain_counts in clause_map.items():
         for domain, count in domain_counts.items():
@@ -36,7 +31,7 @@ def validate_decomposition_limits(registry: Registry):
                 )
 
 def validate_relationship_targets_exist(registry: Registry):
-    all_ids: Set[str] = set(registry.controls.keys())
+    all_ids: Set[str] = set(registry.controls.keys()) | registry.external_ids
 
     for control in registry.controls.values():
         for target in (
@@ -56,10 +51,12 @@ def validate_no_self_dependency(registry: Registry):
                 f"{control.control_id} cannot require itself."
             )
 
-def detect_requires_cycles(registry: Registry):
+def detect_requires_cycles(registry: Registry, excluded: Optional[Dict[str, ControlStub]] = None):
     """
     Detect cycles in the requires dependency graph (across all domains).
-    Fail-fast if any cycle is found.
+    Fail-fast if any cycle is found. For a partial registry, pass the
+    excluded controls' stubs: only cycles through loaded controls are
+    searched for, following requires edges through excluded ones.
     """
     from enum import Enum
 
@@ -69,6 +66,9 @@ def detect_requires_cycles(registry: Registry):
         VISITED = 2
 
     graph = {ctrl.control_id: ctrl.relationships.requires for ctrl in registry.controls.values()}
+    roots = list(graph)
+    for stub in (excluded or {}).values():
+        graph.setdefault(stub.control_id, stub.requires)
     state = {ctrl_id: VisitState.UNVISITED for ctrl_id in graph}
     path = []
 
@@ -76,6 +76,8 @@ def detect_requires_cycles(registry: Registry):
         state[node] = VisitState.VISITING
         path.append(node)
         for neighbor in graph[node]:
+            if neighbor not in state:
+                continue  # Dangling edge of an excluded control; not part of the subset
             if state[neighbor] == VisitState.UNVISITED:
                 if dfs(neighbor):
                     return True
@@ -90,14 +92,14 @@ def detect_requires_cycles(registry: Registry):
         path.pop()
         return False
 
-    for node in graph:
+    for node in roots:
         if state[node] == VisitState.UNVISITED:
             dfs(node)
 
-def run_all_validations(registry: Registry):
+def run_all_validations(registry: Registry, excluded: Optional[Dict[str, ControlStub]] = None):
     validate_unique_control_ids(registry)
     validate_single_primary_authority(registry)
-    validate_decomposition_limits(registry)
+    validate_decomposition_limits(registry, excluded)
     validate_relationship_targets_exist(registry)
     validate_no_self_dependency(registry)
-    detect_requires_cycles(registry)
+    detect_requires_cycles(registry, excluded)
@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# The validator is a top-level script, not part of the eatgf_engine package
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,91 @@
+import random
+
+import pytest
+
+from eatgf_engine.engine.applicability import (
+    ApplicabilityCache,
+    applicability_fields,
+    get_applicable_controls,
+)
+from eatgf_engine.engine.evaluator import evaluate_batch, evaluate_compliance
+from eatgf_engine.registry.models import (
+    Applicability,
+    AuthorityClass,
+    Control,
+    LifecycleState,
+    RelationshipSet,
+)
+
+ENVIRONMENTS = ("prod", "dev", "test", "staging")
+FLAG_VALUES = (True, False, 0, 1, None, "yes", "", [], [0])
+
+
+def _control(cid, environments, ai_usage="All"):
+    return Control(
+        control_id=cid,
+        domain=cid.split("-")[1],
+        primary_authority="ISO 27001",
+        authority_class=AuthorityClass.ISO27001,
+        atomic_objective=f"Objective of {cid}",
+        lifecycle_state=LifecycleState.APPROVED,
+        applicability=Applicability(environments=list(environments), ai_usage=ai_usage, mandatory=True),
+        relationships=RelationshipSet(),
+    )
+
+
+def _controls(rng, with_api=True):
+    ids = [f"EATGF-{d}-C-{i:02d}" for i, d in enumerate(["DSS", "EDM"] * 6)]
+    if with_api:
+        ids.append("EATGF-API-SEC-01")
+    return {
+        cid: _control(cid, rng.sample(ENVIRONMENTS, rng.randint(1, 3)), rng.choice(["All", "Conditional"]))
+        for cid in ids
+    }
+
+
+def _random_profile(rng):
+    profile = {}
+    if rng.random() < 0.9:
+        profile["environment"] = rng.choice(ENVIRONMENTS + ("unknown",))
+    for flag in ("ai_usage", "apis_exposed"):
+        if rng.random() < 0.7:
+            profile[flag] = rng.choice(FLAG_VALUES)
+    if rng.random() < 0.5:
+        profile["industry"] = rng.choice(["finance", "health"])  # Not read by applicability
+    return profile
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_cached_sets_match_uncached_applicability(seed):
+    rng = random.Random(seed)
+    controls = _controls(rng, with_api=seed % 2 == 0)
+    cache = ApplicabilityCache(controls)
+    for _ in range(500):
+        profile = _random_profile(rng)
+        assert cache.get(profile) == get_applicable_controls(controls, profile), profile
+    stats = cache.stats()
+    assert stats["hits"] + stats["misses"] == 500
+    # At most (4 environments, unknown or missing) x ai_usage x apis_exposed signatures
+    assert stats["signatures"] == stats["misses"] <= 6 * 2 * 2
+
+
+def test_fields_only_include_what_the_registry_reads():
+    rng = random.Random(0)
+    controls = {cid: _control(cid, ["prod"]) for cid in ("EATGF-DSS-C-01", "EATGF-EDM-C-02")}
+    assert applicability_fields(controls) == ("environment",)
+    controls["EATGF-DSS-AI-01"] = _control("EATGF-DSS-AI-01", ["prod"], ai_usage="Conditional")
+    assert applicability_fields(controls) == ("environment", "ai_usage")
+    controls.update(_controls(rng))
+    assert applicability_fields(controls) == ("environment", "ai_usage", "apis_exposed")
+
+
+def test_batch_evaluation_matches_single_evaluation():
+    rng = random.Random(3)
+    controls = _controls(rng)
+    entities = [
+        (f"entity-{n}", _random_profile(rng), {cid: {"status": "COMPLIANT"} for cid in controls if rng.random() < 0.5})
+        for n in range(50)
+    ]
+    batch = evaluate_batch(controls, entities)
+    for entity, profile, evidence in entities:
+        assert batch[entity] == evaluate_compliance(controls, profile, evidence)
@@ -0,0 +1,76 @@
+import json
+
+import pytest
+
+from eatgf_engine.engine.bulk_evidence import iter_evidence_chunks, load_bulk_evidence
+from eatgf_engine.engine.evidence_loader import EvidenceValidationError
+
+CONTROLS = {"C-1": None, "C-2": None, "C-3": None}
+
+
+def _write(tmp_path, name, text):
+    path = tmp_path / name
+    path.write_text(text, encoding="utf-8")
+    return str(path)
+
+
+def _jsonl(records):
+    return "".join(json.dumps(r) + "\n" for r in records)
+
+
+def test_csv_and_jsonl_exports_partition_the_same_way(tmp_path):
+    csv_path = _write(tmp_path, "evidence.csv", (
+        "entity,control_id,status,age_days,owner\n"
+        "acme,C-1,COMPLIANT,4,sec\n"
+        "acme,C-2,PARTIAL,,\n"
+        "\n"
+        "globex,C-1,NON_COMPLIANT,0.5,\n"
+    ))
+    jsonl_path = _write(tmp_path, "evidence.jsonl", _jsonl([
+        {"entity": "acme", "control_id": "C-1", "status": "COMPLIANT", "evidence_metrics": {"age_days": 4, "owner": "sec"}},
+        {"entity": "acme", "control_id": "C-2", "status": "PARTIAL"},
+        {"entity": "globex", "control_id": "C-1", "status": "NON_COMPLIANT", "evidence_metrics": {"age_days": 0.5}},
+    ]) + "\n")
+    sunk = []
+    expected = {
+        "acme": {
+            "C-1": {"status": "COMPLIANT", "evidence_metrics": {"age_days": 4, "owner": "sec"}},
+            "C-2": {"status": "PARTIAL", "evidence_metrics": None},
+        },
+        "globex": {"C-1": {"status": "NON_COMPLIANT", "evidence_metrics": {"age_days": 0.5}}},
+    }
+    assert load_bulk_evidence(csv_path, CONTROLS, chunk_size=2) == expected
+    assert load_bulk_evidence(jsonl_path, CONTROLS, chunk_size=1,
+                              metrics_sink=lambda *args: sunk.append(args)) == expected
+    assert [s[:2] for s in sunk] == [("acme", "C-1"), ("acme", "C-2"), ("globex", "C-1")]
+    assert [len(c) for c in iter_evidence_chunks(csv_path, chunk_size=2)] == [2, 1]
+
+
+@pytest.mark.parametrize("name, text, message", [
+    ("bad.csv", "entity,control_id,status\nacme,C-1,COMPLIANT\nacme,C-9,COMPLIANT\n",
+     r"bad\.csv:3: entity acme: Unknown control_id in evidence: C-9"),
+    ("bad.csv", "entity,control_id,status\nacme,C-1,COMPLIANT\nacme,C-1,PARTIAL\n",
+     r"bad\.csv:3: entity acme: Duplicate evidence entry for control_id: C-1"),
+    ("bad.csv", "entity,control_id,status\nacme,C-1,DONE\n",
+     r"bad\.csv:2: entity acme: Invalid status 'DONE' for control C-1"),
+    ("bad.csv", "entity,status\nacme,COMPLIANT\n", r"bad\.csv: missing column\(s\): control_id"),
+    ("bad.csv", "entity,control_id,status\nacme,C-1\n", r"bad\.csv:2: expected 3 columns, got 2"),
+    ("bad.csv", 'entity,control_id,status,evidence_metrics\nacme,C-1,COMPLIANT,"{oops"\n',
+     r"bad\.csv:2: entity acme: invalid evidence_metrics JSON"),
+    ("bad.jsonl", '{"entity": "acme", "control_id": "C-1", "status": "COMPLIANT"}\n{oops\n',
+     r"bad\.jsonl:2: invalid JSON"),
+    ("bad.jsonl", '["acme", "C-1"]\n', r"bad\.jsonl:1: expected an object with entity and control_id"),
+    ("bad.jsonl", '{"entity": "acme", "control_id": "C-1", "status": "COMPLIANT", "evidence_metrics": 3}\n',
+     r"bad\.jsonl:1: entity acme: evidence_metrics must be dict or null"),
+    ("bad.txt", "", r"Cannot infer bulk evidence format"),
+])
+def test_errors_name_the_file_line_and_entity(tmp_path, name, text, message):
+    with pytest.raises(EvidenceValidationError, match=message):
+        load_bulk_evidence(_write(tmp_path, name, text), CONTROLS)
+
+
+def test_same_control_for_different_entities_is_not_a_duplicate(tmp_path):
+    path = _write(tmp_path, "evidence.jsonl", _jsonl([
+        {"entity": e, "control_id": "C-1", "status": "COMPLIANT"} for e in ("a", "b", "c")
+    ]))
+    assert set(load_bulk_evidence(path, CONTROLS)) == {"a", "b", "c"}
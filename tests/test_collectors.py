@@ -0,0 +1,145 @@
+import asyncio
+import json
+
+import pytest
+
+from eatgf_engine.engine.collectors import EvidenceCollector, FileCollector, collect_evidence_sync
+from eatgf_engine.engine.evidence_loader import EvidenceValidationError
+
+CONTROLS = {"C-1", "C-2", "C-3", "C-4", "C-5", "C-6"}
+
+
+class FakeCollector(EvidenceCollector):
+    """In-process source: yields its fragments, sleeping `delay` seconds before each."""
+
+    def __init__(self, name, fragments, delay=0.0, error=None, timeout=None, tracker=None):
+        self.name = name
+        self.fragments = fragments
+        self.delay = delay
+        self.error = error
+        self.timeout = timeout
+        self.tracker = tracker
+        self.finished = False
+
+    async def collect(self):
+        if self.tracker is not None:
+            self.tracker.enter()
+        try:
+            for fragment in self.fragments:
+                await asyncio.sleep(self.delay)
+                yield fragment
+            if self.error is not None:
+                raise self.error
+            self.finished = True
+        finally:
+            if self.tracker is not None:
+                self.tracker.exit()
+
+
+class ConcurrencyTracker:
+    def __init__(self):
+        self.active = 0
+        self.peak = 0
+
+    def enter(self):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+
+    def exit(self):
+        self.active -= 1
+
+
+def test_collector_without_collect_cannot_be_instantiated():
+    class Incomplete(EvidenceCollector):
+        name = "incomplete"
+
+    with pytest.raises(TypeError):
+        Incomplete()
+
+
+def test_fragments_from_all_sources_are_merged(tmp_path):
+    path = tmp_path / "evidence.json"
+    path.write_text(json.dumps({"C-1": {"status": "COMPLIANT"}, "C-2": {"status": "PARTIAL"}}), encoding="utf-8")
+    sunk = []
+    result = collect_evidence_sync(
+        [
+            FileCollector(str(path), name="file"),
+            FakeCollector("fake", [{"C-3": {"status": "NON_COMPLIANT", "evidence_metrics": {"age_days": 4}}},
+                                   {"C-4": {"status": "NOT_TESTED"}}]),
+        ],
+        CONTROLS,
+        metrics_sink=lambda cid, metrics: sunk.append((cid, metrics)),
+    )
+    assert result.evidence == {
+        "C-1": {"status": "COMPLIANT", "evidence_metrics": None},
+        "C-2": {"status": "PARTIAL", "evidence_metrics": None},
+        "C-3": {"status": "NON_COMPLIANT", "evidence_metrics": {"age_days": 4}},
+        "C-4": {"status": "NOT_TESTED", "evidence_metrics": None},
+    }
+    assert result.sources == {"C-1": "file", "C-2": "file", "C-3": "fake", "C-4": "fake"}
+    assert result.failures == {}
+    assert set(result.durations_ms) == {"file", "fake"}
+    assert sorted(sunk) == [("C-1", None), ("C-2", None), ("C-3", {"age_days": 4}), ("C-4", None)]
+
+
+def test_concurrency_is_limited():
+    tracker = ConcurrencyTracker()
+    collectors = [
+        FakeCollector(f"fake-{n}", [{f"C-{n + 1}": {"status": "COMPLIANT"}}], delay=0.01, tracker=tracker)
+        for n in range(6)
+    ]
+    result = collect_evidence_sync(collectors, CONTROLS, concurrency=2)
+    assert tracker.peak == 2
+    assert len(result.evidence) == 6
+
+
+def test_timeout_keeps_fragments_already_delivered():
+    slow = FakeCollector("slow", [{"C-1": {"status": "COMPLIANT"}}, {"C-2": {"status": "COMPLIANT"}}],
+                         delay=0.05, timeout=0.08)
+    fast = FakeCollector("fast", [{"C-3": {"status": "PARTIAL"}}])
+    result = collect_evidence_sync([slow, fast], CONTROLS, timeout=5.0)
+    assert result.failures == {"slow": "timed out after 0.08s"}
+    assert set(result.evidence) == {"C-1", "C-3"}
+    assert not slow.finished and fast.finished
+
+
+def test_default_timeout_applies_to_collectors_without_their_own():
+    result = collect_evidence_sync([FakeCollector("slow", [{"C-1": {"status": "COMPLIANT"}}], delay=1.0)],
+                                   CONTROLS, timeout=0.02)
+    assert result.failures == {"slow": "timed out after 0.02s"}
+    assert result.evidence == {}
+
+
+def test_failing_collector_is_recorded_and_others_complete(tmp_path):
+    broken = FakeCollector("broken", [{"C-1": {"status": "COMPLIANT"}}], error=ConnectionError("refused"))
+    missing = FileCollector(str(tmp_path / "missing.json"), name="missing")
+    ok = FakeCollector("ok", [{"C-2": {"status": "COMPLIANT"}}])
+    result = collect_evidence_sync([broken, missing, ok], CONTROLS)
+    assert result.failures["broken"] == "ConnectionError: refused"
+    assert result.failures["missing"].startswith("FileNotFoundError")
+    assert set(result.evidence) == {"C-1", "C-2"}
+
+
+def test_invalid_fragment_cancels_remaining_collectors():
+    bad = FakeCollector("bad", [{"C-9": {"status": "COMPLIANT"}}])
+    slow = FakeCollector("slow", [{"C-1": {"status": "COMPLIANT"}}], delay=1.0)
+    with pytest.raises(EvidenceValidationError, match="bad: Unknown control_id in evidence: C-9"):
+        collect_evidence_sync([slow, bad], CONTROLS)
+    assert not slow.finished
+
+
+def test_invalid_status_is_rejected():
+    with pytest.raises(EvidenceValidationError, match="Invalid status 'DONE'"):
+        collect_evidence_sync([FakeCollector("fake", [{"C-1": {"status": "DONE"}}])], CONTROLS)
+
+
+def test_control_reported_by_two_sources_is_a_conflict():
+    first = FakeCollector("first", [{"C-1": {"status": "COMPLIANT"}}])
+    second = FakeCollector("second", [{"C-1": {"status": "NON_COMPLIANT"}}], delay=0.02)
+    with pytest.raises(EvidenceValidationError, match=r"second: .*C-1 \(already provided by first\)"):
+        collect_evidence_sync([first, second], CONTROLS)
+
+
+def test_collector_names_must_be_unique():
+    with pytest.raises(ValueError):
+        collect_evidence_sync([FakeCollector("same", []), FakeCollector("same", [])], CONTROLS)
@@ -0,0 +1,50 @@
+from eatgf_engine.registry.compiled import CompiledRegistry, compile_registry
+from eatgf_engine.registry.models import (
+    Applicability,
+    AuthorityClass,
+    Control,
+    Decomposition,
+    LifecycleState,
+    Registry,
+    RelationshipSet,
+)
+
+
+def _control(cid, environments, requires=(), decomposition=None):
+    return Control(
+        control_id=cid,
+        domain="DSS",
+        primary_authority=f"ISO 27001 {cid}",
+        authority_class=AuthorityClass.ISO27001,
+        atomic_objective=f"Objective of {cid}",
+        lifecycle_state=LifecycleState.ACTIVE,
+        applicability=Applicability(environments=list(environments), ai_usage="All", mandatory=True),
+        relationships=RelationshipSet(requires=list(requires)),
+        decomposition=decomposition,
+    )
+
+
+def _registry():
+    controls = [
+        _control("C-1", ["prod", "dev"]),
+        # Environments first seen in another order than the control lists them
+        _control("C-2", ["test", "dev", "prod"], requires=["C-1"]),
+        _control("C-3", [], decomposition=Decomposition(clause="8.28", justification="split")),
+        _control("C-4", ["dev"], requires=["C-2", "C-1"]),
+    ]
+    return Registry(version="1.1", controls={c.control_id: c for c in controls})
+
+
+def test_round_trip_reproduces_every_control():
+    registry = _registry()
+    compiled = CompiledRegistry(compile_registry(registry))
+    assert compiled.to_registry() == registry
+
+
+def test_environment_lists_keep_source_order():
+    registry = _registry()
+    compiled = CompiledRegistry(compile_registry(registry))
+    for cid, control in registry.controls.items():
+        assert compiled[cid].applicability.environments == control.applicability.environments
+    assert compiled["C-2"].environment_mask == compiled.environment_mask("test") | compiled.environment_mask(
+        "dev") | compiled.environment_mask("prod")
@@ -0,0 +1,112 @@
+import json
+from datetime import datetime, timezone
+
+import pytest
+
+from eatgf_engine.compliance.report_builder import ReportContext
+from eatgf_engine.engine.eval_cache import EvaluationCache, evaluate_files
+
+FIRST_RUN = datetime(2026, 1, 1, tzinfo=timezone.utc)
+SECOND_RUN = datetime(2026, 2, 1, tzinfo=timezone.utc)
+
+
+def _registry_json(version="1.1", environments=("prod",)):
+    controls = [
+        {
+            "control_id": cid,
+            "domain": cid.split("-")[1],
+            "primary_authority": "ISO 27001",
+            "authority_class": "ISO27001",
+            "atomic_objective": f"Objective of {cid}",
+            "lifecycle_state": "Approved",
+            "applicability": {"environments": list(environments), "ai_usage": "All", "mandatory": True},
+            "relationships": {"requires": [], "implements": []},
+            "decomposition": None,
+        }
+        for cid in ("EATGF-DSS-SEC-01", "EATGF-EDM-GOV-01")
+    ]
+    return {"version": version, "controls": controls}
+
+
+@pytest.fixture
+def inputs(tmp_path):
+    paths = {name: tmp_path / f"{name}.json" for name in ("registry", "profile", "evidence")}
+    paths["registry"].write_text(json.dumps(_registry_json()), encoding="utf-8")
+    paths["profile"].write_text(json.dumps({"environment": "prod", "ai_usage": False}), encoding="utf-8")
+    paths["evidence"].write_text(json.dumps({"EATGF-DSS-SEC-01": {"status": "COMPLIANT"}}), encoding="utf-8")
+    return paths
+
+
+def _evaluate(inputs, cache, when=FIRST_RUN, **kwargs):
+    context = ReportContext.frozen(when, **kwargs)
+    return evaluate_files(str(inputs["registry"]), str(inputs["profile"]), str(inputs["evidence"]), cache, context)
+
+
+def _summary(n):
+    return {"compliance_percent": float(n)}
+
+
+def test_lru_evicts_the_least_recently_used_entry(inputs):
+    cache = EvaluationCache(max_entries=2)
+    report = _evaluate(inputs, EvaluationCache())[0].report
+    cache.put("a", _summary(1), report)
+    cache.put("b", _summary(2), report)
+    assert cache.get("a").summary == _summary(1)  # "b" is now the oldest
+    cache.put("c", _summary(3), report)
+    assert cache.get("b") is None
+    assert [cache.get(k).summary for k in ("a", "c")] == [_summary(1), _summary(3)]
+    stats = cache.stats()
+    assert (stats["entries"], stats["evictions"], stats["memory_hits"], stats["misses"]) == (2, 1, 3, 1)
+
+
+def test_disk_tier_round_trip(inputs, tmp_path):
+    directory = str(tmp_path / "cache")
+    first, hit = _evaluate(inputs, EvaluationCache(directory=directory))
+    assert not hit
+
+    # A new process: empty memory tier, same directory
+    cache = EvaluationCache(max_entries=1, directory=directory)
+    second, hit = _evaluate(inputs, cache)
+    assert hit
+    assert second == first
+    assert cache.stats()["disk_hits"] == 1
+    _evaluate(inputs, cache)
+    assert cache.stats()["memory_hits"] == 1  # Disk hits are promoted into memory
+
+
+def test_hit_is_restamped_with_the_run_timestamp(inputs):
+    cache = EvaluationCache()
+    first, _ = _evaluate(inputs, cache, when=FIRST_RUN)
+    second, hit = _evaluate(inputs, cache, when=SECOND_RUN)
+    assert hit
+    assert first.report.evaluation_timestamp == FIRST_RUN.isoformat()
+    assert second.report.evaluation_timestamp == SECOND_RUN.isoformat()
+    assert second.summary == first.summary
+    assert second.report.controls == first.report.controls
+
+
+@pytest.mark.parametrize("change", ["registry", "profile", "evidence", "engine_version"])
+def test_key_changes_with_every_input(inputs, change):
+    cache = EvaluationCache()
+    _evaluate(inputs, cache)
+    kwargs = {}
+    if change == "registry":
+        inputs["registry"].write_text(json.dumps(_registry_json(environments=("prod", "dev"))), encoding="utf-8")
+    elif change == "profile":
+        inputs["profile"].write_text(json.dumps({"environment": "dev"}), encoding="utf-8")
+    elif change == "evidence":
+        inputs["evidence"].write_text(json.dumps({"EATGF-DSS-SEC-01": {"status": "PARTIAL"}}), encoding="utf-8")
+    else:
+        kwargs["engine_version"] = "2.0"
+    evaluation, hit = _evaluate(inputs, cache, **kwargs)
+    assert not hit
+    assert cache.stats()["entries"] == 2
+    if change == "engine_version":
+        assert evaluation.report.engine_version == "2.0"
+
+
+def test_profile_key_ignores_key_order_and_whitespace(inputs):
+    cache = EvaluationCache()
+    _evaluate(inputs, cache)
+    inputs["profile"].write_text('{ "ai_usage": false,\n  "environment": "prod" }', encoding="utf-8")
+    assert _evaluate(inputs, cache)[1]
@@ -0,0 +1,82 @@
+import json
+
+import pytest
+
+from eatgf_engine.registry.loader import load_registry
+from eatgf_engine.registry.models import LifecycleState
+from eatgf_engine.registry.validators import RegistryValidationError
+
+
+def _record(cid, state="Approved", requires=(), implements=(), clause=None):
+    return {
+        "control_id": cid,
+        "domain": cid.split("-")[0],
+        "primary_authority": "ISO 27001",
+        "authority_class": "ISO27001",
+        "atomic_objective": f"Objective of {cid}",
+        "lifecycle_state": state,
+        "applicability": {"environments": ["prod"], "ai_usage": "All", "mandatory": True},
+        "relationships": {"requires": list(requires), "implements": list(implements)},
+        "decomposition": {"clause": clause, "justification": "split"} if clause else None,
+    }
+
+
+def _write(tmp_path, records):
+    path = tmp_path / "registry.json"
+    path.write_text(json.dumps({"version": "1.1", "controls": records}), encoding="utf-8")
+    return str(path)
+
+
+VALID = [
+    _record("EDM-1", clause="8.28"),
+    _record("EDM-2", state="Draft", requires=["EDM-1"], clause="8.28"),
+    _record("DSS-1", requires=["EDM-2"], implements=["EDM-1"], clause="8.28"),
+    _record("DSS-2", state="Retired", requires=["DSS-1"]),
+    _record("APO-1", requires=["DSS-2", "EDM-1"]),
+]
+
+
+def test_filtered_load_keeps_the_subset_and_names_the_rest(tmp_path):
+    path = _write(tmp_path, VALID)
+    full = load_registry(path)
+
+    dss = load_registry(path, domains=["DSS"])
+    assert sorted(dss.controls) == ["DSS-1", "DSS-2"]
+    assert dss.external_ids == {"EDM-1", "EDM-2", "APO-1"}
+    assert all(dss.controls[cid] == full.controls[cid] for cid in dss.controls)
+
+    approved = load_registry(path, domains=["DSS", "EDM"], lifecycle_states=[LifecycleState.APPROVED])
+    assert sorted(approved.controls) == ["DSS-1", "EDM-1"]
+    assert load_registry(path, lifecycle_states=["Approved"]).controls.keys() == {"DSS-1", "EDM-1", "APO-1"}
+    assert load_registry(path, domains=["NONE"]).controls == {}
+
+
+@pytest.mark.parametrize("records, message", [
+    # Cycle through an excluded control
+    ([_record("DSS-1", requires=["EDM-1"]), _record("EDM-1", requires=["DSS-1"])], "Cycle detected"),
+    # Longer cycle leaving the subset twice
+    ([_record("DSS-1", requires=["EDM-1"]), _record("EDM-1", requires=["APO-1"]),
+      _record("APO-1", requires=["DSS-1"])], "Cycle detected"),
+    # Decomposition limit counts excluded controls of the same domain
+    ([_record("DSS-1", clause="5.1"), _record("DSS-2", state="Draft", clause="5.1"),
+      _record("DSS-3", state="Draft", clause="5.1")], "Clause 5.1 decomposed into 3 controls in domain DSS"),
+    # Targets must exist somewhere in the registry
+    ([_record("DSS-1", requires=["EDM-9"]), _record("EDM-1")], "DSS-1 references unknown control EDM-9"),
+])
+def test_subset_is_validated_against_excluded_stubs(tmp_path, records, message):
+    path = _write(tmp_path, records)
+    with pytest.raises(RegistryValidationError, match=message):
+        load_registry(path)
+    with pytest.raises(RegistryValidationError, match=message):
+        load_registry(path, domains=["DSS"], lifecycle_states=["Approved"])
+
+
+def test_problems_only_among_excluded_controls_do_not_fail_the_subset(tmp_path):
+    path = _write(tmp_path, [
+        _record("DSS-1"),
+        _record("EDM-1", requires=["EDM-9"]),  # Dangling, but outside the subset
+        _record("EDM-2", requires=["EDM-1"]),
+    ])
+    with pytest.raises(RegistryValidationError):
+        load_registry(path)
+    assert list(load_registry(path, domains=["DSS"]).controls) == ["DSS-1"]
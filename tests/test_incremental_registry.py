@@ -0,0 +1,172 @@
+import copy
+import json
+import random
+
+import pytest
+
+from eatgf_engine.registry.incremental import IncrementalRegistryValidator
+from eatgf_engine.registry.loader import load_registry
+from eatgf_engine.registry.models import (
+    Applicability,
+    AuthorityClass,
+    Control,
+    Decomposition,
+    LifecycleState,
+    Registry,
+    RelationshipSet,
+)
+from eatgf_engine.registry.validators import RegistryValidationError, run_all_validations
+
+DOMAINS = ("DSS", "EDM")
+CLAUSES = ("5.1", "8.28", "8.8")
+
+
+def _control(cid, domain="DSS", requires=(), implements=(), clause=None, authority="ISO 27001"):
+    return Control(
+        control_id=cid,
+        domain=domain,
+        primary_authority=authority,
+        authority_class=AuthorityClass.ISO27001,
+        atomic_objective=f"Objective of {cid}",
+        lifecycle_state=LifecycleState.APPROVED,
+        applicability=Applicability(environments=["prod"], ai_usage="All", mandatory=True),
+        relationships=RelationshipSet(requires=list(requires), implements=list(implements)),
+        decomposition=Decomposition(clause=clause, justification="split") if clause else None,
+    )
+
+
+def _random_control(rng, cid, known_ids):
+    targets = sorted(known_ids)
+    return _control(
+        cid,
+        domain=rng.choice(DOMAINS),
+        requires=rng.sample(targets, min(len(targets), rng.randint(0, 2))),
+        implements=rng.sample(targets, min(len(targets), rng.randint(0, 1))),
+        clause=rng.choice(CLAUSES + (None, None, None)),
+        authority=rng.choice(["ISO 27001"] * 9 + [""]),
+    )
+
+
+def _accepted_by_full_validation(registry):
+    try:
+        run_all_validations(registry)
+    except RegistryValidationError:
+        return False
+    return True
+
+
+def _edit(rng, registry, next_id):
+    """A random (operation, argument) edit: mostly valid, sometimes not."""
+    ids = sorted(registry.controls)
+    known = set(ids) | set(registry.external_ids) | {"C-UNKNOWN"}
+    op = rng.choice(["add", "update", "update", "remove"]) if ids else "add"
+    if op == "add":
+        return op, _random_control(rng, f"C-{next_id:03d}", known)
+    if op == "update":
+        return op, _random_control(rng, rng.choice(ids), known)
+    return op, rng.choice(ids)
+
+
+def _apply_expected(registry, op, arg):
+    expected = copy.deepcopy(registry)
+    if op == "remove":
+        del expected.controls[arg]
+    else:
+        expected.controls[arg.control_id] = arg
+    expected.invalidate_indexes()
+    return expected
+
+
+def _run_random_edits(registry, seed, steps=400):
+    rng = random.Random(seed)
+    run_all_validations(registry)
+    expected = copy.deepcopy(registry)
+    validator = IncrementalRegistryValidator(registry)
+    next_id = len(registry.controls) + 100
+    accepted = 0
+    for _ in range(steps):
+        op, arg = _edit(rng, expected, next_id)
+        next_id += 1
+        candidate = _apply_expected(expected, op, arg)
+        ok = _accepted_by_full_validation(candidate)
+        if ok:
+            getattr(validator, op)(arg)
+            expected = candidate
+            accepted += 1
+        else:
+            with pytest.raises(RegistryValidationError):
+                getattr(validator, op)(arg)
+        # Rejected edits leave the registry unchanged
+        assert validator.registry.controls == expected.controls
+    return accepted
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_random_edits_agree_with_full_validation(seed):
+    rng = random.Random(1000 + seed)
+    controls = {}
+    for i in range(25):
+        cid = f"C-{i:03d}"
+        control = _random_control(rng, cid, controls)
+        control.primary_authority = "ISO 27001"
+        control.decomposition = None
+        controls[cid] = control
+    accepted = _run_random_edits(Registry(version="1.1", controls=controls), seed)
+    assert accepted > 50  # The walk must exercise accepted edits, not only rejections
+
+
+def _write_registry(path, controls):
+    def to_json(c):
+        return {
+            "control_id": c.control_id,
+            "domain": c.domain,
+            "primary_authority": c.primary_authority,
+            "authority_class": c.authority_class.value,
+            "atomic_objective": c.atomic_objective,
+            "lifecycle_state": c.lifecycle_state.value,
+            "applicability": {"environments": c.applicability.environments, "ai_usage": "All", "mandatory": True},
+            "relationships": {"requires": c.relationships.requires, "implements": c.relationships.implements},
+            "decomposition": {"clause": c.decomposition.clause, "justification": "split"} if c.decomposition else None,
+        }
+    path.write_text(json.dumps({"version": "1.1", "controls": [to_json(c) for c in controls]}), encoding="utf-8")
+    return str(path)
+
+
+def _partial_registry(tmp_path):
+    path = _write_registry(tmp_path / "registry.json", [
+        _control("EDM-1", domain="EDM"),
+        _control("EDM-2", domain="EDM", requires=["EDM-1"]),
+        _control("DSS-1", domain="DSS", requires=["EDM-2"]),
+        _control("DSS-2", domain="DSS", requires=["DSS-1"]),
+    ])
+    return load_registry(path, domains=["DSS"])
+
+
+def test_partial_registry_accepts_external_targets(tmp_path):
+    registry = _partial_registry(tmp_path)
+    assert registry.external_ids == {"EDM-1", "EDM-2"}
+    validator = IncrementalRegistryValidator(registry)
+
+    validator.update(_control("DSS-2", requires=["DSS-1", "EDM-1"]))
+    validator.add(_control("DSS-3", requires=["EDM-2", "DSS-2"], implements=["EDM-1"]))
+    assert set(registry.controls) == {"DSS-1", "DSS-2", "DSS-3"}
+
+    with pytest.raises(RegistryValidationError, match="references unknown control EDM-9"):
+        validator.add(_control("DSS-4", requires=["EDM-9"]))
+    with pytest.raises(RegistryValidationError, match="Duplicate control_id"):
+        validator.add(_control("EDM-1"))
+    with pytest.raises(RegistryValidationError, match="Cycle detected"):
+        validator.update(_control("DSS-1", requires=["EDM-2", "DSS-3"]))
+    run_all_validations(registry)
+
+
+def test_random_edits_on_partial_registry_agree_with_full_validation(tmp_path):
+    rng = random.Random(7)
+    controls = []
+    for i in range(30):
+        domain = DOMAINS[i % 2]
+        earlier = [c.control_id for c in controls]
+        controls.append(_control(f"C-{i:03d}", domain=domain, requires=rng.sample(earlier, min(len(earlier), 2))))
+    registry = load_registry(_write_registry(tmp_path / "registry.json", controls), domains=["DSS"])
+    assert registry.external_ids
+    assert _run_random_edits(registry, seed=11) > 50
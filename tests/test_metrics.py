@@ -0,0 +1,12 @@
+from eatgf_engine.engine.metrics import MetricsTable
+
+
+def test_boolean_metric_values_are_skipped():
+    table = MetricsTable()
+    table.append("acme", "prod", "DSS", "EATGF-DSS-SEC-01",
+                 {"age_days": 4, "coverage": 0.5, "automated": True, "reviewed": False, "owner": "ops"})
+    assert len(table) == 2
+    assert table.skipped == 3
+    rollup = table.rollup(by=None)
+    assert sorted(rollup["metrics"]) == ["age_days", "coverage"]
+    assert rollup["skipped_values"] == 3
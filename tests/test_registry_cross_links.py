@@ -0,0 +1,98 @@
+import json
+
+import pytest
+
+import eatgf_dynamic_validator as validator
+
+CONTROLS = [
+    # (control_id, primary_authority, lifecycle_state)
+    ("EATGF-DSS-SEC-01", "ISO 27001 A.8.28", "Approved"),
+    ("EATGF-EDM-GOV-01", "NIST SP 800-53 AC-2", "Active"),
+    ("EATGF-EDM-OLD-01", "ISO 27001 A.5.1", "Retired"),
+    ("EATGF-APO-RSK-01", "COBIT APO12", "Approved"),
+    ("EATGF-APO-RET-01", "COBIT APO13", "Retired"),
+]
+
+DOCS = {
+    'A.md': 'Implements EATGF-DSS-SEC-01 and EATGF-DSS-SEC-010.\nStill follows EATGF-EDM-OLD-01.\n',
+    'B.md': '# Access\n\nMapped to NIST SP 800-53 AC-2 for account reviews.\n',
+    # Neither is a whole-token mention of a registry control or authority
+    'C.md': 'Sub-control EATGF-DSS-SEC-01.1 extends COBIT APO12.1.\n',
+}
+
+
+def _write_registry(path, controls=CONTROLS):
+    path.write_text(json.dumps({"version": "1.1", "controls": [
+        {
+            "control_id": cid,
+            "domain": cid.split("-")[1],
+            "primary_authority": authority,
+            "authority_class": "Other",
+            "atomic_objective": f"Objective of {cid}",
+            "lifecycle_state": state,
+            "applicability": {"environments": ["prod"], "ai_usage": "All", "mandatory": True},
+            "relationships": {"requires": [], "implements": []},
+            "decomposition": None,
+        }
+        for cid, authority, state in controls
+    ]}), encoding="utf-8")
+    return str(path)
+
+
+@pytest.fixture
+def corpus(tmp_path):
+    root = tmp_path / 'corpus'
+    root.mkdir()
+    for name, text in DOCS.items():
+        (root / name).write_text(text, encoding='utf-8')
+    return root
+
+
+def _issues(root, registry_path=None):
+    v = validator.EATGFValidator(str(root), rules=[validator.RegistryCrossLinkRule()], registry_path=registry_path)
+    v.load_documents()
+    v.validate_all()
+    return {i.title: i for i in v.issues}
+
+
+def test_documents_are_cross_linked_with_the_registry(corpus, tmp_path):
+    registry = _write_registry(tmp_path / 'registry.json')
+    issues = _issues(corpus, registry)
+    doc_a = str(corpus / 'A.md')
+
+    assert set(issues) == {
+        'Unknown control IDs referenced (1)',
+        'Retired controls still referenced (1)',
+        'Registry controls with no documentation (1)',
+    }
+    unknown = issues['Unknown control IDs referenced (1)']
+    assert unknown.description == 'Not in registry 1.1: EATGF-DSS-SEC-010'
+    assert unknown.locations == [(doc_a, 1)]
+    retired = issues['Retired controls still referenced (1)']
+    assert retired.description == 'Retired in the registry: EATGF-EDM-OLD-01'
+    assert retired.locations == [(doc_a, 2)]
+    # EATGF-EDM-GOV-01 is documented through its primary authority; retired controls need no documentation
+    undocumented = issues['Registry controls with no documentation (1)']
+    assert undocumented.description.endswith(': EATGF-APO-RSK-01')
+    assert undocumented.severity == 'LOW'
+
+
+def test_fully_documented_registry_has_no_issues(corpus, tmp_path):
+    registry = _write_registry(tmp_path / 'registry.json', [c for c in CONTROLS if c[0] != "EATGF-APO-RSK-01"])
+    (corpus / 'A.md').write_text('Implements EATGF-DSS-SEC-01.\n', encoding='utf-8')
+    assert _issues(corpus, registry) == {}
+
+
+def test_unloadable_registry_is_reported(corpus, tmp_path):
+    broken = tmp_path / 'broken.json'
+    broken.write_text('{"version": "1.1", "controls": [', encoding='utf-8')
+    issues = _issues(corpus, str(broken))
+    assert list(issues) == ['Control registry could not be loaded']
+    assert 'JSONDecodeError' in issues['Control registry could not be loaded'].description
+
+    missing = _issues(corpus, str(tmp_path / 'missing.json'))
+    assert 'FileNotFoundError' in missing['Control registry could not be loaded'].description
+
+
+def test_missing_default_registry_is_skipped(corpus):
+    assert _issues(corpus) == {}
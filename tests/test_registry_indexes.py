@@ -0,0 +1,110 @@
+import random
+
+from eatgf_engine.registry.models import (
+    Applicability,
+    AuthorityClass,
+    Control,
+    Decomposition,
+    LifecycleState,
+    Registry,
+    RelationshipSet,
+)
+
+DOMAINS = ("DSS", "EDM", "APO")
+CLAUSES = ("5.1", "8.28", None)
+
+
+def _control(cid, domain="DSS", authority_class=AuthorityClass.ISO27001, lifecycle_state=LifecycleState.APPROVED,
+             clause=None, implements=(), enforces=(), requires=()):
+    return Control(
+        control_id=cid,
+        domain=domain,
+        primary_authority="ISO 27001",
+        authority_class=authority_class,
+        atomic_objective=f"Objective of {cid}",
+        lifecycle_state=lifecycle_state,
+        applicability=Applicability(environments=["prod"], ai_usage="All", mandatory=True),
+        relationships=RelationshipSet(implements=list(implements), enforces=list(enforces), requires=list(requires)),
+        decomposition=Decomposition(clause=clause, justification="split") if clause else None,
+    )
+
+
+def _random_registry(rng, count=40):
+    ids = [f"C-{i:03d}" for i in range(count)]
+    controls = {
+        cid: _control(
+            cid,
+            domain=rng.choice(DOMAINS),
+            authority_class=rng.choice(list(AuthorityClass)),
+            lifecycle_state=rng.choice(list(LifecycleState)),
+            clause=rng.choice(CLAUSES),
+            implements=rng.sample(ids, rng.randint(0, 2)),
+            enforces=rng.sample(ids, rng.randint(0, 1)),
+            requires=rng.sample(ids, rng.randint(0, 2)),
+        )
+        for cid in ids
+    }
+    return Registry(version="1.1", controls=controls)
+
+
+def _scan(registry, predicate):
+    return [registry.controls[cid] for cid in sorted(registry.controls) if predicate(registry.controls[cid])]
+
+
+def _assert_indexes_match_scan(registry):
+    for domain in DOMAINS + ("NONE",):
+        assert registry.by_domain(domain) == _scan(registry, lambda c: c.domain == domain)
+    for ac in AuthorityClass:
+        assert registry.by_authority_class(ac) == _scan(registry, lambda c: c.authority_class == ac)
+    for state in LifecycleState:
+        assert registry.by_lifecycle_state(state) == _scan(registry, lambda c: c.lifecycle_state == state)
+    for clause in CLAUSES[:-1]:
+        expected = _scan(registry, lambda c: c.decomposition is not None and c.decomposition.clause == clause)
+        assert registry.by_clause(clause) == expected
+    for cid in registry.controls:
+        assert registry.implemented_by(cid) == _scan(registry, lambda c: cid in c.relationships.implements)
+        assert registry.enforced_by(cid) == _scan(registry, lambda c: cid in c.relationships.enforces)
+        assert registry.required_by(cid) == _scan(registry, lambda c: cid in c.relationships.requires)
+
+
+def test_indexed_lookups_match_a_linear_scan():
+    rng = random.Random(41)
+    registry = _random_registry(rng)
+    _assert_indexes_match_scan(registry)
+    for _ in range(50):
+        domain = rng.choice(DOMAINS + (None,))
+        state = rng.choice(list(LifecycleState) + [None])
+        clause = rng.choice(CLAUSES)
+        expected = _scan(registry, lambda c: (domain is None or c.domain == domain)
+                         and (state is None or c.lifecycle_state == state)
+                         and (clause is None or (c.decomposition is not None and c.decomposition.clause == clause)))
+        assert registry.query(domain=domain, lifecycle_state=state, clause=clause) == expected
+
+
+def test_enum_members_and_values_share_an_index_entry():
+    registry = _random_registry(random.Random(1))
+    assert registry.ids_by("lifecycle_state", LifecycleState.ACTIVE) == registry.ids_by("lifecycle_state", "Active")
+    assert registry.ids_by("authority_class", AuthorityClass.NIST) == registry.ids_by("authority_class", "NIST")
+
+
+def test_indexes_are_rebuilt_only_after_invalidation():
+    registry = Registry(version="1.1", controls={
+        "C-1": _control("C-1", domain="DSS", clause="8.28"),
+        "C-2": _control("C-2", domain="EDM", clause="8.28", requires=["C-1"]),
+    })
+    assert [c.control_id for c in registry.by_domain("DSS")] == ["C-1"]
+    assert [c.control_id for c in registry.required_by("C-1")] == ["C-2"]
+    assert registry.clause_domain_counts() == {"8.28": {"DSS": 1, "EDM": 1}}
+
+    registry.controls["C-3"] = _control("C-3", domain="DSS", clause="8.28", requires=["C-1"])
+    registry.controls["C-2"].domain = "DSS"
+    # Indexes built before the mutation are stale until invalidated
+    assert [c.control_id for c in registry.by_domain("DSS")] == ["C-1"]
+    assert [c.control_id for c in registry.required_by("C-1")] == ["C-2"]
+
+    registry.invalidate_indexes()
+    assert [c.control_id for c in registry.by_domain("DSS")] == ["C-1", "C-2", "C-3"]
+    assert registry.by_domain("EDM") == []
+    assert [c.control_id for c in registry.required_by("C-1")] == ["C-2", "C-3"]
+    assert registry.clause_domain_counts() == {"8.28": {"DSS": 3}}
+    _assert_indexes_match_scan(registry)
@@ -0,0 +1,72 @@
+import pytest
+
+from eatgf_engine.compliance.report_models import ComplianceReport, ControlResult, Summary
+from eatgf_engine.engine.remediation import (
+    RemediationError,
+    RemediationIndex,
+    RemediationItem,
+    statuses_from_report,
+)
+from eatgf_engine.registry.models import (
+    Applicability,
+    AuthorityClass,
+    Control,
+    LifecycleState,
+    Registry,
+    RelationshipSet,
+)
+
+
+def _control(cid, requires=()):
+    return Control(
+        control_id=cid,
+        domain="DSS" if cid != "D" else "EDM",
+        primary_authority="ISO 27001",
+        authority_class=AuthorityClass.ISO27001,
+        atomic_objective=f"Objective of {cid}",
+        lifecycle_state=LifecycleState.ACTIVE,
+        applicability=Applicability(environments=["prod"], ai_usage="All", mandatory=True),
+        relationships=RelationshipSet(requires=list(requires)),
+    )
+
+
+@pytest.fixture
+def index():
+    # A <- B <- C (B requires A, C requires B); D stands alone
+    controls = [_control("A"), _control("B", ["A"]), _control("C", ["B"]), _control("D")]
+    return RemediationIndex(Registry(version="1.1", controls={c.control_id: c for c in controls}))
+
+
+def test_chain_ranking_counts_applicable_blocked_dependents(index):
+    portfolio = [
+        {"A": "NON_COMPLIANT", "B": "PARTIAL", "C": "COMPLIANT", "D": "COMPLIANT"},
+        {"A": "NOT_TESTED", "B": "COMPLIANT", "C": "NOT_APPLICABLE", "D": "NON_COMPLIANT"},
+        {"A": "COMPLIANT", "B": "COMPLIANT", "C": "COMPLIANT", "D": "NON_COMPLIANT"},
+    ]
+    assert index.rank(portfolio) == [
+        # Entity 1 blocks B and C, entity 2 only B (C is not applicable there)
+        RemediationItem("A", "DSS", failing_entities=2, blocked_dependents=3, direct_dependents=1, transitive_dependents=2),
+        RemediationItem("B", "DSS", failing_entities=1, blocked_dependents=1, direct_dependents=1, transitive_dependents=1),
+        RemediationItem("D", "EDM", failing_entities=2, blocked_dependents=0, direct_dependents=0, transitive_dependents=0),
+    ]
+    assert [item.control_id for item in index.rank(portfolio, top=1)] == ["A"]
+
+
+def test_control_outside_the_registry_is_rejected(index):
+    with pytest.raises(RemediationError, match="EATGF-OLD-99 is not in registry 1.1"):
+        index.rank([{"A": "NON_COMPLIANT", "EATGF-OLD-99": "COMPLIANT"}])
+
+
+def test_report_from_another_registry_version_is_rejected(index):
+    report = ComplianceReport(
+        engine_version="1.1",
+        registry_version="1.0",
+        evaluation_timestamp="2026-01-01T00:00:00+00:00",
+        summary=Summary(applicable_controls=1, compliant=0, non_compliant=1, partial=0, not_tested=0,
+                        compliance_score_percent=0.0),
+        domain_breakdown={},
+        controls=[ControlResult(control_id="A", domain="DSS", status="NON_COMPLIANT", applicable=True)],
+    )
+    with pytest.raises(RemediationError, match="1.0 does not match registry version 1.1"):
+        statuses_from_report(report, index)
+    assert statuses_from_report(report) == {"A": "NON_COMPLIANT"}
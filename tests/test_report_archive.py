@@ -0,0 +1,82 @@
+import os
+from datetime import datetime, timezone
+
+import pytest
+
+from eatgf_engine.compliance import report_archive
+from eatgf_engine.compliance.report_archive import INDEX_FILE, ArchiveError, ReportArchive
+from eatgf_engine.compliance.report_builder import ReportContext, build_report
+from eatgf_engine.engine.evaluator import evaluate_compliance
+from eatgf_engine.registry.models import (
+    Applicability,
+    AuthorityClass,
+    Control,
+    LifecycleState,
+    RelationshipSet,
+)
+
+CONTROLS = {
+    cid: Control(
+        control_id=cid,
+        domain=cid.split("-")[1],
+        primary_authority="ISO 27001",
+        authority_class=AuthorityClass.ISO27001,
+        atomic_objective=f"Objective of {cid}",
+        lifecycle_state=LifecycleState.APPROVED,
+        applicability=Applicability(environments=["prod"], ai_usage="All", mandatory=True),
+        relationships=RelationshipSet(),
+    )
+    for cid in ("EATGF-DSS-SEC-01", "EATGF-EDM-GOV-01")
+}
+
+
+def _report(day, status="COMPLIANT"):
+    result = evaluate_compliance(CONTROLS, {"environment": "prod"}, {"EATGF-DSS-SEC-01": {"status": status}})
+    return build_report("1.1", None, result, context=ReportContext.frozen(datetime(2026, 1, day, tzinfo=timezone.utc)))
+
+
+@pytest.fixture(params=["default", "gzip"])
+def codec(request, monkeypatch):
+    # Exercise the gzip fallback even where zstandard is installed
+    if request.param == "gzip":
+        monkeypatch.setattr(report_archive, "zstandard", None)
+    return request.param
+
+
+def test_identical_bodies_are_stored_once(tmp_path, codec):
+    archive = ReportArchive(str(tmp_path))
+    first, new_first = archive.put(_report(1), "acme", run_id="r1")
+    again, new_again = archive.put(_report(2), "acme", run_id="r2")  # Only the timestamp differs
+    other, new_other = archive.put(_report(3, status="PARTIAL"), "globex", run_id="r3")
+
+    assert (new_first, new_again, new_other) == (True, False, True)
+    assert first == again != other
+    assert archive.stats()["runs"] == 3
+    assert archive.stats()["unique_bodies"] == 2
+
+
+def test_runs_round_trip_through_a_reopened_archive(tmp_path, codec):
+    archive = ReportArchive(str(tmp_path))
+    reports = {"r1": _report(1), "r2": _report(2), "r3": _report(3, status="NON_COMPLIANT")}
+    for run_id, report in reports.items():
+        archive.put(report, "acme", run_id=run_id)
+
+    reopened = ReportArchive(str(tmp_path))
+    for run_id, report in reports.items():
+        assert reopened.get("acme", run_id) == report
+    assert reopened.get("acme") == reports["r3"]  # Latest run
+    assert [r["run_id"] for r in reopened.runs("acme")] == ["r1", "r2", "r3"]
+    with pytest.raises(ArchiveError, match="No archived run for globex"):
+        reopened.get("globex")
+    with pytest.raises(ArchiveError, match="No report body"):
+        reopened.body("00" * 32)
+
+
+def test_torn_index_entry_is_ignored(tmp_path):
+    archive = ReportArchive(str(tmp_path))
+    archive.put(_report(1), "acme", run_id="r1")
+    with open(os.path.join(str(tmp_path), INDEX_FILE), "ab") as f:
+        f.write(b"\x01\x02\x03")
+    reopened = ReportArchive(str(tmp_path))
+    assert reopened.get("acme", "r1") == _report(1)
+    assert reopened.stats()["unique_bodies"] == 1
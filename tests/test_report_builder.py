@@ -0,0 +1,49 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from eatgf_engine.compliance.report_builder import ENGINE_VERSION, ReportContext, build_report
+from eatgf_engine.engine.evaluator import evaluate_compliance
+from eatgf_engine.registry.models import (
+    Applicability,
+    AuthorityClass,
+    Control,
+    LifecycleState,
+    RelationshipSet,
+)
+
+TIMESTAMP = datetime(2026, 3, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def _result():
+    control = Control(
+        control_id="EATGF-DSS-SEC-01",
+        domain="DSS",
+        primary_authority="ISO 27001",
+        authority_class=AuthorityClass.ISO27001,
+        atomic_objective="Objective",
+        lifecycle_state=LifecycleState.APPROVED,
+        applicability=Applicability(environments=["prod"], ai_usage="All", mandatory=True),
+        relationships=RelationshipSet(),
+    )
+    return evaluate_compliance({control.control_id: control}, {"environment": "prod"},
+                               {control.control_id: {"status": "COMPLIANT"}})
+
+
+def test_engine_version_comes_from_the_context():
+    context = ReportContext.frozen(TIMESTAMP, engine_version="2.0")
+    assert build_report("1.1", None, _result(), context=context).engine_version == "2.0"
+    assert build_report("1.1", "2.0", _result(), context=context).engine_version == "2.0"
+    report = build_report("1.1", None, _result(), context=context)
+    assert report.evaluation_timestamp == TIMESTAMP.isoformat()
+
+
+def test_engine_version_without_context():
+    assert build_report("1.1", None, _result()).engine_version == ENGINE_VERSION
+    assert build_report("1.1", "2.0", _result()).engine_version == "2.0"
+
+
+def test_conflicting_engine_version_is_rejected():
+    context = ReportContext.frozen(TIMESTAMP, engine_version="2.0")
+    with pytest.raises(ValueError, match="does not match"):
+        build_report("1.1", ENGINE_VERSION, _result(), context=context)
@@ -0,0 +1,77 @@
+import os
+from datetime import datetime, timezone
+
+import pytest
+
+from eatgf_engine.compliance.report_builder import FixedClock, ReportContext
+from eatgf_engine.compliance.report_pipeline import INDEX_FILE, write_reports
+from eatgf_engine.engine.evaluator import evaluate_compliance
+from eatgf_engine.registry.models import (
+    Applicability,
+    AuthorityClass,
+    Control,
+    LifecycleState,
+    RelationshipSet,
+)
+
+STATUSES = ("COMPLIANT", "NON_COMPLIANT", "PARTIAL", "NOT_TESTED")
+
+
+def _controls():
+    return {
+        cid: Control(
+            control_id=cid,
+            domain=domain,
+            primary_authority=f"ISO 27001 A.{i}",
+            authority_class=AuthorityClass.ISO27001,
+            atomic_objective=f"Objective {i}",
+            lifecycle_state=LifecycleState.APPROVED,
+            applicability=Applicability(environments=["prod"], ai_usage="All", mandatory=True),
+            relationships=RelationshipSet(),
+        )
+        for i, (cid, domain) in enumerate([
+            ("EATGF-DSS-SEC-01", "DSS"),
+            ("EATGF-DSS-ENC-01", "DSS"),
+            ("EATGF-EDM-GOV-01", "EDM"),
+            ("EATGF-EDM-RISK-01", "EDM"),
+        ])
+    }
+
+
+def _results(count=40):
+    controls = _controls()
+    ids = sorted(controls)
+    results = []
+    for n in range(count):
+        applicable = set(ids[: 1 + n % len(ids)])
+        evidence = {cid: {"status": STATUSES[(n + i) % len(STATUSES)]} for i, cid in enumerate(ids)}
+        # Names that need sanitizing still map to distinct files
+        results.append((f"Entity {n:03d}/unit", evaluate_compliance(controls, {}, evidence, applicable=applicable)))
+    return results
+
+
+def _context():
+    return ReportContext(run_id="run-1", clock=FixedClock(datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc)))
+
+
+def _read_dir(path):
+    return {name: (path / name).read_bytes() for name in sorted(os.listdir(path))}
+
+
+def test_output_is_identical_for_any_worker_count(tmp_path):
+    results = _results()
+    serial = write_reports(results, str(tmp_path / "serial"), "1.1", context=_context(), workers=1)
+    parallel = write_reports(results, str(tmp_path / "parallel"), "1.1", context=_context(), workers=4, chunksize=3)
+
+    assert serial == parallel
+    serial_files = _read_dir(tmp_path / "serial")
+    assert serial_files == _read_dir(tmp_path / "parallel")
+    assert INDEX_FILE in serial_files
+    assert len(serial_files) == len(results) + 1
+
+
+def test_colliding_report_file_names_are_rejected(tmp_path):
+    results = _results(2)
+    results.append(("Entity 000_unit", results[0][1]))
+    with pytest.raises(ValueError, match="Entity 000_unit"):
+        write_reports(results, str(tmp_path), "1.1", context=_context())
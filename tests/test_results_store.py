@@ -0,0 +1,67 @@
+import pytest
+
+from eatgf_engine.compliance.report_models import ComplianceReport, ControlResult, DomainSummary, Summary
+from eatgf_engine.compliance.results_store import ResultsStore
+
+
+def _report(timestamp, statuses, score=50.0):
+    controls = [ControlResult(cid, "DSS", status, status != "NOT_APPLICABLE") for cid, status in sorted(statuses.items())]
+    applicable = sum(c.applicable for c in controls)
+    return ComplianceReport(
+        engine_version="1.1",
+        registry_version="1.1",
+        evaluation_timestamp=timestamp,
+        summary=Summary(applicable_controls=applicable, compliant=0, non_compliant=0, partial=0, not_tested=0,
+                        compliance_score_percent=score),
+        domain_breakdown={"DSS": DomainSummary(applicable=applicable, score_percent=score)},
+        controls=controls,
+    )
+
+
+@pytest.fixture
+def store(tmp_path):
+    with ResultsStore(str(tmp_path / "results.db")) as store:
+        yield store
+
+
+def test_reports_are_queryable_by_control_status_and_domain(store):
+    count = store.add_reports([
+        ("acme", "r1", _report("2026-01-01T00:00:00+00:00", {"C-1": "NON_COMPLIANT", "C-2": "COMPLIANT"}, 50.0)),
+        ("acme", "r2", _report("2026-02-01T00:00:00+00:00", {"C-1": "COMPLIANT", "C-2": "COMPLIANT"}, 100.0)),
+        ("globex", "r1", _report("2026-01-15T00:00:00+00:00", {"C-1": "NON_COMPLIANT", "C-2": "PARTIAL"}, 0.0)),
+    ], batch_size=2)
+    assert count == 3
+    assert store.entities_with_status("C-1", "NON_COMPLIANT") == [
+        ("acme", "r1", "2026-01-01T00:00:00+00:00"),
+        ("globex", "r1", "2026-01-15T00:00:00+00:00"),
+    ]
+    assert store.status_counts("C-1") == {"COMPLIANT": 1, "NON_COMPLIANT": 2}
+    assert store.status_counts("C-1", latest=True) == {"COMPLIANT": 1, "NON_COMPLIANT": 1}
+    assert store.status_counts("C-1", since="2026-01-10", until="2026-02-01") == {"NON_COMPLIANT": 1}
+    assert store.domain_scores("DSS", latest=True) == [
+        ("acme", "r2", "2026-02-01T00:00:00+00:00", 2, 100.0),
+        ("globex", "r1", "2026-01-15T00:00:00+00:00", 2, 0.0),
+    ]
+    # Latest within a window, not overall
+    assert store.entities_with_status("C-1", "NON_COMPLIANT", until="2026-01-20", latest=True) == [
+        ("acme", "r1", "2026-01-01T00:00:00+00:00"),
+        ("globex", "r1", "2026-01-15T00:00:00+00:00"),
+    ]
+
+
+def test_readding_a_run_replaces_its_rows(store):
+    store.add_report(_report("2026-01-01T00:00:00+00:00", {"C-1": "NON_COMPLIANT"}, 0.0), "acme", "r1")
+    store.add_report(_report("2026-01-01T00:00:00+00:00", {"C-1": "COMPLIANT"}, 100.0), "acme", "r1")
+    assert store.runs() == [("acme", "r1", "2026-01-01T00:00:00+00:00", 100.0)]
+    assert store.status_counts("C-1") == {"COMPLIANT": 1}
+    assert store.domain_scores("DSS") == [("acme", "r1", "2026-01-01T00:00:00+00:00", 1, 100.0)]
+
+
+def test_latest_picks_one_run_when_timestamps_tie(store):
+    frozen = "2026-01-01T00:00:00+00:00"
+    store.add_report(_report(frozen, {"C-1": "NON_COMPLIANT"}), "acme", "r1")
+    store.add_report(_report(frozen, {"C-1": "COMPLIANT"}), "acme", "r2")
+    assert store.entities_with_status("C-1", "NON_COMPLIANT", latest=True) == []
+    assert store.entities_with_status("C-1", "COMPLIANT", latest=True) == [("acme", "r2", frozen)]
+    assert store.status_counts("C-1", latest=True) == {"COMPLIANT": 1}
+    assert len(store.domain_scores("DSS", latest=True)) == 1
@@ -0,0 +1,173 @@
+import random
+
+import pytest
+
+from eatgf_engine.engine.evaluator import evaluate_compliance
+from eatgf_engine.engine.simulation import Portfolio, Scenario
+from eatgf_engine.registry.models import (
+    Applicability,
+    AuthorityClass,
+    Control,
+    LifecycleState,
+    RelationshipSet,
+)
+
+STATUSES = ("COMPLIANT", "NON_COMPLIANT", "PARTIAL", "NOT_TESTED")
+ENVIRONMENTS = ("prod", "dev", "test")
+FLAG_VALUES = (True, False, 0, 1, None, "yes", "")
+
+
+def _control(cid, domain, environments, ai_usage="All"):
+    return Control(
+        control_id=cid,
+        domain=domain,
+        primary_authority="ISO 27001",
+        authority_class=AuthorityClass.ISO27001,
+        atomic_objective=f"Objective of {cid}",
+        lifecycle_state=LifecycleState.APPROVED,
+        applicability=Applicability(environments=list(environments), ai_usage=ai_usage, mandatory=True),
+        relationships=RelationshipSet(),
+    )
+
+
+def _controls(rng):
+    ids = ["EATGF-API-SEC-01"] + [f"EATGF-{d}-C-{i:02d}" for i, d in enumerate(["DSS", "EDM", "APO"] * 3)]
+    return {
+        cid: _control(
+            cid,
+            cid.split("-")[1],
+            rng.sample(ENVIRONMENTS, rng.randint(1, 3)),
+            ai_usage=rng.choice(["All", "All", "Conditional"]),
+        )
+        for cid in ids
+    }
+
+
+def _random_profile(rng):
+    profile = {}
+    if rng.random() < 0.9:
+        profile["environment"] = rng.choice(ENVIRONMENTS)
+    for flag in ("ai_usage", "apis_exposed"):
+        # Missing keys and non-bool values must behave like their truthiness
+        if rng.random() < 0.7:
+            profile[flag] = rng.choice(FLAG_VALUES)
+    if rng.random() < 0.5:
+        profile["region"] = rng.choice(["eu", "us"])
+    return profile
+
+
+def _random_scenario(rng, controls, entities, n):
+    where = {}
+    for f in rng.sample(["environment", "ai_usage", "apis_exposed", "region"], rng.randint(0, 2)):
+        where[f] = rng.choice(ENVIRONMENTS) if f == "environment" else (
+            rng.choice(["eu", "us"]) if f == "region" else rng.choice(FLAG_VALUES))
+    profile_changes = {}
+    if rng.random() < 0.5:
+        f = rng.choice(["environment", "ai_usage", "apis_exposed", "region"])
+        profile_changes[f] = rng.choice(ENVIRONMENTS) if f == "environment" else rng.choice(FLAG_VALUES)
+    overrides = {cid: rng.choice(STATUSES) for cid in rng.sample(sorted(controls), rng.randint(0, 3))}
+    names = rng.sample(sorted(entities), rng.randint(1, len(entities))) if rng.random() < 0.3 else None
+    return Scenario(
+        name=f"scenario-{n}",
+        status_overrides=overrides,
+        profile_changes=profile_changes,
+        where=where,
+        entities=set(names) if names is not None else None,
+    )
+
+
+def _matches(profile, where):
+    for f, value in where.items():
+        if f in ("ai_usage", "apis_exposed"):
+            if bool(profile.get(f)) != bool(value):
+                return False
+        elif profile.get(f) != value:
+            return False
+    return True
+
+
+def _summary(results):
+    totals, domains, scores = {}, {}, {}
+    for entity, result in results.items():
+        scores[entity] = result["compliance_percent"]
+        for r in result["results"].values():
+            if r["status"] == "NOT_APPLICABLE":
+                continue
+            totals[r["status"]] = totals.get(r["status"], 0) + 1
+            d = domains.setdefault(r["domain"], [0, 0])
+            d[0] += 1
+            d[1] += r["status"] == "COMPLIANT"
+    pooled = {d: (c / a * 100 if a else 0.0) for d, (a, c) in domains.items()}
+    return totals, pooled, scores
+
+
+def _brute_force(controls, entities, scenario):
+    """Re-evaluate every entity from scratch with the scenario applied."""
+    before, after = {}, {}
+    for entity, (profile, evidence) in entities.items():
+        before[entity] = evaluate_compliance(controls, profile, evidence)
+        if (scenario.entities is None or entity in scenario.entities) and _matches(profile, scenario.where):
+            profile = {**profile, **scenario.profile_changes}
+            evidence = {**evidence, **{cid: {"status": s} for cid, s in scenario.status_overrides.items()}}
+        after[entity] = evaluate_compliance(controls, profile, evidence)
+    return before, after
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_scenario_deltas_match_full_reevaluation(seed):
+    rng = random.Random(seed)
+    controls = _controls(rng)
+    entities = {
+        f"entity-{n:02d}": (
+            _random_profile(rng),
+            {cid: {"status": rng.choice(STATUSES)} for cid in controls if rng.random() < 0.8},
+        )
+        for n in range(30)
+    }
+    portfolio = Portfolio(controls, entities)
+
+    for n in range(60):
+        scenario = _random_scenario(rng, controls, entities, n)
+        result = portfolio.simulate(scenario)
+        before, after = _brute_force(controls, entities, scenario)
+        totals_before, domains_before, scores_before = _summary(before)
+        totals_after, domains_after, scores_after = _summary(after)
+
+        assert result.status_totals_before == dict(sorted(totals_before.items()))
+        assert result.status_totals_after == dict(sorted(totals_after.items()))
+        assert result.mean_score_before == pytest.approx(sum(scores_before.values()) / len(entities))
+        assert result.mean_score_after == pytest.approx(sum(scores_after.values()) / len(entities))
+        for domain, (b, a) in result.domain_scores.items():
+            assert b == pytest.approx(domains_before.get(domain, 0.0))
+            assert a == pytest.approx(domains_after.get(domain, 0.0))
+        changed = {
+            entity for entity in entities
+            if {c: r["status"] for c, r in before[entity]["results"].items()}
+            != {c: r["status"] for c, r in after[entity]["results"].items()}
+        }
+        assert set(result.entity_scores) == changed
+        for entity, (b, a) in result.entity_scores.items():
+            assert (b, a) == pytest.approx((scores_before[entity], scores_after[entity]))
+
+
+def test_flag_filters_match_missing_and_non_bool_profile_values():
+    controls = {
+        "EATGF-API-SEC-01": _control("EATGF-API-SEC-01", "DSS", ["prod"]),
+        "EATGF-DSS-AI-01": _control("EATGF-DSS-AI-01", "DSS", ["prod"], ai_usage="Conditional"),
+    }
+    entities = {
+        "missing": ({"environment": "prod"}, {}),
+        "false": ({"environment": "prod", "ai_usage": False, "apis_exposed": 0}, {}),
+        "true": ({"environment": "prod", "ai_usage": "yes", "apis_exposed": 1}, {}),
+    }
+    portfolio = Portfolio(controls, entities)
+
+    assert portfolio.field_dependents["apis_exposed"] == {"EATGF-API-SEC-01"}
+    assert portfolio.field_dependents["ai_usage"] == {"EATGF-DSS-AI-01"}
+    result = portfolio.simulate(Scenario(name="enable", profile_changes={"ai_usage": True},
+                                         where={"ai_usage": False}))
+    assert result.entities_targeted == 2
+    assert set(result.entity_scores) == {"missing", "false"}
+    result = portfolio.simulate(Scenario(name="apis", profile_changes={"apis_exposed": False},
+                                         where={"apis_exposed": True}))
+    assert set(result.entity_scores) == {"true"}
@@ -0,0 +1,91 @@
+import subprocess
+
+import pytest
+
+import eatgf_dynamic_validator as validator
+
+DOCS = {
+    'SUPPLY_CHAIN_PROFILE.md': '# Supply Chain\n\n## Control Mapping\n\nISO 27001: A.8.28\n\nCRITICAL: 4 hours\n',
+    'SBOM_PROFILE.md': '# SBOM\n\n## Authority Notice\n\nA.8.28 applies.\n',
+    'OPERATIONS.md': '# Operations\n\nCRITICAL: 8 hours\nHIGH: 2 days\n',
+    'notes/RUNBOOK.md': '# Runbook\n\nHIGH: 2 days\n',
+}
+
+
+def _git(root, *args):
+    subprocess.run(['git', '-c', 'user.name=test', '-c', 'user.email=test@example.com', *args],
+                   cwd=str(root), check=True, capture_output=True)
+
+
+@pytest.fixture
+def corpus(tmp_path):
+    root = tmp_path / 'corpus'
+    for name, text in DOCS.items():
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text, encoding='utf-8')
+    _git(root, 'init', '-q')
+    _git(root, 'add', '.')
+    _git(root, 'commit', '-q', '-m', 'corpus')
+    return root
+
+
+def _rules():
+    return [validator.SlaConsistencyRule(), validator.ControlMappingRule(), validator.TemplateComplianceRule()]
+
+
+def _run(root, **kwargs):
+    v = validator.EATGFValidator(str(root), rules=_rules(), **kwargs)
+    v.load_documents()
+    v.validate_all()
+    return v
+
+
+def _issues(v):
+    return sorted((i.title, i.description, sorted(map(tuple, i.locations))) for i in v.issues)
+
+
+def _is_template_issue(issue):
+    return issue[0].startswith('Missing required EATGF sections')
+
+
+def test_changed_since_reuses_facts_and_matches_a_full_run(corpus, tmp_path):
+    cache = str(tmp_path / 'facts.json')
+    full = _run(corpus)
+    assert {i.title for i in full.issues} >= {'Missing ISO 27001 A.8.28 mapping in supply chain profiles'}
+
+    # Nothing changed: corpus rules see every document, document rules none
+    first = _run(corpus, changed_since='HEAD', fact_cache=cache)
+    corpus_issues = [i for i in _issues(full) if not _is_template_issue(i)]
+    assert _issues(first) == corpus_issues
+    assert first.rule_stats['sla_consistency'].documents == len(DOCS)
+    assert first.rule_stats['eatgf_template_compliance'].documents == 0
+
+    second = _run(corpus, changed_since='HEAD', fact_cache=cache)
+    assert _issues(second) == corpus_issues
+    sla = second.rule_stats['sla_consistency']
+    assert (sla.documents, sla.cached_documents) == (0, len(DOCS))
+
+    # Fix the SBOM profile without committing: only it is read again
+    (corpus / 'SBOM_PROFILE.md').write_text('# SBOM\n\nISO 27001 A.8.28.1\n', encoding='utf-8')
+    third = _run(corpus, changed_since='HEAD', fact_cache=cache)
+    mapping = third.rule_stats['control_mapping_consistency']
+    assert (mapping.documents, mapping.cached_documents) == (1, 1)
+    assert third.rule_stats['eatgf_template_compliance'].documents == 1
+    refreshed = _run(corpus)
+    changed_doc = str(corpus / 'SBOM_PROFILE.md')
+    expected = [
+        i for i in _issues(refreshed)
+        if not _is_template_issue(i) or all(loc[0] == changed_doc for loc in i[2])
+    ]
+    assert _issues(third) == expected
+    assert 'Missing ISO 27001 A.8.28 mapping in supply chain profiles' not in {i.title for i in third.issues}
+
+
+def test_corrupt_fact_cache_is_rebuilt(corpus, tmp_path):
+    cache = tmp_path / 'facts.json'
+    cache.write_text('{"namespace": "x", "entries": "oops"}', encoding='utf-8')
+    expected = _issues(_run(corpus, changed_since='HEAD', fact_cache=str(tmp_path / 'fresh.json')))
+    v = _run(corpus, changed_since='HEAD', fact_cache=str(cache))
+    assert _issues(v) == expected
+    assert v.rule_stats['sla_consistency'].cached_documents == 0
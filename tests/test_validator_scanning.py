@@ -0,0 +1,147 @@
+import random
+import re
+import time
+
+import pytest
+
+import eatgf_dynamic_validator as validator
+
+# The lazy patterns the rules used before line_scoped_pairs / contains_in_order
+OLD_DECISION = re.compile(r'\*\*(?:Go/No-Go|Final Go/No-Go|GO DECISION|Decision Required).*?(\d{4}-\d{2}-\d{2})\*\*')
+OLD_SLA = {
+    level: re.compile(level + r'[:\s]+.*?(\d+)[_\s]?(hour|hrs|hours|day|days)')
+    for level in ('CRITICAL', 'HIGH', 'MEDIUM')
+}
+OLD_TIMELINE = re.compile(r'Phase 13.*?Week 1.*?Week 4.*?\n', re.DOTALL)
+OLD_HEADING = re.compile(r'^(#{1,6})\s+(.*?)\s*#*\s*$')
+
+TOKENS = [
+    '**Go/No-Go ', '**Final Go/No-Go', '**GO DECISION ', 'Decision Required', '2026-01-15**', '2026-02-01',
+    '**', 'CRITICAL: ', 'CRITICAL', 'HIGH ', 'MEDIUM:', '12', '7', '1234567', ' hours', 'hrs', 'day', 'days',
+    '_', ' ', '  ', '\n', '\n', 'x', 'Phase 13', 'Week 1', 'Week 4', 'Week ', '#', '## ', '[', ']', '(', ')',
+    '](', 'doc.md', '<a ', '<A ', 'name="top"', "id='x'", '>', '"',
+]
+
+
+def fuzz_texts(count=400, seed=45):
+    rng = random.Random(seed)
+    for _ in range(count):
+        yield ''.join(rng.choice(TOKENS) for _ in range(rng.randint(0, 60)))
+
+
+def doc(text):
+    return validator.Document('FUZZ.md', text)
+
+
+def test_go_no_go_pairs_match_the_lazy_pattern():
+    rule = validator.GoNoGoDatesRule()
+    for text in fuzz_texts():
+        d = doc(text)
+        old = [(m.group(1), d.line_of(m.start())) for m in OLD_DECISION.finditer(text)]
+        assert rule.scan(d) == (old or None), text
+
+
+def test_sla_findings_match_the_lazy_patterns():
+    rule = validator.SlaConsistencyRule()
+    for text in fuzz_texts():
+        d = doc(text)
+        old = [
+            (level, f"{m.group(1)} {m.group(2)}", d.line_of(m.start()))
+            for level, pattern in OLD_SLA.items()
+            for m in pattern.finditer(text)
+        ]
+        assert rule.scan(d) == (old or None), text
+
+
+def test_timeline_detection_matches_the_lazy_pattern():
+    markers = validator.TimelineDuplicationRule.timeline_markers
+    for text in fuzz_texts():
+        assert validator.contains_in_order(text, *markers) == bool(OLD_TIMELINE.search(text)), text
+
+
+def test_heading_text_matches_the_lazy_pattern():
+    for text in fuzz_texts():
+        old = [m.group(2) for m in (OLD_HEADING.match(line) for line in text.split('\n') if line.startswith('#')) if m]
+        assert [h.text for h in validator.MarkdownOutline(text).headings] == old, text
+
+
+def test_link_and_anchor_scans_match_finditer():
+    for text in fuzz_texts():
+        for line in text.split('\n'):
+            old = [m.span() for m in validator.LinkIndex.LINK_PATTERN.finditer(line)]
+            assert [m.span() for m in validator.LinkIndex._iter_link_matches(line)] == old, line
+        old_anchors = set(validator.MarkdownOutline._HTML_ANCHOR.findall(text))
+        assert validator.MarkdownOutline._html_anchors(text) == old_anchors, text
+
+
+# The baseline regex, and the cases where the term-based scan deliberately
+# differs: sub-clauses count, both phrases must sit on one line, clause and
+# phrases are case-insensitive, and "A.8.280" is not A.8.28
+OLD_CONTROL_MAPPING = re.compile(r'ISO 27001[:\s]+A\.8\.28|A\.8\.28.*?[Ss]upply [Cc]hain')
+CONTROL_MAPPING_CASES = [
+    # (text, baseline, new)
+    ('ISO 27001: A.8.28', True, True),
+    ('ISO 27001 A.8.28', True, True),
+    ('Maps to ISO 27001:\tA.8.28 (Supply chain)', True, True),
+    ('ISO 27001 A.8.28.1', True, True),
+    ('A.8.28.1 supply chain', True, True),
+    ('A.8.28: Supply chain management', True, True),
+    ('See A.8.28 and A.8.29 for the supply chain', True, True),
+    ('ISO 27001 - A.8.28', False, False),
+    ('ISO 27001, A.8.28', False, False),
+    ('ISO 27001 A.8.27', False, False),
+    ('A.8.28: Supply\nchain', False, False),
+    ('A.8.28\nsupply chain', False, False),
+    ('supply chain: A.8.28', False, False),
+    ('A.8.28 supply-chain', False, False),
+    ('A.8.28 without the phrase', False, False),
+    ('ISO 27001\nA.8.28', True, False),
+    ('iso 27001 a.8.28', False, True),
+    ('a.8.28 SUPPLY CHAIN', False, True),
+    ('A.8.280 supply chain', True, False),
+]
+
+
+@pytest.mark.parametrize('text, baseline, expected', CONTROL_MAPPING_CASES)
+def test_control_mapping_cases(text, baseline, expected):
+    assert bool(OLD_CONTROL_MAPPING.search(text)) == baseline
+    assert validator.ControlMappingRule().scan(doc(text)) == expected
+
+
+# Inputs that made the lazy patterns backtrack: many match starts on one
+# long line with no terminator, long digit runs and padded lines.
+ADVERSARIAL_INPUTS = {
+    'decision markers, no date': lambda n: '**Go/No-Go ' * (n // 11),
+    'severity labels, no duration': lambda n: 'CRITICAL: HIGH: MEDIUM: x ' * (n // 26),
+    'long digit run after label': lambda n: 'CRITICAL: ' + '1' * n,
+    'timeline markers, no Week 4': lambda n: 'Phase 13 Week 1 ' * (n // 16) + '\n',
+    'A.8.28, no supply chain': lambda n: 'A.8.28 ' * (n // 7),
+    'padded heading': lambda n: '# a' + ' ' * n + 'b',
+    'unclosed links': lambda n: '[' * n + '](x',
+    'unclosed anchor tags': lambda n: '<a ' * (n // 3),
+}
+SIZES = (20_000, 160_000)
+
+
+def _best_scan_time(rule, text, repeat=3):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        rule.scan(validator.Document('BENCHMARK.md', text))  # Fresh document: outline parsing is included
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+@pytest.mark.parametrize('input_name', sorted(ADVERSARIAL_INPUTS))
+def test_rule_scans_stay_linear_on_adversarial_input(input_name):
+    generate = ADVERSARIAL_INPUTS[input_name]
+    small, large = (generate(n) for n in SIZES)
+    # A linear scan grows 8x over SIZES, a quadratic one 64x
+    growth_limit = 2 * SIZES[1] / SIZES[0]
+    for cls in validator.RULE_REGISTRY:
+        rule = cls()
+        timings = [_best_scan_time(rule, small), _best_scan_time(rule, large)]
+        growth = timings[1] / max(timings[0], 1e-6)
+        # Growth of timings this small is measurement noise
+        assert growth <= growth_limit or timings[1] < 0.05, (rule.name, timings)